@@ -0,0 +1,285 @@
+"""
+Local stand-ins for every outbound API, with call counting.
+
+FakeHTTP replaces requests.Session.request and serves the OddsShark ticker,
+ESPN scoreboards and the GitHub contents/trees/blobs API from in-memory
+fixtures (ETags and 304s included). FakeSheetsClient mimics the parts of
+gspread the scripts use and counts calls, cells and payload bytes.
+"""
+import base64
+import hashlib
+import io
+import json
+import re
+import time
+from collections import Counter
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import gspread
+import requests
+
+from nflpicks.sheets import column_letter
+
+
+def _response(url, status, body=b'', headers=None):
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.encoding = 'utf-8'
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeHTTP:
+    def __init__(self, ticker=None, scoreboards=None, repo_files=None, github_limit=5000):
+        self.ticker = ticker or {'matchups': []}
+        self.scoreboards = scoreboards or {}  # {(seasontype, week): payload}
+        self.repo_files = repo_files or {}  # {path: json}
+        self.calls = Counter()
+        self.bytes = Counter()
+        # GitHub's hourly quota; 304s don't count against it
+        self.github_limit = self.github_remaining = github_limit
+    
+    def reset(self):
+        self.calls.clear()
+        self.bytes.clear()
+    
+    def request(self, session, method, url, params=None, headers=None, **kwargs):
+        """Drop-in for requests.Session.request"""
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+        parsed = urlparse(url)
+        headers = headers or {}
+        
+        if parsed.netloc == 'io.oddsshark.com':
+            endpoint, response = 'oddsshark ticker', self._json(url, self.ticker, headers)
+        elif parsed.netloc == 'site.api.espn.com':
+            query = parse_qs(parsed.query)
+            key = (int(query.get('seasontype', ['2'])[0]), int(query.get('week', ['0'])[0]))
+            endpoint = 'espn scoreboard'
+            response = self._json(url, self.scoreboards.get(key, {'events': []}), headers)
+        elif parsed.netloc == 'api.github.com':
+            endpoint, response = self._github(url, parsed.path, headers)
+            if response.status_code != 304:
+                self.github_remaining = max(self.github_remaining - 1, 0)
+            response.headers.update({
+                'X-RateLimit-Limit': str(self.github_limit),
+                'X-RateLimit-Remaining': str(self.github_remaining),
+                'X-RateLimit-Reset': str(int(time.time()) + 3600)
+            })
+        else:
+            endpoint, response = 'unknown', _response(url, 404, b'{}')
+        
+        self.calls[endpoint] += 1
+        self.bytes[endpoint] += len(response.content)
+        return response
+    
+    def _json(self, url, payload, headers):
+        body = json.dumps(payload).encode('utf-8')
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if headers.get('If-None-Match') == etag:
+            return _response(url, 304, b'', {'ETag': etag})
+        return _response(url, 200, body, {'ETag': etag, 'Content-Type': 'application/json'})
+    
+    def _blob(self, path):
+        content = json.dumps(self.repo_files[path], indent=2).encode('utf-8')
+        sha = hashlib.sha1(b'blob %d\0' % len(content) + content).hexdigest()
+        return sha, base64.b64encode(content).decode('ascii')
+    
+    def _github(self, url, path, headers):
+        contents = re.match(r'^/repos/[^/]+/[^/]+/contents/(.+)$', path)
+        if contents:
+            file_path = contents.group(1)
+            if file_path not in self.repo_files:
+                return 'github contents', _response(url, 404, b'{"message": "Not Found"}')
+            sha, content = self._blob(file_path)
+            return 'github contents', self._json(url, {'path': file_path, 'sha': sha, 'content': content}, headers)
+        
+        if re.match(r'^/repos/[^/]+/[^/]+/commits$', path):
+            # No commits since the first kickoff, so no late picks to look for
+            return 'github commits', self._json(url, [], headers)
+        
+        if re.match(r'^/repos/[^/]+/[^/]+/git/trees/', path):
+            tree = [{'path': p, 'type': 'blob', 'sha': self._blob(p)[0]} for p in self.repo_files]
+            return 'github trees', self._json(url, {'tree': tree}, headers)
+        
+        blob = re.match(r'^/repos/[^/]+/[^/]+/git/blobs/(\w+)$', path)
+        if blob:
+            for file_path in self.repo_files:
+                sha, content = self._blob(file_path)
+                if sha == blob.group(1):
+                    return 'github blobs', self._json(url, {'sha': sha, 'content': content}, headers)
+        return 'github other', _response(url, 404, b'{"message": "Not Found"}')
+
+
+def _column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter.upper()) - ord('A') + 1)
+    return index - 1
+
+
+def _parse_a1(a1):
+    """
+    'B7' / 'A2:E' / 'A5:N20' / '12:27' -> (row0, col0, row1, col1),
+    rows None when open-ended, col1 None for whole rows
+    """
+    cells = []
+    for part in a1.split('!')[-1].split(':'):
+        match = re.match(r'^([A-Za-z]*)(\d*)$', part)
+        cells.append((_column_index(match.group(1)) if match.group(1) else None,
+                      int(match.group(2)) if match.group(2) else None))
+    (col0, row0), (col1, row1) = cells[0], cells[-1]
+    return row0, col0 or 0, row1, col1
+
+
+class FakeValueRange(list):
+    """Like gspread 6's ValueRange: the list subclass Worksheet.get() returns"""
+
+
+class FakeWorksheet:
+    def __init__(self, title, rows=None, sheet_id=0):
+        self.title = title
+        self.id = sheet_id
+        self.rows = [list(map(str, row)) for row in (rows or [])]
+        self.calls = Counter()
+        self.cells_written = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+    
+    def reset(self):
+        self.calls.clear()
+        self.cells_written = self.bytes_read = self.bytes_written = 0
+    
+    def _read(self, values):
+        self.bytes_read += len(json.dumps(values))
+        return values
+    
+    def get_all_values(self):
+        self.calls['get_all_values'] += 1
+        return self._read([list(row) for row in self.rows])
+    
+    def _values(self, a1):
+        row0, col0, row1, col1 = _parse_a1(a1)
+        first = (row0 or 1) - 1
+        last = (row1 or len(self.rows))
+        values = [row[col0:None if col1 is None else col1 + 1] for row in self.rows[first:last]]
+        # Sheets trims trailing empty cells and rows
+        values = [list(row) for row in values]
+        for row in values:
+            while row and row[-1] == '':
+                row.pop()
+        while values and not values[-1]:
+            values.pop()
+        return self._read(FakeValueRange(values))
+    
+    def get(self, a1):
+        self.calls['get'] += 1
+        return self._values(a1)
+    
+    def batch_get(self, ranges):
+        self.calls['batch_get'] += 1
+        return [self._values(a1) for a1 in ranges]
+    
+    def _set(self, row, col, value):
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        while len(cells) <= col:
+            cells.append('')
+        cells[col] = str(value)
+        self.cells_written += 1
+    
+    def update_cell(self, row, col, value):
+        self.calls['update_cell'] += 1
+        self.bytes_written += len(json.dumps(value))
+        self._set(row, col - 1, value)
+    
+    def batch_update(self, data, **kwargs):
+        self.calls['batch_update'] += 1
+        self.bytes_written += len(json.dumps(data))
+        for entry in data:
+            row0, col0, _, _ = _parse_a1(entry['range'])
+            for r, values in enumerate(entry['values']):
+                for c, value in enumerate(values):
+                    self._set(row0 + r, col0 + c, value)
+    
+    def update(self, *args, **kwargs):
+        self.calls['update'] += 1
+        values = kwargs.get('values')
+        a1 = kwargs.get('range_name')
+        for arg in args:
+            if isinstance(arg, str):
+                a1 = arg
+            elif isinstance(arg, list):
+                values = arg
+        self.bytes_written += len(json.dumps(values))
+        row0, col0, _, _ = _parse_a1(a1 or 'A1')
+        for r, row_values in enumerate(values or []):
+            for c, value in enumerate(row_values):
+                self._set((row0 or 1) + r, col0 + c, value)
+    
+    def append_rows(self, rows, **kwargs):
+        self.calls['append_rows'] += 1
+        self.bytes_written += len(json.dumps(rows))
+        first = len(self.rows) + 1
+        for row in rows:
+            self.rows.append([str(value) for value in row])
+            self.cells_written += len(row)
+        last_col = column_letter(max((len(row) for row in rows), default=1) - 1)
+        return {'updates': {'updatedRange': f"'{self.title}'!A{first}:{last_col}{len(self.rows)}"}}
+    
+    def clear(self):
+        self.calls['clear'] += 1
+        self.rows = []
+
+
+class FakeSpreadsheet:
+    def __init__(self, title='NFL Picks (bench)'):
+        self.title = title
+        self.worksheets_by_title = {}
+        self.calls = Counter()
+    
+    def worksheet(self, title):
+        self.calls['worksheet'] += 1
+        if title not in self.worksheets_by_title:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return self.worksheets_by_title[title]
+    
+    def add_worksheet(self, title, rows=1000, cols=26, **kwargs):
+        self.calls['add_worksheet'] += 1
+        self.worksheets_by_title[title] = FakeWorksheet(title, sheet_id=len(self.worksheets_by_title))
+        return self.worksheets_by_title[title]
+    
+    def batch_update(self, body):
+        self.calls['batch_update'] += 1
+        return {'replies': [{} for _ in body.get('requests', [])]}
+    
+    def worksheets(self):
+        self.calls['worksheets'] += 1
+        return list(self.worksheets_by_title.values())
+
+
+class FakeSheetsClient:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+        self.calls = Counter()
+    
+    def open_by_key(self, key):
+        self.calls['open_by_key'] += 1
+        return self.spreadsheet
+    
+    def sheets_calls(self):
+        """Every Sheets API call made so far, by method"""
+        total = Counter(self.calls) + Counter(self.spreadsheet.calls)
+        for worksheet in self.spreadsheet.worksheets_by_title.values():
+            total += worksheet.calls
+        return total
+    
+    def reset(self):
+        self.calls.clear()
+        self.spreadsheet.calls.clear()
+        for worksheet in self.spreadsheet.worksheets_by_title.values():
+            worksheet.reset()
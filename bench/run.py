@@ -0,0 +1,292 @@
+"""
+Benchmark scrape.py, sync-to-sheets.py and score-games.py against local
+stand-ins for OddsShark, ESPN, GitHub and Google Sheets.
+
+Each scenario runs in a fresh temporary directory seeded with a synthetic
+season, and reports wall time, peak Python memory, HTTP calls by endpoint
+and Google Sheets calls/cells.
+
+    python3 bench/run.py                      # 3, 20 and 50 players
+    python3 bench/run.py --players 50 --json  # machine-readable output
+    python3 bench/run.py --fixtures recordings/  # replay recorded ESPN responses
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import requests
+
+from bench.fakes import FakeHTTP, FakeSheetsClient, FakeSpreadsheet, FakeWorksheet
+from bench.synthetic import SEASON, SEASON_START, games_json, make_season, scoreboard_payload, sheet_rows, ticker_payload
+from nflpicks.api import default_report
+from nflpicks.cli import load_script
+from nflpicks.sheets import WeekIndex
+from nflpicks.store import SeasonStore
+
+
+def load_recorded_scoreboards(fixture_dir):
+    """Scoreboards saved by score-games.py --record, keyed by (seasontype, week)"""
+    scoreboards = {}
+    for name in sorted(os.listdir(fixture_dir)):
+        match = re.match(r'^(?:\d+-)?st(\d+)-week(\d+)(?:-\d+)?\.json$', name)
+        if match:
+            with open(os.path.join(fixture_dir, name), 'r') as f:
+                scoreboards[(int(match.group(1)), int(match.group(2)))] = json.load(f)
+    return scoreboards
+
+
+class Sandbox:
+    """A temporary working directory plus the fakes the scripts talk to"""
+
+    def __init__(self, season, players, http):
+        self.season = season
+        self.players = players
+        self.http = http
+        self.spreadsheet = FakeSpreadsheet()
+        self.client = FakeSheetsClient(self.spreadsheet)
+        self.tmp = tempfile.TemporaryDirectory(prefix='nflpicks-bench-')
+        self.dir = self.tmp.name
+        self.write('config.json', {
+            'players': players,
+            'current_season': SEASON,
+            'season_start_date': SEASON_START.strftime('%Y-%m-%d')
+        })
+
+    def write(self, path, data):
+        full_path = os.path.join(self.dir, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    def add_sheet(self, rows):
+        worksheet = FakeWorksheet('Season Data', rows)
+        self.spreadsheet.worksheets_by_title[worksheet.title] = worksheet
+        return worksheet
+    
+    def build_index(self):
+        """Run the --build-index migration against the fake sheet"""
+        WeekIndex.build(self.spreadsheet, self.spreadsheet.worksheets_by_title['Season Data'])
+
+    def seed_store(self, weeks):
+        store = SeasonStore(SEASON, root=os.path.join(self.dir, 'seasons'))
+        for week in weeks:
+            store.save_games(games_json(self.season, week, self.players))
+            for player, picks_data in self.season[week]['picks'].items():
+                store.save_picks(player, picks_data)
+
+    @contextlib.contextmanager
+    def active(self):
+        """cwd, env, HTTP and Sheets patched for the duration of a run"""
+        cwd = os.getcwd()
+        os.chdir(self.dir)
+        client = self.client
+        try:
+            env = {'GOOGLE_SHEET_ID': 'bench', 'NFL_PICKS_SOURCE': 'github', 'NFL_PICKS_RUN_REPORT': ''}
+            with mock.patch.dict(os.environ, env), \
+                 mock.patch.object(requests.Session, 'request',
+                                   lambda session, method, url, **kwargs: self.http.request(session, method, url, **kwargs)):
+                yield client
+        finally:
+            os.chdir(cwd)
+
+    def close(self):
+        self.tmp.cleanup()
+
+
+def measure(name, players, sandbox, run, track_memory=True):
+    """Run one scenario and collect its timings and call counts"""
+    sandbox.http.reset()
+    sandbox.client.reset()
+    default_report.records.clear()
+    if track_memory:
+        tracemalloc.start()
+    output = io.StringIO()
+    with sandbox.active(), contextlib.redirect_stdout(output):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+    peak = None
+    if track_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    sheets_calls = sandbox.client.sheets_calls()
+    worksheets = sandbox.spreadsheet.worksheets_by_title.values()
+    return {
+        'scenario': name,
+        'players': players,
+        'wall_ms': round(elapsed * 1000, 1),
+        'peak_mib': round(peak / 2**20, 2) if peak is not None else None,
+        'http_calls': dict(sandbox.http.calls),
+        'http_bytes': sum(sandbox.http.bytes.values()),
+        'sheets_calls': dict(sheets_calls),
+        'cells_written': sum(w.cells_written for w in worksheets),
+        'sheets_bytes_read': sum(w.bytes_read for w in worksheets),
+        'sheets_bytes_written': sum(w.bytes_written for w in worksheets),
+        'report': default_report.summary(),
+        'output': output.getvalue()
+    }
+
+
+def bench_scrape(season, players, week, http, track_memory):
+    scrape = load_script('scrape.py')
+    sandbox = Sandbox(season, players, http)
+    argv = ['scrape.py', '--week', str(week)]
+    try:
+        with mock.patch.object(sys, 'argv', argv):
+            yield measure('scrape', len(players), sandbox, scrape.main, track_memory)
+            yield measure('scrape (unchanged)', len(players), sandbox, scrape.main, track_memory)
+    finally:
+        sandbox.close()
+
+
+def bench_sync(season, players, week, http, track_memory):
+    sync = load_script('sync-to-sheets.py')
+    sandbox = Sandbox(season, players, http)
+    sandbox.add_sheet(sheet_rows(season, players, range(1, week)))
+    http.repo_files = {'games.json': games_json(season, week, players)}
+    for player, picks_data in season[week]['picks'].items():
+        http.repo_files[f'picks/{player}.json'] = picks_data
+
+    def run():
+        with mock.patch.object(sync.NFLSheetsSync, 'setup_google_sheets',
+                               lambda self: setattr(self, 'gc', self.sheets.wrap(sandbox.client))):
+            sync.NFLSheetsSync().sync_to_sheet()
+
+    def change_one_pick():
+        picks_data = http.repo_files[f'picks/{players[0]}.json']
+        game = season[week]['games'][0]
+        pick = picks_data['picks'][game['id']]
+        pick['total'] = 'under' if pick['total'] == 'over' else 'over'
+
+    try:
+        yield measure('sync (new week)', len(players), sandbox, run, track_memory)
+        yield measure('sync (unchanged)', len(players), sandbox, run, track_memory)
+        change_one_pick()
+        yield measure('sync (one pick changed)', len(players), sandbox, run, track_memory)
+        sandbox.build_index()
+        yield measure('sync (indexed, unchanged)', len(players), sandbox, run, track_memory)
+        change_one_pick()
+        yield measure('sync (indexed, one changed)', len(players), sandbox, run, track_memory)
+    finally:
+        sandbox.close()
+
+
+def bench_score(season, players, week, http, track_memory):
+    score = load_script('score-games.py')
+
+    def updater(sandbox):
+        # Sheets auth is lazy, so hand the updater its client up front
+        score_updater = score.NFLScoreUpdater()
+        score_updater.gc = score_updater.sheets.wrap(sandbox.client)
+        return score_updater
+
+    def sandbox_for(weeks):
+        sandbox = Sandbox(season, players, http)
+        sandbox.add_sheet(sheet_rows(season, players, weeks))
+        sandbox.seed_store(weeks)
+        return sandbox
+
+    weeks = list(range(1, week + 1))
+    sandbox = sandbox_for(weeks)
+    try:
+        yield measure('score (one week)', len(players), sandbox, lambda: updater(sandbox).run(week), track_memory)
+        yield measure('score (unchanged)', len(players), sandbox, lambda: updater(sandbox).run(week), track_memory)
+        sandbox.build_index()
+        yield measure('score (indexed, unchanged)', len(players), sandbox, lambda: updater(sandbox).run(week), track_memory)
+    finally:
+        sandbox.close()
+
+    sandbox = sandbox_for(weeks)
+    try:
+        yield measure(f'score (backfill {len(weeks)} weeks)', len(players), sandbox,
+                      lambda: updater(sandbox).run(weeks), track_memory)
+    finally:
+        sandbox.close()
+
+
+def bench_project(season, players, week, http, track_memory):
+    """The Monte Carlo projection on its own: one full week, no games graded yet"""
+    from nflpicks.projection import DEFAULT_SIMULATIONS, project
+
+    games = season[week]['games']
+    all_picks = {player: picks_data['picks'] for player, picks_data in season[week]['picks'].items()}
+    sandbox = Sandbox(season, players, http)
+    try:
+        yield measure(f'project week ({DEFAULT_SIMULATIONS // 1000}k sims)', len(players), sandbox,
+                      lambda: project(games, {}, all_picks, players, {}), track_memory)
+        yield measure(f'project season ({DEFAULT_SIMULATIONS // 1000}k sims)', len(players), sandbox,
+                      lambda: project(games, {}, all_picks, players, {}, future_picks=len(games) * 2 * 10),
+                      track_memory)
+    finally:
+        sandbox.close()
+
+
+BENCHMARKS = {'scrape': bench_scrape, 'sync': bench_sync, 'score': bench_score, 'project': bench_project}
+
+
+def print_table(results):
+    print(f"{'players':>7}  {'scenario':<28} {'wall ms':>9} {'peak MiB':>9} {'http':>5} {'sheets':>6} {'cells':>7}  calls")
+    for result in results:
+        peak = f"{result['peak_mib']:.2f}" if result['peak_mib'] is not None else '-'
+        calls = ', '.join(f"{k} {v}" for k, v in sorted({**result['http_calls'], **result['sheets_calls']}.items()))
+        print(f"{result['players']:>7}  {result['scenario']:<28} {result['wall_ms']:>9.1f} {peak:>9} "
+              f"{sum(result['http_calls'].values()):>5} {sum(result['sheets_calls'].values()):>6} "
+              f"{result['cells_written']:>7}  {calls}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scrape, sync and score against local API stand-ins')
+    parser.add_argument('--players', default='3,20,50', help='Comma-separated roster sizes (default: 3,20,50)')
+    parser.add_argument('--weeks', type=int, default=18, help='Weeks in the synthetic season (default: 18)')
+    parser.add_argument('--games', type=int, default=16, help='Games per week (default: 16)')
+    parser.add_argument('--week', type=int, help='Week to scrape/sync/score (default: the last week)')
+    parser.add_argument('--only', choices=sorted(BENCHMARKS), action='append',
+                        help='Run only these scripts (repeatable)')
+    parser.add_argument('--fixtures', help='Replay ESPN scoreboards recorded with score-games.py --record')
+    parser.add_argument('--ticker', help='Replay a recorded OddsShark ticker response (JSON file)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip tracemalloc for cleaner wall times')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--verbose', action='store_true', help='Show each run\'s script output')
+    args = parser.parse_args()
+
+    week = args.week or args.weeks
+    results = []
+    for player_count in (int(n) for n in args.players.split(',')):
+        players = [f"player{i:02d}" for i in range(1, player_count + 1)]
+        season = make_season(players, args.weeks, args.games)
+
+        http = FakeHTTP(
+            ticker=ticker_payload(season),
+            scoreboards={(2, w): scoreboard_payload(season, w) for w in season}
+        )
+        if args.ticker:
+            with open(args.ticker, 'r') as f:
+                http.ticker = json.load(f)
+        if args.fixtures:
+            http.scoreboards.update(load_recorded_scoreboards(args.fixtures))
+
+        for name in args.only or BENCHMARKS:
+            for result in BENCHMARKS[name](season, players, week, http, not args.no_memory):
+                if args.verbose:
+                    print(result['output'], file=sys.stderr)
+                results.append(result)
+
+    if args.json:
+        print(json.dumps([{k: v for k, v in r.items() if k != 'output'} for r in results], indent=2))
+    else:
+        print_table(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Startup guard for the CLI commands.
+
+For each command it times `python -m nflpicks <command> --help` in a fresh
+interpreter, and checks that importing the command's script doesn't pull in
+the modules it's meant to defer (gspread, Google auth, numpy). Exits with
+status 1 if a command is over budget or imports one of them up front, so it
+can run before merging changes to the scripts.
+
+    python3 bench/startup.py                  # every command, 5 runs each
+    python3 bench/startup.py --budget-ms 400  # tighter budget
+    python3 bench/startup.py --json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from nflpicks.cli import COMMANDS
+
+# Only imported once a command actually reads or writes the sheet, or grades picks
+DEFERRED_MODULES = ('gspread', 'google.oauth2', 'numpy')
+
+PROBE = """
+import json, sys
+from nflpicks.cli import load_script
+load_script({filename!r})
+print(json.dumps([name for name in {modules!r} if name in sys.modules]))
+"""
+
+
+def run_python(args):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable] + args, cwd=REPO_ROOT, capture_output=True, text=True)
+    return time.perf_counter() - start, result
+
+
+def check_command(command, runs):
+    """Median --help wall time and the deferred modules importing the script loads"""
+    filename, _ = COMMANDS[command]
+    timings = []
+    for _ in range(runs):
+        elapsed, result = run_python(['-m', 'nflpicks', command, '--help'])
+        if result.returncode != 0:
+            raise RuntimeError(f"{command} --help failed: {result.stderr.strip()}")
+        timings.append(elapsed * 1000)
+
+    _, result = run_python(['-c', PROBE.format(filename=filename, modules=DEFERRED_MODULES)])
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {filename} failed: {result.stderr.strip()}")
+    return {
+        'command': command,
+        'help_ms': round(statistics.median(timings), 1),
+        'eager_imports': json.loads(result.stdout.strip().splitlines()[-1])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Guard CLI startup time and deferred imports')
+    parser.add_argument('--budget-ms', type=float, default=500,
+                        help='Slowest allowed median --help time per command (default: 500)')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per command (default: 5)')
+    parser.add_argument('--only', choices=sorted(COMMANDS), action='append', help='Check only these commands')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = [check_command(command, args.runs) for command in args.only or COMMANDS]
+    failures = [
+        r for r in results
+        if r['help_ms'] > args.budget_ms or r['eager_imports']
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'command':<8} {'--help ms':>10}  eager imports")
+        for r in results:
+            flag = '❌' if r in failures else '✅'
+            print(f"{r['command']:<8} {r['help_ms']:>10.1f}  {', '.join(r['eager_imports']) or '-'} {flag}")
+
+    if failures:
+        print(f"Startup regression in: {', '.join(r['command'] for r in failures)} "
+              f"(budget {args.budget_ms:.0f} ms, deferred: {', '.join(DEFERRED_MODULES)})", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
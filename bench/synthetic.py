@@ -0,0 +1,173 @@
+"""
+Synthetic seasons for the benchmark harness.
+
+Builds a full schedule (weeks x games), every player's picks and final
+scores, and renders them in each upstream API's format: the OddsShark
+ticker, ESPN scoreboards, games.json / picks files and 'Season Data' rows.
+"""
+import random
+from datetime import datetime, timedelta
+
+from nflpicks.sheets import sheet_columns
+from nflpicks.teams import TEAMS
+
+SEASON = 2025
+SEASON_START = datetime(2025, 9, 4)  # A Thursday, like config.json
+TEAM_CODES = list(TEAMS)
+# Thursday night, Sunday early/late/night, Monday night
+SLOTS = [(0, '20:15'), (3, '13:00'), (3, '16:05'), (3, '16:25'), (3, '20:20'), (4, '20:15')]
+
+
+def _pairings(week):
+    """Circle-method round robin so every week has 16 distinct matchups"""
+    fixed, rotating = TEAM_CODES[0], TEAM_CODES[1:]
+    shift = (week - 1) % len(rotating)
+    rotating = rotating[shift:] + rotating[:shift]
+    teams = [fixed] + rotating
+    half = len(teams) // 2
+    return [(teams[i], teams[-1 - i]) for i in range(half)]
+
+
+def make_season(players, weeks=18, games_per_week=16, seed=2025):
+    """
+    Returns {week: {'week_start', 'games', 'picks', 'scores'}} where games are
+    games.json dicts, picks are picks/<player>.json payloads and scores map
+    game id -> (away_score, home_score)
+    """
+    rng = random.Random(seed)
+    season = {}
+    for week in range(1, weeks + 1):
+        week_start = SEASON_START + timedelta(weeks=week - 1)
+        games, scores = [], {}
+        for i, (away, home) in enumerate(_pairings(week)[:games_per_week]):
+            day, clock = SLOTS[0] if i == 0 else SLOTS[-1] if i == games_per_week - 1 else SLOTS[1 + i % 4]
+            game_date = f"{(week_start + timedelta(days=day)).strftime('%Y-%m-%d')} {clock}"
+            spread = rng.choice([1, 1.5, 2.5, 3, 3.5, 4, 6.5, 7, 9.5]) * rng.choice([-1, 1])
+            total = rng.choice([38.5, 41, 42.5, 44, 45.5, 47, 49.5])
+            away_name, home_name = TEAMS[away][0], TEAMS[home][0]
+            game_id = f"{away_name}_{home_name}_{game_date}"
+            games.append({
+                "id": game_id,
+                "week": week,
+                "game_date": game_date,
+                "away_team": away_name,
+                "home_team": home_name,
+                "away_odds": str(spread),
+                "home_odds": str(-spread),
+                "over_under": str(total),
+                "matchup_link": f"/nfl/{away.lower()}-{home.lower()}-odds-{week}"
+            })
+            scores[game_id] = (rng.randint(3, 38), rng.randint(3, 38))
+        
+        picks = {}
+        for player in players:
+            picks[player] = {
+                "player": player,
+                "week": week,
+                "picks": {
+                    game["id"]: {
+                        "spread": rng.choice([game["away_team"], game["home_team"]]),
+                        "total": rng.choice(["over", "under"])
+                    }
+                    for game in games
+                },
+                "saved_at": (week_start - timedelta(days=1)).strftime('%Y-%m-%dT12:00:00.000Z')
+            }
+        season[week] = {'week_start': week_start, 'games': games, 'picks': picks, 'scores': scores}
+    return season
+
+
+def games_json(season, week, players):
+    return {
+        "week": week,
+        "week_start": season[week]['week_start'].strftime('%Y-%m-%d'),
+        "generated_at": season[week]['week_start'].isoformat(),
+        "players": players,
+        "games": season[week]['games']
+    }
+
+
+def ticker_payload(season):
+    """OddsShark ticker body: every week's matchups, with date separators mixed in"""
+    matchups = []
+    for week in sorted(season):
+        matchups.append({"type": "date", "date": season[week]['week_start'].strftime('%Y-%m-%d')})
+        for game in season[week]['games']:
+            matchups.append({
+                "type": "matchup",
+                "event_date": game["game_date"],
+                "away_name": game["away_team"],
+                "home_name": game["home_team"],
+                "away_odds": game["away_odds"],
+                "home_odds": game["home_odds"],
+                "total": game["over_under"],
+                "matchup_link": game["matchup_link"]
+            })
+    return {"matchups": matchups}
+
+
+def _code_for(name):
+    return next(code for code, team in TEAMS.items() if team[0] == name)
+
+
+def calendar_payload(season):
+    """ESPN's leagues[0].calendar for the season: Wednesday-to-Tuesday weeks, in UTC"""
+    entries = []
+    for week in sorted(season):
+        start = season[week]['week_start'] - timedelta(days=1) + timedelta(hours=7)
+        entries.append({
+            'label': f"Week {week}",
+            'value': str(week),
+            'startDate': start.strftime('%Y-%m-%dT%H:%MZ'),
+            'endDate': (start + timedelta(days=7, minutes=-1)).strftime('%Y-%m-%dT%H:%MZ')
+        })
+    return [{'label': 'Regular Season', 'value': '2', 'entries': entries}]
+
+
+def scoreboard_payload(season, week):
+    """ESPN scoreboard body for a week with every game final"""
+    events = []
+    for i, game in enumerate(season[week]['games']):
+        away_score, home_score = season[week]['scores'][game['id']]
+        competitors = []
+        for side, name, score in (('home', game['home_team'], home_score), ('away', game['away_team'], away_score)):
+            code = _code_for(name)
+            competitors.append({
+                'homeAway': side,
+                'score': str(score),
+                'team': {'displayName': TEAMS[code][1], 'abbreviation': TEAMS[code][2]}
+            })
+        events.append({
+            'id': f"{week}{i:02d}",
+            'date': game['game_date'],
+            'week': {'number': week},
+            'status': {'type': {'name': 'STATUS_FINAL'}},
+            'competitions': [{'competitors': competitors}]
+        })
+    return {
+        'leagues': [{'calendar': calendar_payload(season)}],
+        'season': {'type': 2},
+        'week': {'number': week},
+        'events': events
+    }
+
+
+def sheet_rows(season, players, weeks, with_scores=False):
+    """'Season Data' rows (as the Sheets API returns them: strings) for the given weeks"""
+    header = sheet_columns(players)
+    rows = [header]
+    for week in weeks:
+        for game in season[week]['games']:
+            row = [
+                str(week), season[week]['week_start'].strftime('%Y-%m-%d'), game['game_date'],
+                game['away_team'], game['home_team'], game['away_odds'], game['home_odds'], game['over_under'],
+            ]
+            for player in players:
+                pick = season[week]['picks'][player]['picks'][game['id']]
+                row.extend([pick['spread'], pick['total']])
+            away_score, home_score = season[week]['scores'][game['id']]
+            row.extend([str(away_score), str(home_score)] if with_scores else ['', ''])
+            row.extend([''] * (2 * len(players)))
+            row.append('Final' if with_scores else 'Scheduled')
+            rows.append(row)
+    return rows
@@ -0,0 +1,16 @@
+import argparse
+import os
+
+from nflpicks.bundle import DATA_DIR, build_bundle
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the static JSON bundle the website loads')
+    parser.add_argument('--out', default=DATA_DIR, help=f'Output directory (default: {DATA_DIR})')
+    args = parser.parse_args()
+    
+    print("📦 Building site bundle...")
+    bundle_path = build_bundle(data_dir=args.out)
+    print(f"✅ Wrote {bundle_path} ({os.path.getsize(bundle_path)} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+const fs = require('fs');
+const path = require('path');
+
+// locks.json is written by build-bundle.py on every deploy and bundled with
+// this function (see netlify.toml): { week, players, locks: { gameId: kickoff epoch seconds } }
+function loadLocks() {
+  const candidates = [
+    path.resolve('ui/data/locks.json'),
+    path.join(__dirname, '..', '..', 'ui', 'data', 'locks.json')
+  ];
+  for (const candidate of candidates) {
+    try {
+      return JSON.parse(fs.readFileSync(candidate, 'utf8'));
+    } catch (error) {
+      // Try the next location
+    }
+  }
+  return null;
+}
+
+// Read once per warm function instance
+const LOCK_INDEX = loadLocks();
+
+const HEADERS = {
+  'Content-Type': 'application/json',
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'Content-Type',
+};
+
+const respond = (statusCode, body) => ({ statusCode, headers: HEADERS, body: JSON.stringify(body) });
+
+async function github(endpoint, options = {}) {
+  const owner = process.env.GITHUB_REPO_OWNER || 'jmhale15';
+  const repo = process.env.GITHUB_REPO_NAME || 'nfl-picks';
+  return fetch(`https://api.github.com/repos/${owner}/${repo}${endpoint}`, {
+    ...options,
+    headers: {
+      'Authorization': `token ${process.env.GITHUB_TOKEN}`,
+      'Accept': 'application/vnd.github.v3+json',
+      'Content-Type': 'application/json',
+      ...options.headers
+    }
+  });
+}
+
+// The player's committed file: { sha, picks } (picks only if it's for this week)
+async function loadCurrent(filePath, week) {
+  const response = await github(`/contents/${filePath}`);
+  if (response.status === 404) {
+    return { sha: null, picks: {} };
+  }
+  if (!response.ok) {
+    throw new Error(`GitHub returned ${response.status} reading ${filePath}`);
+  }
+  const data = await response.json();
+  const content = JSON.parse(Buffer.from(data.content, 'base64').toString('utf8'));
+  return { sha: data.sha, picks: content.week === week ? (content.picks || {}) : {} };
+}
+
+const samePick = (a = {}, b = {}) => a.spread === b.spread && a.total === b.total;
+
+// Each pick records when it was made, so grading can use the line as of that
+// moment: an unchanged pick keeps its committed picked_at, a new or changed one gets savedAt
+function stampPick(pick, committed, savedAt) {
+  const pickedAt = committed && samePick(pick, committed) && committed.picked_at;
+  return { ...pick, picked_at: pickedAt || savedAt };
+}
+
+// Split submitted picks into ones we accept and ones for games that have kicked off.
+// A started game keeps whatever was committed before kickoff, whatever the client sent.
+function applyLocks(submitted, committed, locks, now, savedAt) {
+  const accepted = {};
+  const rejected = [];
+  for (const [gameId, pick] of Object.entries(submitted)) {
+    const kickoff = locks[gameId];
+    if (kickoff === undefined) {
+      rejected.push({ game: gameId, reason: 'unknown game' });
+    } else if (now < kickoff) {
+      accepted[gameId] = stampPick(pick, committed[gameId], savedAt);
+    } else if (!samePick(pick, committed[gameId])) {
+      rejected.push({ game: gameId, reason: 'game already started' });
+    }
+  }
+  for (const [gameId, pick] of Object.entries(committed)) {
+    if (locks[gameId] !== undefined && now >= locks[gameId]) {
+      accepted[gameId] = pick;
+    }
+  }
+  return { accepted, rejected };
+}
+
+exports.handler = async (event, context) => {
+  if (event.httpMethod !== 'POST') {
+    return respond(405, { error: 'Method not allowed' });
+  }
+  if (!LOCK_INDEX) {
+    return respond(503, { error: 'Pick locks are not available for this deploy' });
+  }
+
+  let body;
+  try {
+    body = JSON.parse(event.body || '{}');
+  } catch (error) {
+    return respond(400, { error: 'Invalid JSON' });
+  }
+
+  const { player, week, picks } = body;
+  if (!LOCK_INDEX.players.includes(player)) {
+    return respond(400, { error: `Unknown player: ${player}` });
+  }
+  if (week !== LOCK_INDEX.week) {
+    return respond(409, { error: `Picks are open for Week ${LOCK_INDEX.week}, not Week ${week}` });
+  }
+  if (!picks || typeof picks !== 'object' || Array.isArray(picks)) {
+    return respond(400, { error: 'picks must be an object keyed by game id' });
+  }
+
+  const filePath = `picks/${player}.json`;
+  try {
+    // Retry if someone else committed the file between our read and write
+    for (let attempt = 0; attempt < 3; attempt++) {
+      const now = Date.now() / 1000;
+      const current = await loadCurrent(filePath, week);
+      const savedAt = new Date().toISOString();
+      const { accepted, rejected } = applyLocks(picks, current.picks, LOCK_INDEX.locks, now, savedAt);
+
+      const picksData = { player, week, picks: accepted, saved_at: savedAt };
+      const payload = {
+        message: `Update ${player}'s picks for Week ${week}`,
+        content: Buffer.from(JSON.stringify(picksData, null, 2)).toString('base64'),
+      };
+      if (current.sha) {
+        payload.sha = current.sha;
+      }
+
+      const response = await github(`/contents/${filePath}`, { method: 'PUT', body: JSON.stringify(payload) });
+      if (response.status === 409 || response.status === 422) {
+        continue;
+      }
+      if (!response.ok) {
+        return respond(502, { error: `GitHub returned ${response.status} saving picks` });
+      }
+      const result = await response.json();
+      return respond(200, { saved: true, sha: result.content.sha, picks: accepted, rejected });
+    }
+    return respond(409, { error: 'Picks file kept changing; please try again' });
+  } catch (error) {
+    return respond(502, { error: error.message });
+  }
+};
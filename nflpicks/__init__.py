@@ -0,0 +1 @@
+"""Shared helpers for the NFL picks scripts (scrape, sync and score)"""
@@ -0,0 +1,5 @@
+import sys
+
+from nflpicks.cli import main
+
+sys.exit(main())
@@ -0,0 +1,362 @@
+"""
+Instrumented API clients shared by scrape, sync and score.
+
+ApiClient wraps a keep-alive requests session, SheetsMeter wraps gspread
+objects. Both record every call (endpoint, status, latency, bytes, retries,
+remaining quota) to a RunReport. They also pace themselves with a token bucket
+that slows down as X-RateLimit-Remaining runs low and backs off on 429s.
+The report is written as JSON lines to run-report.jsonl, or to the file in
+$NFL_PICKS_RUN_REPORT (set it to an empty string to turn the report off).
+A dry-run SheetsMeter passes reads through but prints writes instead of
+sending them.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_REPORT_FILE = 'run-report.jsonl'
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Start pacing once fewer than this share of the quota is left
+LOW_QUOTA_FRACTION = 0.1
+# Never sleep longer than this for a rate limit reset; fail and report instead
+MAX_PAUSE_SECONDS = 300
+# Sheets API: 60 requests per minute per user
+SHEETS_RATE = 1.0
+SHEETS_BURST = 60
+# gspread methods that change a spreadsheet; a dry run prints these instead
+SHEETS_WRITE_METHODS = {
+    'add_worksheet', 'append_row', 'append_rows', 'batch_clear', 'batch_update', 'clear',
+    'del_worksheet', 'update', 'update_cell', 'update_cells', 'update_title'
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is free"""
+    
+    def __init__(self, rate=None, burst=1):
+        self.rate = rate  # tokens per second, None for unlimited
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait = self.paused_until - now
+                if wait <= 0 and self.rate is None:
+                    return
+                if wait <= 0:
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def pause(self, seconds):
+        """Hold every caller for the given number of seconds"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + min(seconds, MAX_PAUSE_SECONDS))
+    
+    def pace(self, remaining, reset_in):
+        """Spread the remaining quota evenly over the time left before it resets"""
+        with self.lock:
+            self.rate = max(remaining, 1) / max(reset_in, 1)
+            self.burst = 1
+            self.tokens = min(self.tokens, 1)
+
+
+class RunReport:
+    """Collects one record per API call and writes them as JSON lines"""
+    
+    def __init__(self, path=None):
+        self.path = path
+        self.records = []
+        self.lock = threading.Lock()
+    
+    def record(self, service, endpoint, status=None, latency=0.0, size=None, retries=0,
+               remaining=None, error=None):
+        entry = {
+            'type': 'call',
+            'at': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'service': service,
+            'endpoint': endpoint,
+            'status': status,
+            'latency_ms': round(latency * 1000, 1),
+            'bytes': size,
+            'retries': retries,
+            'rate_remaining': remaining,
+            'error': error
+        }
+        with self.lock:
+            self.records.append(entry)
+    
+    def summary(self, records=None):
+        """Per-endpoint totals: calls, errors, retries, bytes, latency and lowest remaining quota"""
+        totals = defaultdict(lambda: {'calls': 0, 'errors': 0, 'retries': 0, 'bytes': 0, 'latencies': [],
+                                      'statuses': defaultdict(int), 'min_remaining': None})
+        for entry in self.records if records is None else records:
+            total = totals[f"{entry['service']} {entry['endpoint']}"]
+            total['calls'] += 1
+            total['retries'] += 1 if entry['retries'] else 0
+            total['bytes'] += entry['bytes'] or 0
+            total['latencies'].append(entry['latency_ms'])
+            total['statuses'][str(entry['status'])] += 1
+            if entry['error'] or (entry['status'] or 0) >= 400:
+                total['errors'] += 1
+            if entry['rate_remaining'] is not None:
+                current = total['min_remaining']
+                total['min_remaining'] = entry['rate_remaining'] if current is None else min(current, entry['rate_remaining'])
+        
+        endpoints = {}
+        for name, total in totals.items():
+            latencies = sorted(total.pop('latencies'))
+            total['statuses'] = dict(total['statuses'])
+            total['p50_ms'] = latencies[len(latencies) // 2]
+            total['max_ms'] = latencies[-1]
+            endpoints[name] = total
+        return endpoints
+    
+    def flush(self, script):
+        """Append this run's calls and a summary line to the report file, then start over"""
+        with self.lock:
+            records, self.records = self.records, []
+        if not records:
+            return
+        summary = self.summary(records)
+        
+        calls = len(records)
+        errors = sum(s['errors'] for s in summary.values())
+        retries = sum(s['retries'] for s in summary.values())
+        print(f"📈 {calls} API calls this run ({errors} errors, {retries} retries)")
+        path = os.getenv('NFL_PICKS_RUN_REPORT', DEFAULT_REPORT_FILE) if self.path is None else self.path
+        if not path:
+            return
+        
+        run_line = {
+            'type': 'summary',
+            'at': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'script': script,
+            'calls': calls,
+            'endpoints': summary
+        }
+        try:
+            with open(path, 'a') as f:
+                for entry in records:
+                    f.write(json.dumps({'script': script, **entry}) + '\n')
+                f.write(json.dumps(run_line) + '\n')
+            print(f"📝 Run report appended to {path}")
+        except OSError as e:
+            print(f"⚠️  Could not write run report {path}: {e}")
+
+
+# One report per process, shared by every client unless told otherwise
+default_report = RunReport()
+
+
+def _rate_limit(response):
+    """(remaining, limit, seconds until reset) from X-RateLimit-* headers, or Nones"""
+    try:
+        remaining = int(response.headers['X-RateLimit-Remaining'])
+    except (KeyError, TypeError, ValueError):
+        return None, None, None
+    try:
+        limit = int(response.headers.get('X-RateLimit-Limit'))
+    except (TypeError, ValueError):
+        limit = None
+    try:
+        reset_in = int(response.headers.get('X-RateLimit-Reset')) - time.time()
+    except (TypeError, ValueError):
+        reset_in = None
+    return remaining, limit, reset_in
+
+
+def _retry_after(response, attempt):
+    """Seconds to wait before retrying: Retry-After if given, else exponential backoff"""
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, TypeError, ValueError):
+        return min(2 ** attempt, 64)
+
+
+class ApiClient:
+    """
+    A pooled requests session for one service. get() records the call in
+    the run report, retries 429/5xx with backoff and paces requests once
+    the service reports its quota running low.
+    """
+    
+    def __init__(self, service, report=None, rate=None, burst=1, pool_size=8, max_retries=3):
+        self.service = service
+        self.report = report or default_report
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+    
+    @property
+    def headers(self):
+        return self.session.headers
+    
+    def get(self, url, endpoint, **kwargs):
+        """GET url, recording it under endpoint. Raises like requests does."""
+        retries = 0
+        while True:
+            self.bucket.acquire()
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self.report.record(self.service, endpoint, latency=time.monotonic() - start,
+                                   retries=retries, error=f"{type(e).__name__}: {e}")
+                raise
+            latency = time.monotonic() - start
+            
+            remaining, limit, reset_in = _rate_limit(response)
+            exhausted = response.status_code == 403 and remaining == 0
+            size = response.headers.get('Content-Length')
+            if size is None and not kwargs.get('stream'):
+                size = len(response.content)
+            self.report.record(self.service, endpoint, response.status_code, latency,
+                               int(size) if size is not None else None, retries, remaining)
+            
+            if remaining is not None and reset_in is not None:
+                if remaining == 0:
+                    self.bucket.pause(reset_in)
+                elif limit and remaining < limit * LOW_QUOTA_FRACTION:
+                    self.bucket.pace(remaining, reset_in)
+            
+            if (response.status_code in RETRY_STATUSES or exhausted) and retries < self.max_retries:
+                self.bucket.pause(reset_in if exhausted and reset_in else _retry_after(response, retries))
+                response.close()
+                retries += 1
+                continue
+            return response
+
+
+def _status_of(error):
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None)
+
+
+class SheetsMeter:
+    """
+    Meters gspread calls. wrap() returns a proxy whose method calls are
+    paced (60/minute by default), retried on 429 and recorded in the report;
+    gspread objects they return (spreadsheets, worksheets) are wrapped too.
+    """
+    
+    def __init__(self, report=None, rate=SHEETS_RATE, burst=SHEETS_BURST, max_retries=5, dry_run=False,
+                 bucket=None, out=None):
+        self.report = report or default_report
+        self.out = out  # Where a dry run prints its planned writes (None: stdout)
+        # Meters for several sheets under one service account share its bucket
+        self.bucket = bucket or TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.count = 0
+        self.dry_run = dry_run
+        self.planned_writes = 0
+        self.planned_cells = 0
+    
+    def wrap(self, target):
+        return _Metered(target, self)
+    
+    def call(self, endpoint, func, *args, **kwargs):
+        retries = 0
+        while True:
+            self.bucket.acquire()
+            self.count += 1
+            start = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                status = _status_of(e)
+                self.report.record('sheets', endpoint, status, time.monotonic() - start,
+                                   retries=retries, error=f"{type(e).__name__}: {e}")
+                if status in RETRY_STATUSES and retries < self.max_retries:
+                    self.bucket.pause(_retry_after(e.response, retries))
+                    retries += 1
+                    continue
+                raise
+            self.report.record('sheets', endpoint, 200, time.monotonic() - start,
+                               len(json.dumps(result, default=str)) if isinstance(result, (list, dict)) else None,
+                               retries)
+            return result
+    
+    def plan(self, label, method, args, kwargs):
+        """Print the write a dry run skipped: one line per changed range"""
+        self.planned_writes += 1
+        data = args[0] if args else kwargs.get('data') or kwargs.get('values')
+        if method == 'batch_update' and isinstance(data, list):
+            for entry in data:
+                values = entry['values']
+                self.planned_cells += sum(len(row) for row in values)
+                shown = values[0][0] if len(values) == 1 and len(values[0]) == 1 else f"{len(values)} rows"
+                print(f"   ✏️  {label}!{entry['range']}: {shown}", file=self.out)
+        elif method == 'append_rows' and isinstance(data, list):
+            self.planned_cells += sum(len(row) for row in data)
+            print(f"   ➕ {label}: append {len(data)} rows", file=self.out)
+            for row in data:
+                print(f"      {' | '.join(str(value) for value in row[:5])}", file=self.out)
+        elif method == 'update_cell':
+            self.planned_cells += 1
+            print(f"   ✏️  {label}!R{args[0]}C{args[1]}: {args[2]}", file=self.out)
+        else:
+            print(f"   📝 {label}: {method}", file=self.out)
+    
+    def plan_summary(self):
+        return f"🧪 Dry run: {self.planned_writes} writes ({self.planned_cells} cells) not sent"
+
+
+class _Planned:
+    """Stands in for a worksheet a dry run would have created; its writes are printed too"""
+    
+    def __init__(self, label, meter):
+        self.title = label
+        self._meter = meter
+    
+    def __getattr__(self, name):
+        def planned(*args, **kwargs):
+            self._meter.plan(self.title, name, args, kwargs)
+        return planned
+
+
+class _Metered:
+    """Proxy for a gspread object that routes method calls through a SheetsMeter"""
+    
+    def __init__(self, target, meter):
+        self._target = target
+        self._meter = meter
+    
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        
+        if self._meter.dry_run and name in SHEETS_WRITE_METHODS:
+            label = getattr(self._target, 'title', type(self._target).__name__)
+            
+            def planned(*args, **kwargs):
+                self._meter.plan(label, name, args, kwargs)
+                if name == 'add_worksheet':
+                    return _Planned(kwargs.get('title') or args[0], self._meter)
+            return planned
+        
+        def metered(*args, **kwargs):
+            result = self._meter.call(name, attr, *args, **kwargs)
+            # Only gspread objects (client, spreadsheets, worksheets) get wrapped;
+            # values come back as they are, including list subclasses like ValueRange
+            if result is None or isinstance(result, (list, tuple, dict, str, bytes, int, float)):
+                return result
+            return _Metered(result, self._meter)
+        return metered
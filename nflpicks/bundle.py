@@ -0,0 +1,88 @@
+"""
+Static site bundle.
+
+Packs the current week's games, every player's picks, season standings and
+the latest projection into one compact, content-hashed JSON file under
+ui/data/, plus a tiny bundle.json manifest pointing at it. The hashed file
+never changes, so the CDN can cache it forever; only the manifest is
+revalidated. The kickoff lock index is written alongside it as locks.json.
+"""
+import glob
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from nflpicks.config import load_config, load_players
+from nflpicks.local import LocalFetcher
+from nflpicks.locks import write_locks
+from nflpicks.standings import Standings
+from nflpicks.store import SeasonStore
+
+DATA_DIR = os.path.join('ui', 'data')
+MANIFEST = 'bundle.json'
+
+
+def season_standings(store, players):
+    """Dashboard standings, brought up to date with any graded weeks not yet folded in"""
+    standings = Standings.load(store)
+    standings.update({week: store.load_results(week) for week in store.weeks()}, players)
+    return standings.to_json(players)
+
+
+def build_bundle(root='.', data_dir=DATA_DIR):
+    """Write ui/data/week.<hash>.json and the manifest. Returns the bundle path."""
+    config = load_config(os.path.join(root, 'config.json'))
+    players = load_players(config)
+    store = SeasonStore(config['current_season'], root=os.path.join(root, 'seasons'))
+    
+    fetcher = LocalFetcher(root)
+    paths = ['games.json'] + [f'picks/{player}.json' for player in players]
+    files = fetcher.get_files(paths)
+    games_data = files['games.json'] or {}
+    week = games_data.get('week')
+    
+    bundle = {
+        'week': week,
+        'week_label': games_data.get('week_label') or (f"Week {week}" if week else ''),
+        'week_start': games_data.get('week_start', ''),
+        'games_generated_at': games_data.get('generated_at', ''),
+        'players': games_data.get('players', players),
+        'games': games_data.get('games', []),
+        # Only this week's picks; a player's file may still hold last week's
+        'picks': {
+            player: files[f'picks/{player}.json']
+            for player in players
+            if files[f'picks/{player}.json'] and files[f'picks/{player}.json'].get('week') == week
+        },
+        'standings': season_standings(store, players),
+        'projection': store.load_projection() or None,
+    }
+    
+    content = json.dumps(bundle, separators=(',', ':'), sort_keys=True)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+    bundle_name = f"week.{digest}.json"
+    
+    os.makedirs(data_dir, exist_ok=True)
+    manifest_path = os.path.join(data_dir, MANIFEST)
+    previous = None
+    try:
+        with open(manifest_path, 'r') as f:
+            previous = json.load(f).get('bundle')
+    except (OSError, json.JSONDecodeError):
+        pass
+    
+    bundle_path = os.path.join(data_dir, bundle_name)
+    with open(bundle_path, 'w') as f:
+        f.write(content)
+    # Kickoff lock index for the picks page and the save-picks function
+    write_locks(games_data, data_dir)
+    with open(manifest_path, 'w') as f:
+        json.dump({'bundle': bundle_name, 'week': week, 'built_at': datetime.now().isoformat()}, f)
+    
+    # Keep the previous bundle for pages that loaded the old manifest
+    for old_path in glob.glob(os.path.join(data_dir, 'week.*.json')):
+        if os.path.basename(old_path) not in (bundle_name, previous):
+            os.remove(old_path)
+    
+    return bundle_path
@@ -0,0 +1,57 @@
+"""
+One entry point for the scripts: python -m nflpicks <command> [options]
+
+    python -m nflpicks scrape --week 5
+    python -m nflpicks sync --dry-run
+    python -m nflpicks score --weeks 1-18
+    python -m nflpicks bundle
+
+Each command runs the matching top-level script's main() with the rest of
+the arguments, so `python -m nflpicks sync --help` is sync-to-sheets.py's
+help. Only the chosen script is imported, and the scripts import gspread,
+Google auth and numpy only once they need them.
+"""
+import importlib.util
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = {
+    'scrape': ('scrape.py', "Fetch the week's games and lines into games.json"),
+    'sync': ('sync-to-sheets.py', 'Sync games and picks to the Google Sheet'),
+    'score': ('score-games.py', 'Update scores, points and standings from ESPN'),
+    'bundle': ('build-bundle.py', 'Build the static JSON bundle the website loads'),
+}
+
+
+def load_script(filename):
+    """Import one of the hyphenated top-level scripts as a module"""
+    name = filename.replace('-', '_').replace('.py', '')
+    spec = importlib.util.spec_from_file_location(name, os.path.join(REPO_ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def usage():
+    lines = ["usage: python -m nflpicks <command> [options]", "", "commands:"]
+    lines += [f"  {name:<8} {description}" for name, (_, description) in COMMANDS.items()]
+    lines += ["", "Run 'python -m nflpicks <command> --help' for a command's options."]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0
+    if argv[0] not in COMMANDS:
+        print(f"Unknown command: {argv[0]}\n\n{usage()}", file=sys.stderr)
+        return 2
+    
+    filename, _ = COMMANDS[argv[0]]
+    script = load_script(filename)
+    sys.argv = [filename] + argv[1:]
+    script.main()
+    return 0
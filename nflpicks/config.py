@@ -0,0 +1,21 @@
+"""Shared access to config.json (roster, season and scoring settings)"""
+import json
+
+CONFIG_FILE = 'config.json'
+
+
+def load_config(config_file=CONFIG_FILE):
+    """Load configuration from config.json"""
+    try:
+        with open(config_file, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"{config_file} not found. Please create it with player names and settings.")
+        exit(1)
+
+
+def load_players(config=None):
+    """Return the league roster from config.json"""
+    if config is None:
+        config = load_config()
+    return list(config.get('players', []))
@@ -0,0 +1,284 @@
+"""
+ESPN scoreboard client.
+
+ScoreboardClient reuses one keep-alive session and sends conditional
+requests (If-None-Match / If-Modified-Since), so polling an unchanged
+scoreboard is cheap. FixtureScoreboard is a drop-in stand-in that replays
+recorded responses from a directory, for offline runs and tests; pass
+record_dir to the live client to capture those fixtures. SharedScoreboard
+fetches each week once for several leagues in the same run.
+"""
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from nflpicks.api import ApiClient
+from nflpicks.teams import team_code
+
+SCOREBOARD_URL = 'https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard'
+
+# ESPN status names -> the sheet's Game Status values
+SHEET_STATUS = {
+    'STATUS_FINAL': 'Final',
+    'STATUS_IN_PROGRESS': 'In Progress',
+    'STATUS_HALFTIME': 'In Progress',
+    'STATUS_END_PERIOD': 'In Progress',
+}
+LIVE_STATUSES = {'STATUS_IN_PROGRESS', 'STATUS_HALFTIME', 'STATUS_END_PERIOD'}
+
+REGULAR_SEASON, POSTSEASON = 2, 3
+REGULAR_SEASON_WEEKS = list(range(1, 19))
+# ESPN postseason weeks: 1 Wild Card, 2 Divisional, 3 Conference, 4 Pro Bowl, 5 Super Bowl
+POSTSEASON_WEEKS = [1, 2, 3, 5]
+# Playoff games are stored as weeks 19-23 so they never collide with weeks 1-5
+POSTSEASON_WEEK_OFFSET = 18
+
+# st2-week3-0001.json (and 0001-st2-week3.json from before recordings were numbered per week)
+RECORDING_NAME = re.compile(r'^(?:\d+-)?(st\d+-week\w+?)(?:-\d+)?\.json$')
+
+
+def sheet_week(week, seasontype=REGULAR_SEASON):
+    """Week number used in the sheet and season store for an ESPN (seasontype, week)"""
+    if week is None:
+        return None
+    return int(week) + POSTSEASON_WEEK_OFFSET if seasontype == POSTSEASON else int(week)
+
+
+def recording_key(week, seasontype=REGULAR_SEASON):
+    """Filename prefix of a recorded scoreboard: st2-week3, or st2-weekcurrent without a week"""
+    return f"st{seasontype}-week{week or 'current'}"
+
+
+def recordings(fixture_dir):
+    """{recording key: [paths in recording order]} for the scoreboards saved in a directory"""
+    by_key = {}
+    for name in sorted(os.listdir(fixture_dir)):
+        match = RECORDING_NAME.match(name)
+        if match:
+            by_key.setdefault(match.group(1), []).append(os.path.join(fixture_dir, name))
+    return by_key
+
+
+class ScoreboardClient:
+    def __init__(self, record_dir=None, max_workers=8):
+        self.client = ApiClient('espn', pool_size=max_workers)
+        self.max_workers = max_workers
+        self.record_dir = record_dir
+        self.recorded = {}  # recording key -> recordings saved so far
+        self.record_lock = threading.Lock()
+        self.validators = {}
+        self.responses = {}
+        self.stats = {'requests': 0, 'not_modified': 0}
+    
+    def fetch(self, week=None, seasontype=REGULAR_SEASON):
+        """
+        Fetch a scoreboard. Returns (data, changed); changed is False when
+        ESPN answered 304 and the previous response was reused.
+        """
+        params = {'seasontype': seasontype, 'week': week} if week else {}
+        key = (week, seasontype)
+        
+        headers = {}
+        etag, last_modified = self.validators.get(key, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        response = self.client.get(SCOREBOARD_URL, 'scoreboard', params=params, headers=headers)
+        self.stats['requests'] += 1
+        if response.status_code == 304 and key in self.responses:
+            self.stats['not_modified'] += 1
+            return self.responses[key], False
+        response.raise_for_status()
+        
+        data = response.json()
+        self.validators[key] = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        self.responses[key] = data
+        if self.record_dir:
+            self._record(data, week, seasontype)
+        return data, True
+    
+    def fetch_calendar(self, season):
+        """A season's calendar (week boundaries), from its week 1 scoreboard"""
+        params = {'dates': season, 'seasontype': REGULAR_SEASON, 'week': 1}
+        response = self.client.get(SCOREBOARD_URL, 'calendar', params=params)
+        response.raise_for_status()
+        return response.json()['leagues'][0]['calendar']
+    
+    def fetch_many(self, weeks, seasontype=REGULAR_SEASON):
+        """Fetch several weeks' scoreboards concurrently. Returns {week: (data, changed)}"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(weeks, pool.map(lambda week: self.fetch(week, seasontype), weeks)))
+    
+    def _record(self, data, week, seasontype):
+        # Numbered per week, so concurrent fetch_many threads never share a name
+        key = recording_key(week, seasontype)
+        with self.record_lock:
+            os.makedirs(self.record_dir, exist_ok=True)
+            if key not in self.recorded:
+                self.recorded[key] = len(recordings(self.record_dir).get(key, []))
+            self.recorded[key] += 1
+            name = f"{key}-{self.recorded[key]:04d}.json"
+        with open(os.path.join(self.record_dir, name), 'w') as f:
+            json.dump(data, f)
+
+
+class SharedScoreboard:
+    """
+    Wraps a scoreboard so each (week, seasontype) is fetched once per run and
+    the response handed to every caller. Leagues scoring the same slate side
+    by side make one ESPN request per week between them. Not for --watch,
+    which needs a fresh fetch on every poll.
+    """
+    
+    def __init__(self, scoreboard):
+        self.scoreboard = scoreboard
+        self.stats = scoreboard.stats
+        self.responses = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+    
+    def _key_lock(self, key):
+        with self.lock:
+            return self.locks.setdefault(key, threading.Lock())
+    
+    def fetch(self, week=None, seasontype=REGULAR_SEASON):
+        key = (week, seasontype)
+        with self._key_lock(key):
+            if key not in self.responses:
+                self.responses[key] = self.scoreboard.fetch(week, seasontype)
+            return self.responses[key]
+    
+    def fetch_many(self, weeks, seasontype=REGULAR_SEASON):
+        # One backfill at a time; whoever comes next finds its weeks already fetched
+        with self._key_lock('many'):
+            missing = [week for week in weeks if (week, seasontype) not in self.responses]
+            if missing:
+                for week, response in self.scoreboard.fetch_many(missing, seasontype).items():
+                    self.responses[(week, seasontype)] = response
+        return {week: self.responses[(week, seasontype)] for week in weeks}
+    
+    def fetch_calendar(self, season):
+        key = ('calendar', season)
+        with self._key_lock(key):
+            if key not in self.responses:
+                self.responses[key] = self.scoreboard.fetch_calendar(season)
+            return self.responses[key]
+
+
+class FixtureScoreboard:
+    """
+    Replays recorded scoreboard responses from a directory. Each fetch returns
+    the next recording for its (week, seasontype); the last one repeats once
+    they run out (like a scoreboard that stopped changing). A fetch without a
+    week replays the current-week recordings, or every file in filename order
+    if there are none.
+    """
+    
+    def __init__(self, fixture_dir):
+        self.paths = sorted(
+            os.path.join(fixture_dir, name) for name in os.listdir(fixture_dir) if name.endswith('.json')
+        )
+        if not self.paths:
+            raise ValueError(f"No scoreboard fixtures found in {fixture_dir}")
+        self.recordings = recordings(fixture_dir)
+        self.positions = {}
+        self.stats = {'requests': 0, 'not_modified': 0}
+    
+    def fetch(self, week=None, seasontype=REGULAR_SEASON):
+        key = recording_key(week, seasontype)
+        if key in self.recordings:
+            paths = self.recordings[key]
+        elif week is None:
+            key, paths = None, self.paths
+        else:
+            raise ValueError(f"No scoreboard recorded for {key}")
+        self.stats['requests'] += 1
+        position = self.positions.get(key, 0)
+        self.positions[key] = position + 1
+        changed = position < len(paths)
+        path = paths[min(position, len(paths) - 1)]
+        if not changed:
+            self.stats['not_modified'] += 1
+        with open(path, 'r') as f:
+            return json.load(f), changed
+    
+    def fetch_many(self, weeks, seasontype=REGULAR_SEASON):
+        return {week: self.fetch(week, seasontype) for week in weeks}
+    
+    def fetch_calendar(self, season):
+        """The calendar from the first recording that has one (doesn't advance the replay)"""
+        for path in self.paths:
+            with open(path, 'r') as f:
+                leagues = json.load(f).get('leagues') or [{}]
+            if leagues[0].get('calendar'):
+                return leagues[0]['calendar']
+        raise ValueError("No recorded scoreboard includes a calendar")
+
+
+def parse_scoreboard(data, week=None, seasontype=REGULAR_SEASON):
+    """
+    Turn a scoreboard response into game dicts. Scores are filled in for
+    final and in-progress games and left as None for scheduled ones.
+    Postseason weeks are mapped to sheet weeks 19-23.
+    """
+    games = []
+    seasontype = data.get('season', {}).get('type') or seasontype
+    scoreboard_week = week or data.get('week', {}).get('number')
+    
+    for event in data.get('events', []):
+        competitors = event['competitions'][0]['competitors']
+        home = next((c for c in competitors if c.get('homeAway') == 'home'), competitors[0])
+        away = next((c for c in competitors if c.get('homeAway') == 'away'), competitors[1])
+        status = event['status']['type']['name']  # 'STATUS_FINAL', 'STATUS_IN_PROGRESS', etc.
+        
+        game_info = {
+            'espn_id': event.get('id'),
+            'week': sheet_week(event.get('week', {}).get('number', scoreboard_week), seasontype),
+            'seasontype': seasontype,
+            'date': event.get('date', ''),
+            'status': status,
+            'sheet_status': SHEET_STATUS.get(status),
+            'away_team': away['team']['displayName'],
+            'home_team': home['team']['displayName'],
+            'away_code': team_code(away['team'].get('abbreviation')),
+            'home_code': team_code(home['team'].get('abbreviation')),
+            'away_score': None,
+            'home_score': None
+        }
+        
+        if status in SHEET_STATUS:
+            game_info['away_score'] = int(away.get('score') or 0)
+            game_info['home_score'] = int(home.get('score') or 0)
+        
+        games.append(game_info)
+    
+    return games
+
+
+def next_poll_interval(now, kickoffs, live, live_interval=60, idle_interval=6 * 3600,
+                       lead_seconds=300, game_length_seconds=4 * 3600):
+    """
+    Seconds until the next scoreboard poll.
+
+    Poll every live_interval while games are live or a game kicked off
+    recently; otherwise sleep until shortly before the next kickoff,
+    never longer than idle_interval.
+    """
+    if live:
+        return live_interval
+    
+    for kickoff in kickoffs:
+        since_kickoff = (now - kickoff).total_seconds()
+        if 0 <= since_kickoff <= game_length_seconds:
+            return live_interval
+    
+    upcoming = [k for k in kickoffs if k > now]
+    if not upcoming:
+        return idle_interval
+    
+    wait = (min(upcoming) - now).total_seconds() - lead_seconds
+    return int(max(live_interval, min(wait, idle_interval)))
@@ -0,0 +1,157 @@
+"""
+GitHub contents fetcher shared by the sync scripts.
+
+One keep-alive session is reused for every request, files are fetched
+concurrently, and responses are cached on disk by path with their ETag so
+unchanged files come back as 304s (which don't count against the rate limit).
+"""
+import base64
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+from nflpicks.api import ApiClient
+from nflpicks.store import utc_stamp
+
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'github')
+
+
+class GitHubFetcher:
+    def __init__(self, owner, repo, token=None, cache_dir=DEFAULT_CACHE_DIR, max_workers=8, out=None):
+        self.owner = owner
+        self.out = out  # Stream for error messages (None: stdout)
+        self.repo = repo
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.base_url = f"https://api.github.com/repos/{owner}/{repo}"
+        
+        # Paces itself off X-RateLimit-Remaining and records every call in the run report
+        self.client = ApiClient('github', pool_size=max_workers)
+        self.client.headers['Accept'] = 'application/vnd.github.v3+json'
+        if token:
+            self.client.headers['Authorization'] = f'token {token}'
+        
+        self.stats = {'requests': 0, 'not_modified': 0}
+    
+    def _cache_path(self, key):
+        name = hashlib.sha1(f"{self.owner}/{self.repo}/{key}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+    
+    def _read_cache(self, key):
+        try:
+            with open(self._cache_path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+    
+    def _write_cache(self, key, etag, content):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._cache_path(key), 'w') as f:
+            json.dump({'etag': etag, 'content': content}, f)
+    
+    def _get_json(self, url, cache_key, endpoint):
+        """GET a GitHub API URL with If-None-Match, returning (data, from_cache)"""
+        cached = self._read_cache(cache_key)
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        
+        response = self.client.get(url, endpoint, headers=headers)
+        self.stats['requests'] += 1
+        if response.status_code == 304 and cached:
+            self.stats['not_modified'] += 1
+            return cached['content'], True
+        response.raise_for_status()
+        
+        data = response.json()
+        self._write_cache(cache_key, response.headers.get('ETag'), data)
+        return data, False
+    
+    def get_file(self, path):
+        """Get a JSON file from the repo via the contents API"""
+        try:
+            data, _ = self._get_json(f"{self.base_url}/contents/{path}", f"contents/{path}", 'contents')
+            content = base64.b64decode(data['content']).decode('utf-8')
+            return json.loads(content)
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Error fetching {path}: {e}", file=self.out)
+            return None
+        except json.JSONDecodeError as e:
+            print(f"❌ Error parsing {path}: {e}", file=self.out)
+            return None
+    
+    def get_files(self, paths):
+        """Fetch several JSON files concurrently. Returns {path: data or None}"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(paths, pool.map(self.get_file, paths)))
+    
+    def get_files_via_tree(self, paths, ref='HEAD'):
+        """
+        Fetch several JSON files using one Git trees call plus a blob call
+        per file whose SHA isn't already cached. Blobs are content-addressed,
+        so a cached blob never needs revalidating.
+        """
+        try:
+            tree, _ = self._get_json(f"{self.base_url}/git/trees/{ref}?recursive=1", f"trees/{ref}", 'trees')
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Error fetching repo tree: {e}", file=self.out)
+            return {path: None for path in paths}
+        
+        blob_shas = {item['path']: item['sha'] for item in tree.get('tree', []) if item.get('type') == 'blob'}
+        
+        def fetch_blob(path):
+            sha = blob_shas.get(path)
+            if not sha:
+                return None
+            cached = self._read_cache(f"blobs/{sha}")
+            try:
+                if cached:
+                    data = cached['content']
+                else:
+                    response = self.client.get(f"{self.base_url}/git/blobs/{sha}", 'blobs')
+                    self.stats['requests'] += 1
+                    response.raise_for_status()
+                    data = response.json()
+                    self._write_cache(f"blobs/{sha}", None, data)
+                return json.loads(base64.b64decode(data['content']).decode('utf-8'))
+            except requests.exceptions.RequestException as e:
+                print(f"❌ Error fetching {path}: {e}", file=self.out)
+                return None
+            except json.JSONDecodeError as e:
+                print(f"❌ Error parsing {path}: {e}", file=self.out)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(paths, pool.map(fetch_blob, paths)))
+    
+    def file_history(self, path, since=None):
+        """[(committed_at, sha)] for commits touching path (a file or folder), oldest first"""
+        url = f"{self.base_url}/commits?path={path}&per_page=100"
+        if since:
+            url += f"&since={utc_stamp(since)}"
+        try:
+            commits, _ = self._get_json(url, f"commits/{path}@{utc_stamp(since) if since else ''}", 'commits')
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Error fetching history of {path}: {e}", file=self.out)
+            return []
+        history = [
+            (datetime.fromisoformat(c['commit']['committer']['date'].replace('Z', '+00:00')), c['sha'])
+            for c in commits
+        ]
+        return sorted(history)
+    
+    def get_file_at(self, path, ref):
+        """A JSON file as of a commit. Commits are immutable, so this is cached for good."""
+        try:
+            data, _ = self._get_json(f"{self.base_url}/contents/{path}?ref={ref}", f"contents/{path}@{ref}", 'contents')
+            return json.loads(base64.b64decode(data['content']).decode('utf-8'))
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Error fetching {path} at {ref[:7]}: {e}", file=self.out)
+            return None
+        except json.JSONDecodeError as e:
+            print(f"❌ Error parsing {path} at {ref[:7]}: {e}", file=self.out)
+            return None
@@ -0,0 +1,179 @@
+"""
+League registry: several pools picking the same slate.
+
+leagues.json lists each league's roster config, Google Sheet, picks folder
+and season store:
+
+    {
+      "max_parallel": 4,
+      "leagues": [
+        {"name": "family", "config": "config.json", "sheet_id_env": "GOOGLE_SHEET_ID",
+         "picks_dir": "picks", "store": "seasons"},
+        {"name": "office", "sheet_id": "1AbC...", "repo": "someone/office-picks"}
+      ]
+    }
+
+Paths left out default to leagues/<name>/config.json, leagues/<name>/picks
+and leagues/<name>/seasons; repo defaults to GITHUB_REPO_OWNER/NAME. Without
+leagues.json there is one league built from config.json and GOOGLE_SHEET_ID,
+exactly as before.
+
+The slate is league-agnostic: scrape.py fetches games.json once and writes
+it through to every league's store. sync and score then run each league as
+its own job, at most max_parallel at a time, sharing one Sheets
+authorization and quota, one read of games.json and one ESPN scoreboard
+fetch per week (see SharedServices).
+"""
+import io
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from nflpicks.api import SHEETS_BURST, SHEETS_RATE, TokenBucket
+from nflpicks.config import CONFIG_FILE, load_config, load_players
+from nflpicks.store import DEFAULT_ROOT, SeasonStore
+
+LEAGUES_FILE = 'leagues.json'
+DEFAULT_PARALLEL = 4
+DEFAULT_REPO_OWNER = 'jmhale15'
+DEFAULT_REPO_NAME = 'nfl-picks'
+
+
+def main_repo():
+    """(owner, name) of the repo scrape.py pushes the slate to"""
+    return (os.getenv('GITHUB_REPO_OWNER', DEFAULT_REPO_OWNER),
+            os.getenv('GITHUB_REPO_NAME', DEFAULT_REPO_NAME))
+
+
+class League:
+    def __init__(self, name, config_file=CONFIG_FILE, sheet_id=None, picks_dir='picks', repo=None,
+                 store_root=DEFAULT_ROOT):
+        self.name = name
+        self.config_file = config_file
+        self.config = load_config(config_file)
+        self.players = load_players(self.config)
+        self.sheet_id = sheet_id
+        self.picks_dir = picks_dir
+        self.store_root = store_root
+        owner, _, repo_name = (repo or '').partition('/')
+        default_owner, default_name = main_repo()
+        self.repo_owner = owner or default_owner
+        self.repo_name = repo_name or default_name
+    
+    @classmethod
+    def default(cls):
+        """The single league of a checkout without leagues.json"""
+        return cls('default', sheet_id=os.getenv('GOOGLE_SHEET_ID'))
+    
+    @classmethod
+    def from_entry(cls, entry):
+        """A league from one leagues.json entry, defaulting its paths under leagues/<name>/"""
+        name = entry['name']
+        home = os.path.join('leagues', name)
+        sheet_id = entry.get('sheet_id') or (os.getenv(entry['sheet_id_env']) if entry.get('sheet_id_env') else None)
+        return cls(
+            name,
+            config_file=entry.get('config', os.path.join(home, CONFIG_FILE)),
+            sheet_id=sheet_id,
+            picks_dir=entry.get('picks_dir', f"{home}/picks"),
+            repo=entry.get('repo'),
+            store_root=entry.get('store', os.path.join(home, DEFAULT_ROOT)),
+        )
+    
+    @property
+    def season(self):
+        return self.config['current_season']
+    
+    def store(self):
+        return SeasonStore(self.season, root=self.store_root)
+    
+    def picks_path(self, player):
+        """Path of a player's picks file in the league's repo or checkout"""
+        return f"{self.picks_dir}/{player}.json"
+    
+    def uses_main_repo(self):
+        return (self.repo_owner, self.repo_name) == main_repo()
+
+
+def load_leagues(path=LEAGUES_FILE):
+    """
+    Return (leagues, max_parallel) from leagues.json, or the single default
+    league if there is no registry. Raises ValueError if two leagues would
+    share a picks folder or season store.
+    """
+    try:
+        with open(path, 'r') as f:
+            registry = json.load(f)
+    except FileNotFoundError:
+        return [League.default()], 1
+    
+    leagues = [League.from_entry(entry) for entry in registry.get('leagues', [])]
+    if not leagues:
+        raise ValueError(f"{path} doesn't list any leagues")
+    for attribute in ('name', 'picks_dir', 'store_root'):
+        values = [os.path.normpath(getattr(league, attribute)) for league in leagues]
+        if len(set(values)) != len(values):
+            raise ValueError(f"Leagues in {path} must each have their own {attribute}")
+    return leagues, registry.get('max_parallel', DEFAULT_PARALLEL)
+
+
+def select_leagues(leagues, names=None):
+    """The leagues named in names (all of them if none are given)"""
+    if not names:
+        return leagues
+    by_name = {league.name: league for league in leagues}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown league(s): {', '.join(unknown)} (known: {', '.join(by_name)})")
+    return [by_name[name] for name in names]
+
+
+class SharedServices:
+    """
+    What every league in one run shares: a single Sheets token bucket (the
+    quota belongs to the service account, not the sheet), values loaded once
+    for all of them (the Sheets authorization, games.json) and the scoreboard.
+    """
+    
+    def __init__(self, scoreboard=None):
+        self.sheets_bucket = TokenBucket(SHEETS_RATE, SHEETS_BURST)
+        self.scoreboard = scoreboard
+        self._values = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+    
+    def once(self, key, load):
+        """load() the first time key is asked for; every later caller gets the same value"""
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._values:
+                self._values[key] = load()
+            return self._values[key]
+
+
+def run_leagues(leagues, job, max_parallel=DEFAULT_PARALLEL):
+    """
+    Run job(league, out) for every league, at most max_parallel at a time.
+    out is the stream the job (and the fetchers and meters it creates) should
+    print to. A single league prints straight to stdout (out is None); with
+    several, each league gets its own buffer, printed as one block when its
+    job finishes. Returns {league name: job's return value}.
+    """
+    if len(leagues) == 1:
+        return {leagues[0].name: job(leagues[0], None)}
+    
+    print_lock = threading.Lock()
+    
+    def run(league):
+        out = io.StringIO()
+        try:
+            return job(league, out)
+        finally:
+            with print_lock:
+                print(f"\n🏟️  League: {league.name}\n{out.getvalue()}", end='', flush=True)
+    
+    print(f"🏟️  Running {len(leagues)} leagues, {min(max_parallel, len(leagues))} at a time")
+    with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as pool:
+        return dict(zip((league.name for league in leagues), pool.map(run, leagues)))
@@ -0,0 +1,71 @@
+"""
+Local-checkout fetcher with the same interface as GitHubFetcher.
+
+Reads games.json and picks/*.json straight from the working tree, optionally
+after a `git pull`, so sync works offline and without any HTTP round trips.
+"""
+import json
+import os
+import subprocess
+from datetime import datetime
+
+
+class LocalFetcher:
+    def __init__(self, root='.', pull=False, out=None):
+        self.root = root
+        self.out = out  # Stream for progress and error messages (None: stdout)
+        self.stats = {'requests': 0, 'not_modified': 0}
+        if pull:
+            self.pull()
+    
+    def pull(self):
+        """Fast-forward the checkout so it has the latest committed picks"""
+        print("⬇️  Pulling latest picks with git pull...", file=self.out)
+        result = subprocess.run(
+            ['git', 'pull', '--ff-only', '--quiet'],
+            cwd=self.root, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(f"⚠️  git pull failed, using files as they are: {result.stderr.strip()}", file=self.out)
+    
+    def get_file(self, path):
+        """Read a JSON file from the working tree"""
+        try:
+            with open(os.path.join(self.root, path), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            print(f"❌ Error fetching {path}: not found in {os.path.abspath(self.root)}", file=self.out)
+            return None
+        except json.JSONDecodeError as e:
+            print(f"❌ Error parsing {path}: {e}", file=self.out)
+            return None
+    
+    def get_files(self, paths):
+        """Read several JSON files. Returns {path: data or None}"""
+        return {path: self.get_file(path) for path in paths}
+    
+    def file_history(self, path, since=None):
+        """[(committed_at, sha)] for commits touching path (a file or folder), oldest first"""
+        command = ['git', 'log', '--format=%H %cI']
+        if since:
+            command.append(f"--since={since.isoformat()}")
+        result = subprocess.run(command + ['--', path], cwd=self.root, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"⚠️  git log failed for {path}: {result.stderr.strip()}", file=self.out)
+            return []
+        history = []
+        for line in result.stdout.splitlines():
+            sha, _, committed_at = line.partition(' ')
+            history.append((datetime.fromisoformat(committed_at), sha))
+        return sorted(history)
+    
+    def get_file_at(self, path, ref):
+        """A JSON file as of a commit, via git show"""
+        result = subprocess.run(['git', 'show', f"{ref}:{path}"], cwd=self.root, capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        try:
+            return json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            print(f"❌ Error parsing {path} at {ref[:7]}: {e}", file=self.out)
+            return None
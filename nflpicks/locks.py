@@ -0,0 +1,111 @@
+"""
+Pick locks: a game can't be picked once it has kicked off.
+
+The lock index maps each game id to its kickoff as a UTC epoch second, so
+checking a pick is one dict lookup. build_bundle ships it as
+ui/data/locks.json for the picks page and the save-picks Netlify function,
+and sync applies the same index to the committed history of each picks file:
+for a started game, the pick that counts is the one in the last commit made
+before kickoff.
+"""
+import bisect
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from nflpicks.schedule import kickoff_time
+
+LOCKS_FILE = 'locks.json'
+
+
+def lock_index(games_data):
+    """{game_id: kickoff epoch seconds} for every game in a games.json payload"""
+    locks = {}
+    for game in games_data.get('games', []):
+        try:
+            locks[game['id']] = int(kickoff_time(game['game_date']).timestamp())
+        except (KeyError, ValueError):
+            continue
+    return locks
+
+
+def write_locks(games_data, data_dir):
+    """Write locks.json (week, roster and lock index) next to the site bundle"""
+    path = os.path.join(data_dir, LOCKS_FILE)
+    os.makedirs(data_dir, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({
+            'week': games_data.get('week'),
+            'players': games_data.get('players', []),
+            'locks': lock_index(games_data)
+        }, f, separators=(',', ':'))
+    return path
+
+
+def is_locked(locks, game_id, when):
+    """True if game_id had kicked off at `when` (an aware datetime)"""
+    kickoff = locks.get(game_id)
+    return kickoff is not None and when.timestamp() >= kickoff
+
+
+def same_pick(a, b):
+    """True if two picks choose the same sides, whenever each was made"""
+    a, b = a or {}, b or {}
+    return a.get('spread') == b.get('spread') and a.get('total') == b.get('total')
+
+
+def history_window(games_data):
+    """
+    Start of the commit history worth reading for a week's picks: a week
+    before week_start, since picks are usually made before the Thursday game
+    """
+    try:
+        week_start = datetime.strptime(games_data['week_start'], '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    except (KeyError, TypeError, ValueError):
+        return None
+    return week_start - timedelta(days=7)
+
+
+def enforce_locks(path, picks_data, locks, source, since=None):
+    """
+    Return (picks, late) for a player's committed picks file.
+
+    Every game that kicked off before the file's latest commit gets the pick
+    from the last commit before its kickoff: a changed pick is replaced, a
+    removed one is restored, and one first made after kickoff is dropped.
+    Games whose pick changed are listed in `late`. source is a fetcher with
+    file_history(path, since) and get_file_at(path, ref).
+    """
+    picks = picks_data.get('picks', {})
+    history = source.file_history(path, since)
+    if not history:
+        return picks, []
+
+    commit_times = [committed_at.timestamp() for committed_at, _ in history]
+    latest = commit_times[-1]
+    versions = {}
+
+    def picks_at(index):
+        ref = history[index][1]
+        if ref not in versions:
+            data = source.get_file_at(path, ref) or {}
+            versions[ref] = data.get('picks', {}) if data.get('week') == picks_data.get('week') else {}
+        return versions[ref]
+
+    # Started games without a pick now may have had one before kickoff
+    started = [game_id for game_id, kickoff in locks.items() if kickoff <= latest and game_id not in picks]
+    kept, late = {}, []
+    for game_id in list(picks) + started:
+        pick = picks.get(game_id)
+        kickoff = locks.get(game_id)
+        if kickoff is None or latest < kickoff:
+            kept[game_id] = pick
+            continue
+        # Last commit strictly before kickoff
+        index = bisect.bisect_left(commit_times, kickoff) - 1
+        earlier = picks_at(index).get(game_id) if index >= 0 else None
+        if earlier:
+            kept[game_id] = earlier
+        if not same_pick(earlier, pick):
+            late.append(game_id)
+    return kept, late
@@ -0,0 +1,247 @@
+"""
+Monte Carlo projection of who finishes first, from the current lines.
+
+Each simulation draws a final score for every game that hasn't been graded:
+
+    away - home margin ~ round(Normal(-away_spread, SPREAD_SD))
+    total points       ~ round(Normal(over_under, TOTAL_SD))
+
+so a pick wins about half the time and whole-number lines can push. Every
+player shares the same simulated games, so players on the same side win
+and lose together. Each line's result is reduced to two 0/1 columns (the
+away/over side covered, it pushed) and each player's points are a matrix
+product with per-player coefficients built from their picks:
+
+    points (sims x players) = covered (sims x lines) @ A + pushed @ B + C
+
+Season projections also play out the weeks not yet scraped, as independent
+picks won at each player's season win rate (pulled toward 50%).
+Simulations run in chunks; workers > 1 spreads them over a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from nflpicks.scoring import DEFAULT_POINTS
+
+# Standard deviation of NFL results around the closing spread and total
+SPREAD_SD = 13.5
+TOTAL_SD = 13.0
+DEFAULT_SIMULATIONS = 100_000
+CHUNK_SIZE = 25_000
+# Picks' worth of 50% win rate mixed into each player's season record
+WIN_RATE_PRIOR = 20
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def build_projection_arrays(games, scores, all_picks, players, points=DEFAULT_POINTS):
+    """
+    Lay out the games still to be graded for simulation.
+    
+    games: games.json game dicts; those in scores (already final) are skipped
+    all_picks: {player: {game_id: {'spread': team, 'total': 'over'|'under'}}}
+    Returns the games plus their lines, and the A/B (lines x players) and
+    C (players) coefficients turning simulated results into points.
+    """
+    remaining = [g for g in games if g['id'] not in scores]
+    spread = np.array([_to_float(g.get('away_odds')) for g in remaining], dtype=np.float32)
+    total = np.array([_to_float(g.get('over_under')) for g in remaining], dtype=np.float32)
+    
+    # Rows: every game's spread line, then every game's total line
+    picks = np.zeros((2 * len(remaining), len(players)), dtype=np.int8)
+    for p, player in enumerate(players):
+        player_picks = all_picks.get(player, {})
+        for g, game in enumerate(remaining):
+            pick = player_picks.get(game['id'], {})
+            if pick.get('spread') == game['away_team']:
+                picks[g, p] = 1
+            elif pick.get('spread') == game['home_team']:
+                picks[g, p] = -1
+            if pick.get('total') == 'over':
+                picks[len(remaining) + g, p] = 1
+            elif pick.get('total') == 'under':
+                picks[len(remaining) + g, p] = -1
+    # A game without a line can't be graded, so its picks score nothing
+    picks[np.isnan(np.concatenate([spread, total]))] = 0
+    
+    win, push, loss = points['win'], points['push'], points['loss']
+    away_over, home_under = picks == 1, picks == -1
+    return {
+        'games': remaining,
+        'spread': np.nan_to_num(spread),
+        'total': np.nan_to_num(total),
+        'covered': np.select([away_over, home_under], [win - loss, loss - win], 0).astype(np.float32),
+        'pushed': np.select([away_over, home_under], [push - loss, push - win], 0).astype(np.float32),
+        'base': np.select([away_over, home_under], [loss, win], 0).sum(axis=0).astype(np.float32),
+        'future_picks': 0,
+        'win_rate': np.full(len(players), 0.5),
+        'points': (win, loss),
+    }
+
+
+def simulate_points(arrays, simulations, rng):
+    """Points each player scores from the remaining games in each simulation (sims x players)"""
+    n_games = len(arrays['games'])
+    points = np.broadcast_to(arrays['base'], (simulations, len(arrays['base']))).copy()
+    if n_games:
+        margin = np.rint(rng.standard_normal((simulations, n_games), dtype=np.float32) * SPREAD_SD - arrays['spread'])
+        total = np.rint(rng.standard_normal((simulations, n_games), dtype=np.float32) * TOTAL_SD + arrays['total'])
+        results = np.concatenate([margin + arrays['spread'], total - arrays['total']], axis=1)  # sims x lines
+        points += (results > 0).astype(np.float32) @ arrays['covered']
+        points += (results == 0).astype(np.float32) @ arrays['pushed']
+    
+    if arrays['future_picks']:
+        win, loss = arrays['points']
+        wins = rng.binomial(arrays['future_picks'], arrays['win_rate'], size=points.shape)
+        points += win * wins + loss * (arrays['future_picks'] - wins)
+    return points
+
+
+def first_place_shares(totals):
+    """Each player's share of first place per simulation; ties split it evenly"""
+    top = totals >= totals.max(axis=1, keepdims=True)
+    return top / top.sum(axis=1, keepdims=True)
+
+
+def _run_chunk(arrays, current, simulations, seed):
+    totals = current + simulate_points(arrays, simulations, np.random.default_rng(seed))
+    return first_place_shares(totals).sum(axis=0), totals.sum(axis=0)
+
+
+def run_simulations(arrays, current, simulations=DEFAULT_SIMULATIONS, seed=None, workers=1):
+    """
+    Simulate in chunks of CHUNK_SIZE, across a process pool when workers > 1.
+    Returns (chance of finishing first, expected points), one entry per player.
+    """
+    sizes = [CHUNK_SIZE] * (simulations // CHUNK_SIZE)
+    if simulations % CHUNK_SIZE:
+        sizes.append(simulations % CHUNK_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    chunks = ([arrays] * len(sizes), [current] * len(sizes), sizes, seeds)
+    
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_chunk, *chunks))
+    else:
+        parts = list(map(_run_chunk, *chunks))
+    
+    first = sum(part[0] for part in parts) / simulations
+    expected = sum(part[1] for part in parts) / simulations
+    return first, expected
+
+
+def season_win_rates(totals, players):
+    """Each player's chance of winning a future pick: season W/(W+L), pulled toward 50%"""
+    rates = []
+    for player in players:
+        record = totals.get(player, {})
+        wins = sum(record.get(pick_type, {}).get('win', 0) for pick_type in ('spread', 'total'))
+        losses = sum(record.get(pick_type, {}).get('loss', 0) for pick_type in ('spread', 'total'))
+        rates.append((wins + WIN_RATE_PRIOR / 2) / (wins + losses + WIN_RATE_PRIOR))
+    return np.array(rates)
+
+
+def week_points(week_results, players):
+    """Points each player has already scored in a week's graded results"""
+    earned = dict.fromkeys(players, 0)
+    for game_results in week_results.values():
+        for player, graded in game_results.items():
+            if player in earned:
+                earned[player] += sum(graded[pick_type]['points'] or 0 for pick_type in ('spread', 'total'))
+    return earned
+
+
+def project(games, scores, all_picks, players, current_points, points=DEFAULT_POINTS, future_picks=0,
+            win_rates=None, simulations=DEFAULT_SIMULATIONS, seed=None, workers=1):
+    """
+    Chance of finishing first and expected points for each player, starting
+    from current_points ({player: points}) and simulating the games in
+    `games` that aren't in scores, plus future_picks more picks per player
+    won at win_rates.
+    """
+    arrays = build_projection_arrays(games, scores, all_picks, players, points)
+    if future_picks:
+        arrays['future_picks'] = future_picks
+        arrays['win_rate'] = win_rates if win_rates is not None else np.full(len(players), 0.5)
+    current = np.array([current_points.get(player, 0) for player in players], dtype=np.float32)
+    first, expected = run_simulations(arrays, current, simulations, seed, workers)
+    
+    table = [
+        {
+            'player': player,
+            'points': float(current[p]),
+            'expected_points': round(float(expected[p]), 2),
+            'win_probability': round(float(first[p]), 4),
+        }
+        for p, player in enumerate(players)
+    ]
+    table.sort(key=lambda row: (-row['win_probability'], -row['expected_points'], row['player']))
+    return {
+        'simulations': simulations,
+        'remaining_games': len(arrays['games']),
+        'future_picks': future_picks,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'table': table,
+    }
+
+
+def project_standings(store, standings, players, points=DEFAULT_POINTS, regular_season_weeks=18,
+                      simulations=DEFAULT_SIMULATIONS, seed=None, workers=1, scores=None, results=None):
+    """
+    Week and season projections for the latest stored week, from the season
+    store and the running Standings. Returns {'week', 'week_projection', 'season_projection'},
+    or None if no week is stored yet. scores ({week: scores}) and results
+    ({week: week_results}) stand in for unsaved ones, e.g. in a dry run.
+    """
+    weeks = store.weeks()
+    if not weeks:
+        return None
+    week = weeks[-1]
+    games = (store.load_games(week) or {}).get('games', [])
+    week_scores = (scores or {}).get(week)
+    if week_scores is None:
+        week_scores = store.load_scores(week)
+    week_results = (results or {}).get(week)
+    if week_results is None:
+        week_results = store.load_results(week)
+    all_picks = {player: picks_data.get('picks', {}) for player, picks_data in store.load_picks(week).items()}
+    earned = week_points(week_results, players)
+    
+    week_projection = project(games, week_scores, all_picks, players, earned, points,
+                              simulations=simulations, seed=seed, workers=workers)
+    
+    # Season points already include this week's graded games
+    season_points = {player: standings.totals.get(player, {}).get('points', 0) for player in players}
+    weeks_left = max(regular_season_weeks - int(week), 0)
+    season_projection = project(games, week_scores, all_picks, players, season_points, points,
+                                future_picks=weeks_left * len(games) * 2,
+                                win_rates=season_win_rates(standings.totals, players),
+                                simulations=simulations, seed=seed, workers=workers)
+    return {'week': int(week), 'week_projection': week_projection, 'season_projection': season_projection}
+
+
+def sheet_rows(projection):
+    """The 'Projection' tab: chance of first and expected points, this week and for the season"""
+    week_rows = {row['player']: row for row in projection['week_projection']['table']}
+    header = ['Player', 'Season Points', f"Week {projection['week']} Chance of 1st",
+              f"Week {projection['week']} Projected", 'Season Chance of 1st', 'Season Projected']
+    rows = [header]
+    for row in projection['season_projection']['table']:
+        week_row = week_rows[row['player']]
+        rows.append([
+            row['player'].title(), row['points'],
+            f"{week_row['win_probability']:.1%}", week_row['expected_points'],
+            f"{row['win_probability']:.1%}", row['expected_points'],
+        ])
+    season = projection['season_projection']
+    rows.append([])
+    rows.append([f"{season['simulations']:,} simulations of {season['remaining_games']} remaining games "
+                 f"and {season['future_picks']} future picks each, {season['generated_at']}"])
+    return rows
@@ -0,0 +1,180 @@
+"""
+Kickoff times for games.json games, and the season calendar that maps
+times and games to weeks
+"""
+import bisect
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import requests
+
+from nflpicks.espn import POSTSEASON, POSTSEASON_WEEKS, REGULAR_SEASON, REGULAR_SEASON_WEEKS, sheet_week
+
+# OddsShark event dates (games.json game_date) are US Eastern wall-clock times
+GAME_TIMEZONE = ZoneInfo('America/New_York')
+
+
+def kickoff_time(game_date):
+    """Parse a games.json game_date ('YYYY-MM-DD HH:MM', Eastern) to an aware datetime"""
+    return datetime.strptime(game_date, '%Y-%m-%d %H:%M').replace(tzinfo=GAME_TIMEZONE)
+
+
+def load_kickoffs(games_data):
+    """Sorted kickoff datetimes for every game in a games.json payload"""
+    kickoffs = []
+    for game in games_data.get('games', []):
+        try:
+            kickoffs.append(kickoff_time(game['game_date']))
+        except (KeyError, ValueError):
+            continue
+    return sorted(kickoffs)
+
+
+def _parse_instant(value):
+    """ESPN calendar times ('2025-09-03T07:00Z') and our ISO strings to aware UTC datetimes"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone(timezone.utc)
+
+
+def _espn_week(entry, seasontype):
+    return {
+        'seasontype': seasontype,
+        'week': int(entry['value']),
+        'label': entry.get('label') or f"Week {entry['value']}",
+        'start': _parse_instant(entry['startDate']).isoformat(),
+        'end': _parse_instant(entry['endDate']).isoformat(),
+    }
+
+
+class SeasonCalendar:
+    """
+    The season's week boundaries: [{seasontype, week, label, start, end}],
+    start/end as UTC ISO strings. Lookups by time bisect the week starts, so
+    scrape, score and the site all place a game in the same week. Weeks are
+    keyed by sheet week (playoffs are 19-23, see nflpicks.espn.sheet_week).
+    """
+    
+    def __init__(self, weeks, source=None):
+        self.weeks = sorted(weeks, key=lambda w: w['start'])
+        self.source = source
+        self.starts = [_parse_instant(w['start']).timestamp() for w in self.weeks]
+        self.ends = [_parse_instant(w['end']).timestamp() for w in self.weeks]
+        self.by_sheet_week = {sheet_week(w['week'], w['seasontype']): w for w in self.weeks}
+    
+    @classmethod
+    def from_espn(cls, calendar):
+        """Build from a scoreboard response's leagues[0].calendar (regular season and playoffs)"""
+        weeks = []
+        for season_part in calendar:
+            seasontype = int(season_part.get('value', 0))
+            if seasontype not in (REGULAR_SEASON, POSTSEASON):
+                continue  # Preseason and off-season
+            for entry in season_part.get('entries', []):
+                if seasontype == POSTSEASON and int(entry['value']) not in POSTSEASON_WEEKS:
+                    continue  # Pro Bowl
+                weeks.append(_espn_week(entry, seasontype))
+        if not weeks:
+            raise ValueError("ESPN calendar has no regular season or playoff weeks")
+        return cls(weeks, source='espn')
+    
+    @classmethod
+    def from_config(cls, season_start, regular_weeks=len(REGULAR_SEASON_WEEKS)):
+        """
+        Fallback when ESPN's calendar isn't available: Thursday-to-Wednesday
+        weeks from season_start_date, then the playoff weeks straight after
+        """
+        first_thursday = season_start - timedelta(days=season_start.weekday()) + timedelta(days=3)
+        first_thursday = first_thursday.replace(hour=0, minute=0, second=0, microsecond=0)
+        slots = [(REGULAR_SEASON, week) for week in range(1, regular_weeks + 1)]
+        slots += [(POSTSEASON, week) for week in range(1, max(POSTSEASON_WEEKS) + 1)]
+        weeks = []
+        for offset, (seasontype, week) in enumerate(slots):
+            if seasontype == POSTSEASON and week not in POSTSEASON_WEEKS:
+                continue  # Keep the Pro Bowl's gap before the Super Bowl
+            start = (first_thursday + timedelta(weeks=offset)).replace(tzinfo=GAME_TIMEZONE)
+            end = start + timedelta(days=6, hours=23, minutes=59)
+            weeks.append({
+                'seasontype': seasontype,
+                'week': week,
+                'label': f"Week {week}" if seasontype == REGULAR_SEASON else f"Playoffs Week {week}",
+                'start': start.astimezone(timezone.utc).isoformat(),
+                'end': end.astimezone(timezone.utc).isoformat(),
+            })
+        return cls(weeks, source='config')
+    
+    @classmethod
+    def from_json(cls, data):
+        return cls(data.get('weeks', []), source=data.get('source'))
+    
+    def to_json(self):
+        return {'source': self.source, 'weeks': self.weeks}
+    
+    def entry_at(self, when):
+        """
+        The week containing `when` (an aware datetime). Before the season this
+        is the first week, between weeks the next one, after it the last one.
+        """
+        if not self.weeks:
+            return None
+        moment = when.timestamp()
+        index = bisect.bisect_right(self.starts, moment) - 1
+        if index < 0:
+            return self.weeks[0]
+        if moment > self.ends[index] and index + 1 < len(self.weeks):
+            return self.weeks[index + 1]
+        return self.weeks[index]
+    
+    def week_at(self, when):
+        """Sheet week for a moment in time"""
+        entry = self.entry_at(when)
+        return sheet_week(entry['week'], entry['seasontype']) if entry else None
+    
+    def week_of_game(self, game_id):
+        """Sheet week of a game id (or game_date), from the kickoff it ends with"""
+        return self.week_at(kickoff_time(game_id.rsplit('_', 1)[-1]))
+    
+    def espn_week(self, week):
+        """(seasontype, ESPN week) for a sheet week, or None if it isn't in the calendar"""
+        entry = self.by_sheet_week.get(int(week))
+        return (entry['seasontype'], entry['week']) if entry else None
+    
+    def window(self, week):
+        """(start, end) aware UTC datetimes of a sheet week, or None"""
+        entry = self.by_sheet_week.get(int(week))
+        return (_parse_instant(entry['start']), _parse_instant(entry['end'])) if entry else None
+    
+    def local_window(self, week):
+        """A sheet week's (start, end) as naive Eastern times, matching OddsShark event dates"""
+        window = self.window(week)
+        if not window:
+            return None
+        return tuple(moment.astimezone(GAME_TIMEZONE).replace(tzinfo=None) for moment in window)
+    
+    def label(self, week):
+        entry = self.by_sheet_week.get(int(week))
+        return entry['label'] if entry else f"Week {week}"
+
+
+def load_calendar(store, season_start, scoreboard=None, cache=True):
+    """
+    The season calendar, from seasons/<year>/calendar.json when cached.
+    Otherwise it's fetched once from ESPN (through scoreboard.fetch_calendar)
+    and cached (unless cache is False, as in a dry run); if that fails, weeks
+    are derived from season_start and not cached, so the next run tries ESPN
+    again. None if there's no season_start to fall back on.
+    """
+    cached = store.load_calendar()
+    if cached.get('weeks'):
+        return SeasonCalendar.from_json(cached)
+    
+    if scoreboard is not None:
+        try:
+            calendar = SeasonCalendar.from_espn(scoreboard.fetch_calendar(store.season))
+            if cache:
+                store.save_calendar(calendar.to_json())
+                print(f"🗓️  Cached the {store.season} season calendar ({len(calendar.weeks)} weeks)")
+            return calendar
+        except (requests.exceptions.RequestException, KeyError, TypeError, ValueError) as e:
+            print(f"⚠️  Couldn't load ESPN's season calendar ({e}), using season_start_date")
+    if season_start is None:
+        return None
+    return SeasonCalendar.from_config(season_start)
@@ -0,0 +1,169 @@
+"""
+Spread and over/under grading for every pick, computed locally.
+
+Games, players and pick types are laid out as arrays so a whole season is
+graded in one vectorized pass:
+
+    spread margin (players x games) = away_score + away_spread - home_score
+    total margin  (players x games) = away_score + home_score - over_under
+    picks         (players x games) = +1 away/over, -1 home/under, 0 no pick
+    result        = sign(margin) * pick   ->  1 win, 0 push, -1 loss
+
+Lines are per player so each pick can be graded against the line that was
+showing when it was made (see SeasonStore.pick_lines); games without a
+recorded line fall back to the line in games.json.
+
+Points per outcome come from the "scoring" block in config.json, if present.
+"""
+import csv
+import json
+import os
+
+import numpy as np
+
+DEFAULT_POINTS = {'win': 1, 'push': 0, 'loss': 0}
+
+WIN, PUSH, LOSS = 1, 0, -1
+OUTCOMES = {WIN: 'win', PUSH: 'push', LOSS: 'loss'}
+
+
+def load_points(config_file='config.json'):
+    """Return points per outcome, overridden by config.json "scoring" if set"""
+    points = dict(DEFAULT_POINTS)
+    try:
+        with open(config_file, 'r') as f:
+            points.update(json.load(f).get('scoring', {}))
+    except FileNotFoundError:
+        pass
+    return points
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def build_arrays(games, scores, all_picks, players, pick_lines=None):
+    """
+    Lay out graded games as arrays.
+
+    games: list of games.json game dicts (only those with a final score are kept)
+    scores: {game_id: {'away_score', 'home_score'}}
+    all_picks: {player: {game_id: {'spread': team, 'total': 'over'|'under'}}}
+    pick_lines: optional {player: {game_id: {'away_odds', 'over_under'}}} overriding
+    the games.json line for individual picks
+    """
+    graded = [g for g in games if g['id'] in scores]
+    n_games = len(graded)
+    
+    away_score = np.array([scores[g['id']]['away_score'] for g in graded], dtype=float)
+    home_score = np.array([scores[g['id']]['home_score'] for g in graded], dtype=float)
+    game_spread = np.array([_to_float(g.get('away_odds')) for g in graded], dtype=float)
+    game_total = np.array([_to_float(g.get('over_under')) for g in graded], dtype=float)
+    away_spread = np.tile(game_spread, (len(players), 1))
+    over_under = np.tile(game_total, (len(players), 1))
+    
+    spread_picks = np.zeros((len(players), n_games), dtype=np.int8)
+    total_picks = np.zeros((len(players), n_games), dtype=np.int8)
+    for p, player in enumerate(players):
+        player_picks = all_picks.get(player, {})
+        player_lines = (pick_lines or {}).get(player, {})
+        for g, game in enumerate(graded):
+            line = player_lines.get(game['id'])
+            if line:
+                away_spread[p, g] = _to_float(line.get('away_odds'))
+                over_under[p, g] = _to_float(line.get('over_under'))
+            
+            pick = player_picks.get(game['id'], {})
+            if pick.get('spread') == game['away_team']:
+                spread_picks[p, g] = 1
+            elif pick.get('spread') == game['home_team']:
+                spread_picks[p, g] = -1
+            if pick.get('total') == 'over':
+                total_picks[p, g] = 1
+            elif pick.get('total') == 'under':
+                total_picks[p, g] = -1
+    
+    return {
+        'games': graded,
+        'spread_margin': away_score + away_spread - home_score,  # players x games
+        'total_margin': away_score + home_score - over_under,
+        'spread_picks': spread_picks,
+        'total_picks': total_picks,
+    }
+
+
+def grade(arrays, points=DEFAULT_POINTS):
+    """
+    Grade every pick at once.
+    Returns (outcomes, awarded): both players x games x 2 (spread, total).
+    Outcomes are WIN/PUSH/LOSS, with no pick (or no line) left as NaN.
+    """
+    margins = np.stack([arrays['spread_margin'], arrays['total_margin']], axis=-1)  # players x games x 2
+    picks = np.stack([arrays['spread_picks'], arrays['total_picks']], axis=-1)  # players x games x 2
+    
+    outcomes = np.sign(margins) * picks
+    outcomes[(picks == 0) | np.isnan(margins)] = np.nan
+    
+    awarded = np.select(
+        [outcomes == WIN, outcomes == PUSH, outcomes == LOSS],
+        [points['win'], points['push'], points['loss']],
+        default=np.nan
+    )
+    return outcomes, awarded
+
+
+def grade_season(weeks, players, points=DEFAULT_POINTS, pick_lines=None):
+    """
+    Grade several weeks in one pass.
+
+    weeks: iterable of (week, games_data, {player: picks_data}, scores) as
+    yielded by SeasonStore.history()
+    pick_lines: optional {player: {game_id: line}} (game ids are unique across weeks)
+    Returns {week: {game_id: {player: {'spread': {...}, 'total': {...}}}}}
+    """
+    games, scores, all_picks, game_weeks = [], {}, {player: {} for player in players}, []
+    for week, games_data, week_picks, week_scores in weeks:
+        if not games_data or not week_scores:
+            continue
+        for game in games_data.get('games', []):
+            if game['id'] in week_scores:
+                games.append(game)
+                game_weeks.append(week)
+        scores.update(week_scores)
+        for player in players:
+            all_picks[player].update(week_picks.get(player, {}).get('picks', {}))
+    
+    arrays = build_arrays(games, scores, all_picks, players, pick_lines)
+    outcomes, awarded = grade(arrays, points)
+    
+    results = {}
+    for g, game in enumerate(arrays['games']):
+        game_results = results.setdefault(game_weeks[g], {}).setdefault(game['id'], {})
+        for p, player in enumerate(players):
+            game_results[player] = {
+                pick_type: {
+                    'result': OUTCOMES.get(outcomes[p, g, t]) if not np.isnan(outcomes[p, g, t]) else None,
+                    'points': None if np.isnan(awarded[p, g, t]) else float(awarded[p, g, t]),
+                }
+                for t, pick_type in enumerate(('spread', 'total'))
+            }
+    return results
+
+
+def write_results_csv(results, path):
+    """Flatten graded results to one CSV row per week/game/player"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['week', 'game_id', 'player', 'spread_result', 'spread_points', 'total_result', 'total_points'])
+        for week in sorted(results):
+            for game_id, players in results[week].items():
+                for player, graded in players.items():
+                    writer.writerow([
+                        week, game_id, player,
+                        graded['spread']['result'] or '', '' if graded['spread']['points'] is None else graded['spread']['points'],
+                        graded['total']['result'] or '', '' if graded['total']['points'] is None else graded['total']['points'],
+                    ])
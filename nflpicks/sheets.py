@@ -0,0 +1,192 @@
+"""
+Helpers for batched Google Sheets reads and writes, and the 'Season Data'
+column layout. gspread is only imported by the functions that need it, so
+importing the layout costs nothing.
+"""
+import re
+
+GAME_COLUMNS = [
+    'Week', 'Week Start Date', 'Game Date', 'Away Team', 'Home Team',
+    'Away Spread', 'Home Spread', 'Over/Under',
+]
+PICK_TYPES = (('spread', 'Spread'), ('total', 'O/U'))
+
+# Hidden tab mapping each week to its rows in 'Season Data'
+INDEX_TAB = 'Week Index'
+INDEX_COLUMNS = ['Week', 'First Row', 'Last Row']
+
+
+def pick_header(player, pick_type):
+    """Header of a player's pick column, e.g. 'Jeff Spread Pick'"""
+    return f"{player.title()} {dict(PICK_TYPES)[pick_type]} Pick"
+
+
+def points_header(player, pick_type):
+    """Header of a player's points column, e.g. 'Jeff O/U Points'"""
+    return f"{player.title()} {dict(PICK_TYPES)[pick_type]} Points"
+
+
+def sheet_columns(players):
+    """
+    Full 'Season Data' header row for a roster:
+    game columns, two pick columns per player, scores, two points columns
+    per player, then Game Status
+    """
+    return (
+        GAME_COLUMNS
+        + [pick_header(player, pick_type) for player in players for pick_type, _ in PICK_TYPES]
+        + ['Away Score', 'Home Score']
+        + [points_header(player, pick_type) for player in players for pick_type, _ in PICK_TYPES]
+        + ['Game Status']
+    )
+
+
+def sync_column_count(players):
+    """Columns sync owns: game columns plus every player's picks"""
+    return len(GAME_COLUMNS) + len(PICK_TYPES) * len(players)
+
+
+def changed_cells(row, row_number, values):
+    """
+    Build batch_update entries for (column index, value) pairs in a row,
+    skipping cells that already hold the same value
+    """
+    cells = []
+    for col, value in values:
+        current = row[col] if col < len(row) else ''
+        if str(current) == str(value):
+            continue
+        cells.append({
+            'range': f"{column_letter(col)}{row_number}",
+            'values': [[value]]
+        })
+    return cells
+
+
+def column_letter(col):
+    """Return the A1 column letter for a zero-based column index"""
+    letters = ''
+    col += 1
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def appended_rows(response):
+    """(first, last) row numbers written by an append_rows call, from its updatedRange"""
+    updated = (response or {}).get('updates', {}).get('updatedRange', '')
+    match = re.search(r'![A-Z]*(\d+)(?::[A-Z]*(\d+))?$', updated)
+    if not match:
+        return None
+    first = int(match.group(1))
+    return first, int(match.group(2) or first)
+
+
+def week_spans(rows):
+    """{week: [first row, last row]} from (row number, row) pairs whose first column is the Week"""
+    spans = {}
+    for row_number, row in rows:
+        if row and str(row[0]).strip():
+            week = str(row[0]).strip()
+            first, last = spans.get(week, (row_number, row_number))
+            spans[week] = [min(first, row_number), max(last, row_number)]
+    return dict(sorted(spans.items(), key=lambda item: int(item[0]) if item[0].isdigit() else 0))
+
+
+class WeekIndex:
+    """
+    Week -> (first row, last row) of 'Season Data', kept on a hidden tab so
+    a run can read just the target week's rows instead of the whole season.
+    Rows outside the week can fall inside a span (if a week's games were
+    appended after the next week's), so readers still check the Week column.
+    A span can also be missing or stale (rows added by an older run, or moved
+    by a manual insert or sort); readers then fall back to a full read and
+    reindex from it.
+    """
+    
+    def __init__(self, worksheet, spans, positions=None):
+        self.worksheet = worksheet
+        self.spans = spans  # {week: [first, last]}
+        # Row of each week's entry on the index tab
+        self.positions = positions or {week: row for row, week in enumerate(spans, start=2)}
+        self.dirty = set()
+    
+    @classmethod
+    def load(cls, spreadsheet):
+        """The sheet's index, or None if it hasn't been built yet (see build)"""
+        import gspread
+        
+        try:
+            worksheet = spreadsheet.worksheet(INDEX_TAB)
+        except gspread.exceptions.WorksheetNotFound:
+            return None
+        spans, positions = {}, {}
+        for row_number, row in enumerate(worksheet.get('A2:C'), start=2):
+            if len(row) == 3 and all(str(value).isdigit() for value in row):
+                spans[str(row[0])] = [int(row[1]), int(row[2])]
+                positions[str(row[0])] = row_number
+        return cls(worksheet, spans, positions)
+    
+    @classmethod
+    def build(cls, spreadsheet, data_worksheet):
+        """One-time migration: index an existing 'Season Data' tab from its Week column"""
+        import gspread
+        
+        spans = week_spans(enumerate(data_worksheet.get('A2:A'), start=2))
+        
+        try:
+            worksheet = spreadsheet.worksheet(INDEX_TAB)
+            worksheet.clear()
+        except gspread.exceptions.WorksheetNotFound:
+            worksheet = spreadsheet.add_worksheet(title=INDEX_TAB, rows=40, cols=3)
+            spreadsheet.batch_update({'requests': [{
+                'updateSheetProperties': {'properties': {'sheetId': worksheet.id, 'hidden': True}, 'fields': 'hidden'}
+            }]})
+        
+        index = cls(worksheet, spans)
+        rows = [INDEX_COLUMNS] + [[week, first, last] for week, (first, last) in spans.items()]
+        worksheet.batch_update([{'range': 'A1', 'values': rows}])
+        return index
+    
+    def span(self, week):
+        return self.spans.get(str(week))
+    
+    def ranges(self, weeks):
+        """Whole-row A1 ranges ('12:27') for the weeks that have rows"""
+        spans = [self.span(week) for week in weeks]
+        return [f"{span[0]}:{span[1]}" for span in spans if span]
+    
+    def extend(self, week, first, last):
+        """Grow a week's span to cover rows first..last"""
+        week = str(week)
+        if week in self.spans:
+            first = min(first, self.spans[week][0])
+            last = max(last, self.spans[week][1])
+        else:
+            self.positions[week] = max(self.positions.values(), default=1) + 1
+        self.spans[week] = [first, last]
+        self.dirty.add(week)
+    
+    def reindex(self, rows):
+        """
+        Correct every week's span from (row number, row) pairs covering the
+        whole sheet, e.g. after a full read; changed weeks are written by save()
+        """
+        for week, span in week_spans(rows).items():
+            if self.spans.get(week) == span:
+                continue
+            if week not in self.positions:
+                self.positions[week] = max(self.positions.values(), default=1) + 1
+            self.spans[week] = span
+            self.dirty.add(week)
+    
+    def save(self):
+        """Write changed weeks' spans in one batch"""
+        if not self.dirty:
+            return
+        self.worksheet.batch_update([
+            {'range': f"A{self.positions[week]}:C{self.positions[week]}", 'values': [[week] + self.spans[week]]}
+            for week in sorted(self.dirty)
+        ])
+        self.dirty = set()
@@ -0,0 +1,221 @@
+"""
+Season standings, updated a week at a time.
+
+Each graded week is reduced to a small per-player summary (win/loss/push
+counts, points, and the win/loss runs at its start and end) and stored in
+seasons/<year>/standings.json with a digest of the week's results. When a
+week is re-scored, only that week's summary is rebuilt and its difference
+applied to the running totals. Weekly winners are adjusted the same way.
+Streaks are stitched together from the stored week summaries, so they never
+need the individual picks again.
+"""
+import hashlib
+import json
+from datetime import datetime
+
+from nflpicks.sheets import PICK_TYPES
+
+OUTCOME_KEYS = ('win', 'loss', 'push')
+RUN_CODES = {'win': 'W', 'loss': 'L'}
+
+
+def week_digest(week_results):
+    """Stable digest of a week's graded results, to spot weeks that changed"""
+    content = json.dumps(week_results, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def _kickoff_order(game_id):
+    # Game ids end with the kickoff, e.g. 'Buffalo_Miami_2025-12-21 13:00'
+    return (game_id.rsplit('_', 1)[-1], game_id)
+
+
+def _runs(outcomes):
+    """Collapse a W/L sequence into its first run, last run and longest win run"""
+    runs = []
+    for code in outcomes:
+        if runs and runs[-1][0] == code:
+            runs[-1][1] += 1
+        else:
+            runs.append([code, 1])
+    if not runs:
+        return None
+    return {
+        'first': runs[0],
+        'last': runs[-1],
+        'single': len(runs) == 1,
+        'best_win': max((length for code, length in runs if code == 'W'), default=0)
+    }
+
+
+def summarize_week(week_results, players):
+    """
+    Reduce one week's results ({game_id: {player: {'spread': ..., 'total': ...}}})
+    to {player: {'spread': {win, loss, push}, 'total': {...}, 'points', 'runs'}}.
+    Picks are ordered by kickoff, spread before O/U; pushes don't break a streak.
+    """
+    summary = {}
+    for player in players:
+        counts = {pick_type: dict.fromkeys(OUTCOME_KEYS, 0) for pick_type, _ in PICK_TYPES}
+        points = 0
+        outcomes = []
+        for game_id in sorted(week_results, key=_kickoff_order):
+            graded = week_results[game_id].get(player)
+            if not graded:
+                continue
+            for pick_type, _ in PICK_TYPES:
+                result = graded[pick_type]['result']
+                if result not in counts[pick_type]:
+                    continue
+                counts[pick_type][result] += 1
+                points += graded[pick_type]['points'] or 0
+                if result in RUN_CODES:
+                    outcomes.append(RUN_CODES[result])
+        summary[player] = {**counts, 'points': points, 'runs': _runs(outcomes)}
+    return summary
+
+
+def week_winners(summary):
+    """Players with the most points in a week (ties share it); none if nobody scored"""
+    best = max((s['points'] for s in summary.values()), default=0)
+    if best <= 0:
+        return []
+    return sorted(player for player, s in summary.items() if s['points'] == best)
+
+
+def _empty_totals():
+    totals = {pick_type: dict.fromkeys(OUTCOME_KEYS, 0) for pick_type, _ in PICK_TYPES}
+    totals.update({'points': 0, 'weeks_won': 0})
+    return totals
+
+
+class Standings:
+    """
+    Running season standings backed by SeasonStore.load_standings/save_standings.
+    
+    State: {'weeks': {week: {'digest', 'summary', 'winners'}}, 'totals': {player: {...}}}
+    """
+    
+    def __init__(self, state=None):
+        state = state or {}
+        self.weeks = state.get('weeks', {})
+        self.totals = state.get('totals', {})
+        self.updated_at = state.get('updated_at')
+    
+    @classmethod
+    def load(cls, store):
+        return cls(store.load_standings())
+    
+    def save(self, store):
+        store.save_standings({'weeks': self.weeks, 'totals': self.totals, 'updated_at': self.updated_at})
+    
+    def _apply(self, summary, winners, sign):
+        for player, week in summary.items():
+            totals = self.totals.setdefault(player, _empty_totals())
+            for pick_type, _ in PICK_TYPES:
+                for outcome in OUTCOME_KEYS:
+                    totals[pick_type][outcome] += sign * week[pick_type][outcome]
+            totals['points'] += sign * week['points']
+        for player in winners:
+            self.totals.setdefault(player, _empty_totals())['weeks_won'] += sign
+    
+    def update(self, results, players):
+        """
+        Fold graded results ({week: week_results}) into the standings.
+        Weeks whose results are unchanged are skipped; a changed week has its
+        old contribution removed and the new one added. Returns the weeks updated.
+        """
+        changed = []
+        for week in sorted(results, key=int):
+            if not results[week]:
+                continue  # Nothing graded yet
+            key = str(week)
+            digest = week_digest(results[week])
+            previous = self.weeks.get(key)
+            if previous and previous['digest'] == digest:
+                continue
+            
+            summary = summarize_week(results[week], players)
+            winners = week_winners(summary)
+            if previous:
+                self._apply(previous['summary'], previous['winners'], -1)
+            self._apply(summary, winners, 1)
+            self.weeks[key] = {'digest': digest, 'summary': summary, 'winners': winners}
+            changed.append(int(week))
+        
+        if changed:
+            self.updated_at = datetime.now().isoformat(timespec='seconds')
+        return changed
+    
+    def streaks(self, player):
+        """(current streak like 'W3', longest win streak) stitched across weeks in order"""
+        current, length, best = None, 0, 0
+        for key in sorted(self.weeks, key=int):
+            runs = self.weeks[key]['summary'].get(player, {}).get('runs')
+            if not runs:
+                continue
+            first_code, first_length = runs['first']
+            joined = length + first_length if first_code == current else first_length
+            if runs['single']:
+                current, length = first_code, joined
+            else:
+                if first_code == 'W':
+                    best = max(best, joined)
+                current, length = runs['last']
+            if current == 'W':
+                best = max(best, length)
+            best = max(best, runs['best_win'])
+        return (f"{current}{length}" if current else ''), best
+    
+    def table(self, players):
+        """Ranked rows, best first: points, then spread wins"""
+        weeks = sorted(self.weeks, key=int)
+        last_week = weeks[-1] if weeks else None
+        rows = []
+        for player in players:
+            totals = self.totals.get(player, _empty_totals())
+            streak, longest = self.streaks(player)
+            rows.append({
+                'player': player,
+                'points': totals['points'],
+                'spread': totals['spread'],
+                'total': totals['total'],
+                'pushes': sum(totals[pick_type]['push'] for pick_type, _ in PICK_TYPES),
+                'weeks_won': totals['weeks_won'],
+                'streak': streak,
+                'longest_win_streak': longest,
+                'last_week_points': self.weeks[last_week]['summary'].get(player, {}).get('points', 0) if last_week else 0,
+            })
+        rows.sort(key=lambda row: (-row['points'], -row['spread']['win'], row['player']))
+        for rank, row in enumerate(rows, start=1):
+            row['rank'] = rank
+        return rows
+    
+    def to_json(self, players):
+        """Compact standings for the dashboard: ranked table plus points by week"""
+        return {
+            'updated_at': self.updated_at,
+            'table': self.table(players),
+            'weeks': [
+                {
+                    'week': int(key),
+                    'winners': self.weeks[key]['winners'],
+                    'points': {player: s['points'] for player, s in self.weeks[key]['summary'].items()},
+                }
+                for key in sorted(self.weeks, key=int)
+            ]
+        }
+    
+    def sheet_rows(self, players):
+        """The 'Standings' tab: one row per player, with points for each week"""
+        weeks = sorted(self.weeks, key=int)
+        header = ['Rank', 'Player', 'Points', 'Spread W-L-P', 'O/U W-L-P', 'Pushes',
+                  'Weeks Won', 'Streak', 'Longest Win Streak'] + [f"Week {week}" for week in weeks]
+        rows = [header]
+        for row in self.table(players):
+            record = {pick_type: '-'.join(str(row[pick_type][o]) for o in OUTCOME_KEYS) for pick_type, _ in PICK_TYPES}
+            rows.append([
+                row['rank'], row['player'].title(), row['points'], record['spread'], record['total'],
+                row['pushes'], row['weeks_won'], row['streak'], row['longest_win_streak']
+            ] + [self.weeks[week]['summary'].get(row['player'], {}).get('points', '') for week in weeks])
+        return rows
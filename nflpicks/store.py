@@ -0,0 +1,264 @@
+"""
+Persistent multi-week season store.
+
+Each week is kept next to the others instead of being overwritten:
+
+    seasons/<year>/week-NN/games.json
+    seasons/<year>/week-NN/picks/<player>.json
+    seasons/<year>/week-NN/scores.json
+    seasons/<year>/week-NN/results.json
+    seasons/<year>/week-NN/lines.csv      (append-only line snapshots)
+    seasons/<year>/standings.json         (per-week standings summaries)
+    seasons/<year>/calendar.json          (week boundaries, see nflpicks.schedule)
+    seasons/<year>/projection.json        (latest Monte Carlo projection)
+
+games.json and picks/<player>.json at the repo root remain the "current
+week" files the website reads; scrape, sync and score also write through
+this store so history never has to be re-read from Google Sheets.
+"""
+import bisect
+import csv
+import json
+import os
+from datetime import datetime, timezone
+
+from nflpicks.config import CONFIG_FILE, load_config
+from nflpicks.teams import game_key
+
+DEFAULT_ROOT = 'seasons'
+
+
+def load_season(config_file=CONFIG_FILE):
+    """Return current_season from config.json"""
+    return load_config(config_file)['current_season']
+
+
+LINE_FIELDS = ['captured_at', 'game_id', 'away_odds', 'home_odds', 'over_under']
+
+
+def utc_stamp(when=None):
+    """
+    Normalize a datetime or ISO string (e.g. a picks saved_at) to a sortable
+    UTC stamp 'YYYY-MM-DDTHH:MM:SSZ'. Naive datetimes are taken as UTC.
+    """
+    if when is None:
+        when = datetime.now(timezone.utc)
+    elif isinstance(when, str):
+        when = datetime.fromisoformat(when.replace('Z', '+00:00'))
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class SeasonStore:
+    def __init__(self, season, root=DEFAULT_ROOT):
+        self.season = int(season)
+        self.root = root
+        self.season_dir = os.path.join(root, str(self.season))
+    
+    def week_dir(self, week):
+        return os.path.join(self.season_dir, f"week-{int(week):02d}")
+    
+    def _read(self, path):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+    
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+    
+    def weeks(self):
+        """Sorted list of week numbers that have data"""
+        if not os.path.isdir(self.season_dir):
+            return []
+        return sorted(
+            int(name[5:]) for name in os.listdir(self.season_dir)
+            if name.startswith('week-') and name[5:].isdigit()
+        )
+    
+    def save_games(self, games_data):
+        """Store a games.json payload under its week"""
+        self._write(os.path.join(self.week_dir(games_data['week']), 'games.json'), games_data)
+    
+    def load_games(self, week):
+        return self._read(os.path.join(self.week_dir(week), 'games.json'))
+    
+    def save_picks(self, player, picks_data):
+        """Store a picks/<player>.json payload under its week"""
+        self._write(os.path.join(self.week_dir(picks_data['week']), 'picks', f"{player}.json"), picks_data)
+    
+    def load_picks(self, week):
+        """Return {player: picks_data} for a week"""
+        picks_dir = os.path.join(self.week_dir(week), 'picks')
+        if not os.path.isdir(picks_dir):
+            return {}
+        all_picks = {}
+        for name in sorted(os.listdir(picks_dir)):
+            if name.endswith('.json'):
+                data = self._read(os.path.join(picks_dir, name))
+                if data:
+                    all_picks[name[:-5]] = data
+        return all_picks
+    
+    def save_scores(self, week, scores):
+        """
+        Store ESPN final scores for a week, keyed by game id where the game
+        is in the stored games.json (otherwise by away@home team code)
+        """
+        stored = self.merge_scores(week, scores)
+        self._write(os.path.join(self.week_dir(week), 'scores.json'), stored)
+        return stored
+    
+    def merge_scores(self, week, scores, stored=None):
+        """
+        The week's scores (stored ones unless given) with ESPN scores merged
+        in, without writing them
+        """
+        games = (self.load_games(week) or {}).get('games', [])
+        ids_by_key = {game_key(week, g['away_team'], g['home_team']): g['id'] for g in games}
+        
+        stored = dict(stored) if stored is not None else self.load_scores(week)
+        for score in scores:
+            key = (str(week), score.get('away_code'), score.get('home_code'))
+            game_id = ids_by_key.get(key) or f"{key[1]}@{key[2]}"
+            stored[game_id] = {
+                'away_team': score['away_team'],
+                'home_team': score['home_team'],
+                'away_score': score['away_score'],
+                'home_score': score['home_score'],
+                'status': score.get('status', ''),
+            }
+        return stored
+    
+    def load_scores(self, week):
+        return self._read(os.path.join(self.week_dir(week), 'scores.json')) or {}
+    
+    def save_results(self, week, results):
+        """Store graded picks for a week: {game_id: {player: {'spread': ..., 'total': ...}}}"""
+        self._write(os.path.join(self.week_dir(week), 'results.json'), results)
+    
+    def load_results(self, week):
+        return self._read(os.path.join(self.week_dir(week), 'results.json')) or {}
+    
+    def save_standings(self, standings):
+        self._write(os.path.join(self.season_dir, 'standings.json'), standings)
+    
+    def load_standings(self):
+        return self._read(os.path.join(self.season_dir, 'standings.json')) or {}
+    
+    def save_projection(self, projection):
+        self._write(os.path.join(self.season_dir, 'projection.json'), projection)
+    
+    def load_projection(self):
+        return self._read(os.path.join(self.season_dir, 'projection.json')) or {}
+    
+    def save_calendar(self, calendar):
+        self._write(os.path.join(self.season_dir, 'calendar.json'), calendar)
+    
+    def load_calendar(self):
+        return self._read(os.path.join(self.season_dir, 'calendar.json')) or {}
+    
+    def _lines_path(self, week):
+        return os.path.join(self.week_dir(week), 'lines.csv')
+    
+    def load_lines(self, week):
+        """Return {game_id: [snapshot, ...]} with snapshots in captured_at order"""
+        lines = {}
+        try:
+            with open(self._lines_path(week), 'r', newline='') as f:
+                for row in csv.DictReader(f):
+                    lines.setdefault(row['game_id'], []).append(row)
+        except FileNotFoundError:
+            pass
+        for snapshots in lines.values():
+            snapshots.sort(key=lambda row: row['captured_at'])
+        return lines
+    
+    def record_lines(self, week, games, captured_at=None):
+        """
+        Append a snapshot row for each game whose line differs from its last
+        recorded one. Returns the number of rows written.
+        """
+        stamp = utc_stamp(captured_at)
+        latest = {game_id: snapshots[-1] for game_id, snapshots in self.load_lines(week).items()}
+        
+        rows = []
+        for game in games:
+            row = {
+                'captured_at': stamp,
+                'game_id': game['id'],
+                'away_odds': str(game.get('away_odds', '')),
+                'home_odds': str(game.get('home_odds', '')),
+                'over_under': str(game.get('over_under', '')),
+            }
+            previous = latest.get(game['id'])
+            if previous and all(previous[field] == row[field] for field in LINE_FIELDS[2:]):
+                continue
+            rows.append(row)
+        
+        if rows:
+            path = self._lines_path(week)
+            is_new = not os.path.exists(path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'a', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=LINE_FIELDS)
+                if is_new:
+                    writer.writeheader()
+                writer.writerows(rows)
+        return len(rows)
+    
+    def line_as_of(self, week, game_id, when, lines=None):
+        """The line for a game as it stood at `when`, or None if none was recorded yet"""
+        snapshots = (lines if lines is not None else self.load_lines(week)).get(game_id, [])
+        stamps = [row['captured_at'] for row in snapshots]
+        i = bisect.bisect_right(stamps, utc_stamp(when))
+        return snapshots[i - 1] if i else None
+    
+    def pick_lines(self, week, week_picks):
+        """
+        The line each player saw when making their picks:
+        {player: {game_id: snapshot}} using each pick's picked_at, or the
+        file's saved_at for picks saved before picks were stamped
+        """
+        lines = self.load_lines(week)
+        if not lines:
+            return {}
+        pick_lines = {}
+        for player, picks_data in week_picks.items():
+            saved_at = picks_data.get('saved_at')
+            for game_id, pick in picks_data.get('picks', {}).items():
+                picked_at = pick.get('picked_at') or saved_at
+                if not picked_at:
+                    continue
+                line = self.line_as_of(week, game_id, picked_at, lines)
+                if line:
+                    pick_lines.setdefault(player, {})[game_id] = line
+        return pick_lines
+    
+    def archive_current(self, games_file='games.json', picks_dir='picks'):
+        """
+        Copy the root games.json and any picks/<player>.json for the same week
+        into the store. Run before games.json is replaced with a new week.
+        """
+        games_data = self._read(games_file)
+        if not games_data or not games_data.get('games'):
+            return None
+        self.save_games(games_data)
+        
+        if os.path.isdir(picks_dir):
+            for name in os.listdir(picks_dir):
+                if not name.endswith('.json'):
+                    continue
+                picks_data = self._read(os.path.join(picks_dir, name))
+                if picks_data and picks_data.get('week') == games_data['week']:
+                    self.save_picks(name[:-5], picks_data)
+        return games_data['week']
+    
+    def history(self):
+        """Yield (week, games_data, {player: picks_data}, scores) for every stored week"""
+        for week in self.weeks():
+            yield week, self.load_games(week), self.load_picks(week), self.load_scores(week)
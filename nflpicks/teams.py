@@ -0,0 +1,79 @@
+"""
+Canonical NFL team index.
+
+Maps every name we see from OddsShark ("LA Rams", "Kansas City"), ESPN
+("Los Angeles Rams", "KC") and people ("Chiefs", "Bucs") to one team code,
+so matching a game is a dict lookup instead of fuzzy string comparison.
+"""
+
+# code: (OddsShark name, ESPN display name, ESPN abbreviation, nickname, extra aliases)
+TEAMS = {
+    'ARI': ('Arizona', 'Arizona Cardinals', 'ARI', 'Cardinals', []),
+    'ATL': ('Atlanta', 'Atlanta Falcons', 'ATL', 'Falcons', []),
+    'BAL': ('Baltimore', 'Baltimore Ravens', 'BAL', 'Ravens', []),
+    'BUF': ('Buffalo', 'Buffalo Bills', 'BUF', 'Bills', []),
+    'CAR': ('Carolina', 'Carolina Panthers', 'CAR', 'Panthers', []),
+    'CHI': ('Chicago', 'Chicago Bears', 'CHI', 'Bears', []),
+    'CIN': ('Cincinnati', 'Cincinnati Bengals', 'CIN', 'Bengals', []),
+    'CLE': ('Cleveland', 'Cleveland Browns', 'CLE', 'Browns', []),
+    'DAL': ('Dallas', 'Dallas Cowboys', 'DAL', 'Cowboys', []),
+    'DEN': ('Denver', 'Denver Broncos', 'DEN', 'Broncos', []),
+    'DET': ('Detroit', 'Detroit Lions', 'DET', 'Lions', []),
+    'GB': ('Green Bay', 'Green Bay Packers', 'GB', 'Packers', ['GNB']),
+    'HOU': ('Houston', 'Houston Texans', 'HOU', 'Texans', []),
+    'IND': ('Indianapolis', 'Indianapolis Colts', 'IND', 'Colts', []),
+    'JAX': ('Jacksonville', 'Jacksonville Jaguars', 'JAX', 'Jaguars', ['JAC']),
+    'KC': ('Kansas City', 'Kansas City Chiefs', 'KC', 'Chiefs', ['KAN']),
+    'LV': ('Las Vegas', 'Las Vegas Raiders', 'LV', 'Raiders', ['LVR']),
+    'LAC': ('LA Chargers', 'Los Angeles Chargers', 'LAC', 'Chargers', []),
+    'LAR': ('LA Rams', 'Los Angeles Rams', 'LAR', 'Rams', []),
+    'MIA': ('Miami', 'Miami Dolphins', 'MIA', 'Dolphins', []),
+    'MIN': ('Minnesota', 'Minnesota Vikings', 'MIN', 'Vikings', []),
+    'NE': ('New England', 'New England Patriots', 'NE', 'Patriots', ['NWE', 'Pats']),
+    'NO': ('New Orleans', 'New Orleans Saints', 'NO', 'Saints', ['NOR']),
+    'NYG': ('NY Giants', 'New York Giants', 'NYG', 'Giants', []),
+    'NYJ': ('NY Jets', 'New York Jets', 'NYJ', 'Jets', []),
+    'PHI': ('Philadelphia', 'Philadelphia Eagles', 'PHI', 'Eagles', []),
+    'PIT': ('Pittsburgh', 'Pittsburgh Steelers', 'PIT', 'Steelers', []),
+    'SF': ('San Francisco', 'San Francisco 49ers', 'SF', '49ers', ['SFO', 'Niners']),
+    'SEA': ('Seattle', 'Seattle Seahawks', 'SEA', 'Seahawks', []),
+    'TB': ('Tampa Bay', 'Tampa Bay Buccaneers', 'TB', 'Buccaneers', ['TAM', 'Bucs']),
+    'TEN': ('Tennessee', 'Tennessee Titans', 'TEN', 'Titans', []),
+    'WSH': ('Washington', 'Washington Commanders', 'WSH', 'Commanders', ['WAS']),
+}
+
+
+def _normalize(name):
+    return ' '.join(str(name).lower().split())
+
+
+def _build_index():
+    index = {}
+    for code, (oddsshark, espn, abbreviation, nickname, aliases) in TEAMS.items():
+        for name in [code, oddsshark, espn, abbreviation, nickname] + aliases:
+            index[_normalize(name)] = code
+    return index
+
+
+# Ambiguous names like "Los Angeles" or "New York" are deliberately absent,
+# so they resolve to None rather than to the wrong team.
+TEAM_INDEX = _build_index()
+
+
+def team_code(name):
+    """Return the canonical team code for any known team name, or None"""
+    if not name:
+        return None
+    return TEAM_INDEX.get(_normalize(name))
+
+
+def game_key(week, away_team, home_team):
+    """
+    Key a game by (week, away code, home code).
+    Returns None if either team name can't be resolved.
+    """
+    away_code = team_code(away_team)
+    home_code = team_code(home_team)
+    if not away_code or not home_code:
+        return None
+    return (str(week) if week not in (None, '') else None, away_code, home_code)
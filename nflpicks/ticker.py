@@ -0,0 +1,115 @@
+"""
+Streaming, validated parser for the OddsShark NFL ticker.
+
+The ticker is read item by item with ijson (in requirements.txt; the
+decoded body is only a fallback for environments without it), only
+"matchup" items are kept, and each one is
+validated into a compact Matchup record. Rows missing a field are
+quarantined and counted instead of crashing the run.
+"""
+from datetime import datetime
+
+import requests
+from urllib3.exceptions import HTTPError as Urllib3Error
+
+try:
+    import ijson  # Keeps peak memory flat by never holding the whole ticker
+except ImportError:  # Safety net only; ijson is in requirements.txt
+    ijson = None
+
+EVENT_DATE_FORMAT = "%Y-%m-%d %H:%M"
+REQUIRED_FIELDS = ('event_date', 'away_name', 'home_name', 'away_odds', 'home_odds', 'total')
+
+
+class Matchup:
+    """One validated ticker matchup"""
+    __slots__ = ('event_date', 'kickoff', 'away_name', 'home_name',
+                 'away_odds', 'home_odds', 'total', 'matchup_link')
+    
+    def __init__(self, event_date, kickoff, away_name, home_name, away_odds, home_odds, total, matchup_link):
+        self.event_date = event_date
+        self.kickoff = kickoff
+        self.away_name = away_name
+        self.home_name = home_name
+        self.away_odds = away_odds
+        self.home_odds = home_odds
+        self.total = total
+        self.matchup_link = matchup_link
+    
+    def to_game(self, week_number):
+        """games.json game dict for this matchup"""
+        return {
+            "id": f"{self.away_name}_{self.home_name}_{self.event_date}",
+            "week": week_number,
+            "game_date": self.event_date,
+            "away_team": self.away_name,
+            "home_team": self.home_name,
+            "away_odds": self.away_odds,
+            "home_odds": self.home_odds,
+            "over_under": self.total,
+            "matchup_link": f"https://www.oddsshark.com{self.matchup_link}"
+        }
+
+
+class Quarantine:
+    """Counts (and keeps a few examples of) rows that failed validation"""
+    
+    def __init__(self, keep=5):
+        self.count = 0
+        self.examples = []
+        self.keep = keep
+    
+    def add(self, item, reason):
+        self.count += 1
+        if len(self.examples) < self.keep:
+            label = f"{item.get('away_name', '?')} @ {item.get('home_name', '?')}" if isinstance(item, dict) else repr(item)[:60]
+            self.examples.append(f"{label}: {reason}")
+
+
+def iter_ticker_items(response):
+    """
+    Yield raw items from the ticker's "matchups" array of a streamed
+    requests response, without building the whole document when ijson exists.
+    Reading response.raw bypasses requests' own error wrapping, so a
+    truncated or malformed body raises ValueError and a connection dropped
+    mid-stream raises requests' ConnectionError, like the buffered path.
+    """
+    if ijson is not None:
+        response.raw.decode_content = True
+        try:
+            yield from ijson.items(response.raw, 'matchups.item', use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"malformed ticker JSON: {e}") from e
+        except Urllib3Error as e:
+            raise requests.exceptions.ConnectionError(e) from e
+    else:
+        yield from response.json().get('matchups', [])
+
+
+def parse_matchup(item):
+    """Validate a raw ticker item into a Matchup. Raises ValueError if it isn't usable."""
+    missing = [field for field in REQUIRED_FIELDS if item.get(field) in (None, '')]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    kickoff = datetime.strptime(item['event_date'], EVENT_DATE_FORMAT)
+    return Matchup(
+        item['event_date'], kickoff, item['away_name'], item['home_name'],
+        item['away_odds'], item['home_odds'], item['total'], item.get('matchup_link', '')
+    )
+
+
+def iter_matchups(items, min_date, max_date, quarantine):
+    """
+    Yield validated Matchups kicking off within [min_date, max_date].
+    Non-matchup items are skipped; invalid matchups go to quarantine.
+    """
+    for item in items:
+        if not isinstance(item, dict) or item.get('type') != 'matchup':
+            continue
+        try:
+            matchup = parse_matchup(item)
+        except (ValueError, TypeError) as e:
+            quarantine.add(item, str(e))
+            continue
+        if min_date <= matchup.kickoff <= max_date:
+            yield matchup
@@ -1,93 +1,196 @@
 import json
 import os
+import time
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
-import gspread
-from google.oauth2.service_account import Credentials
+from nflpicks.api import SheetsMeter, default_report
+from nflpicks.espn import (
+    LIVE_STATUSES, POSTSEASON, POSTSEASON_WEEKS, REGULAR_SEASON, REGULAR_SEASON_WEEKS,
+    FixtureScoreboard, ScoreboardClient, SharedScoreboard, next_poll_interval, parse_scoreboard, sheet_week,
+)
+from nflpicks.leagues import League, SharedServices, load_leagues, run_leagues, select_leagues
+from nflpicks.sheets import PICK_TYPES, WeekIndex, changed_cells, points_header
+from nflpicks.schedule import load_calendar, load_kickoffs
+from nflpicks.standings import Standings
+from nflpicks.teams import game_key, team_code
 
 # Load environment variables
 load_dotenv()
 
+def authorize_sheets():
+    """An authorized gspread client for the service account in google-credentials.json"""
+    # Imported here so runs with nothing to write don't pay for them
+    import gspread
+    from google.oauth2.service_account import Credentials
+    
+    scope = [
+        'https://spreadsheets.google.com/feeds',
+        'https://www.googleapis.com/auth/drive'
+    ]
+    
+    creds_file = 'google-credentials.json'
+    if not os.path.exists(creds_file):
+        print(f"❌ Google credentials file '{creds_file}' not found!")
+        exit(1)
+    
+    creds = Credentials.from_service_account_file(creds_file, scopes=scope)
+    return gspread.authorize(creds)
+
 class NFLScoreUpdater:
-    def __init__(self):
-        self.setup_google_sheets()
-        self.sheet_id = os.getenv('GOOGLE_SHEET_ID')
-        
+    def __init__(self, fixture_dir=None, record_dir=None, dry_run=False, simulations=None, workers=1,
+                 league=None, shared=None, out=None):
+        # shared (a SharedServices) is set when several leagues are scored in one run,
+        # and out is then the league's own output stream (None: stdout)
+        self.shared = shared
+        self.out = out
+        self.sheets = SheetsMeter(dry_run=dry_run, bucket=shared.sheets_bucket if shared else None, out=out)
+        # A dry run writes nothing locally either: new scores and grades are kept here, by week
+        self.pending_scores = {}
+        self.pending_results = {}
+        # Monte Carlo projection settings (None: nflpicks.projection's default)
+        self.simulations = simulations
+        self.workers = workers
+        self._gc = None  # Authorized on first use, see gc
+        self.league = league or League.default()
+        self.sheet_id = self.league.sheet_id
+        self.players = self.league.players
+        self.store = self.league.store()
+        if shared:
+            self.scoreboard = shared.scoreboard
+        elif fixture_dir:
+            self.scoreboard = FixtureScoreboard(fixture_dir)
+        else:
+            self.scoreboard = ScoreboardClient(record_dir=record_dir)
+    
+    def log(self, *args):
+        """print() to this run's output stream"""
+        print(*args, file=self.out)
+    
+    @property
+    def gc(self):
+        """The gspread client, authorized the first time the sheet is needed"""
+        if self._gc is None:
+            self.setup_google_sheets()
+        return self._gc
+    
+    @gc.setter
+    def gc(self, client):
+        self._gc = client
+    
     def setup_google_sheets(self):
-        """Setup Google Sheets API connection"""
-        scope = [
-            'https://spreadsheets.google.com/feeds',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        
-        creds_file = 'google-credentials.json'
-        if not os.path.exists(creds_file):
-            print(f"❌ Google credentials file '{creds_file}' not found!")
-            exit(1)
-            
-        creds = Credentials.from_service_account_file(creds_file, scopes=scope)
-        self.gc = gspread.authorize(creds)
+        """Setup Google Sheets API connection (authorized once for every league in a run)"""
+        client = self.shared.once('sheets', authorize_sheets) if self.shared else authorize_sheets()
+        self.gc = self.sheets.wrap(client)
     
-    def get_nfl_scores(self, week=None):
+    def get_nfl_scores(self, week=None, seasontype=REGULAR_SEASON):
         """
         Get NFL scores from ESPN API
         Returns list of completed games with scores
         """
         try:
-            # ESPN NFL scoreboard API
-            current_year = datetime.now().year
-            if week:
-                url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard?seasontype=2&week={week}"
-            else:
-                url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+            self.log(f"🏈 Fetching scores from ESPN API...")
+            data, _ = self.scoreboard.fetch(week, seasontype)
+            games = parse_scoreboard(data, week, seasontype)
             
-            print(f"🏈 Fetching scores from ESPN API...")
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            games = []
-            
-            for event in data.get('events', []):
-                game_info = {
-                    'date': event.get('date', ''),
-                    'status': event['status']['type']['name'],  # 'STATUS_FINAL', 'STATUS_IN_PROGRESS', etc.
-                    'away_team': event['competitions'][0]['competitors'][1]['team']['displayName'],
-                    'home_team': event['competitions'][0]['competitors'][0]['team']['displayName'],
-                    'away_score': None,
-                    'home_score': None
-                }
-                
-                # Only get scores for completed games
-                if event['status']['type']['name'] == 'STATUS_FINAL':
-                    game_info['away_score'] = int(event['competitions'][0]['competitors'][1]['score'])
-                    game_info['home_score'] = int(event['competitions'][0]['competitors'][0]['score'])
-                
-                games.append(game_info)
-            
-            completed_games = [g for g in games if g['away_score'] is not None]
-            print(f"✅ Found {len(completed_games)} completed games out of {len(games)} total")
+            completed_games = [g for g in games if g['status'] == 'STATUS_FINAL']
+            self.log(f"✅ Found {len(completed_games)} completed games out of {len(games)} total")
             
             return completed_games
-            
+        
         except Exception as e:
-            print(f"❌ Error fetching NFL scores: {e}")
+            self.log(f"❌ Error fetching NFL scores: {e}")
             return []
     
-    def update_sheet_scores(self, scores, week_filter=None):
+    def get_nfl_scores_for_weeks(self, weeks, seasontype=REGULAR_SEASON):
         """
-        Update Google Sheet with final scores
+        Get completed games for several weeks, fetching every scoreboard concurrently
+        """
+        self.log(f"🏈 Fetching {len(weeks)} scoreboards from ESPN API...")
+        completed_games = []
+        try:
+            responses = self.scoreboard.fetch_many(weeks, seasontype)
+        except Exception as e:
+            self.log(f"❌ Error fetching NFL scores: {e}")
+            return []
+        
+        for week in weeks:
+            data, _ = responses[week]
+            games = parse_scoreboard(data, week, seasontype)
+            week_completed = [g for g in games if g['status'] == 'STATUS_FINAL']
+            self.log(f"   Week {sheet_week(week, seasontype)}: {len(week_completed)}/{len(games)} completed")
+            completed_games.extend(week_completed)
+        
+        self.log(f"✅ Found {len(completed_games)} completed games across {len(weeks)} weeks")
+        return completed_games
+    
+    def read_sheet_rows(self, sheet, worksheet, weeks):
+        """
+        (headers, [(row number, row)]) for the weeks being scored. With a week
+        index only those weeks' rows are read, in one batch_get; otherwise, or
+        if a week isn't indexed or one of its stored games isn't inside its
+        span, the whole sheet is read and the index corrected from it.
+        """
+        week_index = WeekIndex.load(sheet) if weeks else None
+        if week_index:
+            if all(week_index.span(week) for week in weeks):
+                headers, rows = self.read_indexed_rows(worksheet, week_index, weeks)
+                if self.covers_stored_games(headers, rows, weeks):
+                    return headers, rows
+            self.log("⚠️  Week index doesn't cover every week being scored, reading every row to re-index")
+        
+        all_values = worksheet.get_all_values()
+        rows = list(enumerate(all_values[1:], start=2))
+        if week_index:
+            week_index.reindex(rows)
+            week_index.save()
+        return all_values[0], rows
+    
+    def read_indexed_rows(self, worksheet, week_index, weeks):
+        """(headers, [(row number, row)]) for the weeks' indexed spans, in one batch_get"""
+        ranges = week_index.ranges(sorted(weeks, key=int))
+        value_ranges = worksheet.batch_get(['1:1'] + ranges)
+        headers = value_ranges[0][0] if value_ranges[0] else []
+        rows = {}
+        for span, values in zip(ranges, value_ranges[1:]):
+            first_row = int(span.split(':')[0])
+            for offset, row in enumerate(values):
+                rows[first_row + offset] = row
+        return headers, sorted(rows.items())
+    
+    def covers_stored_games(self, headers, rows, weeks):
+        """True if every game the season store has for the weeks is among rows"""
+        try:
+            columns = [headers.index(header) for header in ('Away Team', 'Home Team', 'Game Date')]
+        except ValueError:
+            return True  # No game ids to check; update_sheet_scores reports the missing columns
+        found = {'_'.join(row[col] if col < len(row) else '' for col in columns) for _, row in rows}
+        stored = {
+            game['id']
+            for week in weeks if str(week).isdigit()
+            for game in (self.store.load_games(week) or {}).get('games', [])
+        }
+        return stored <= found
+    
+    def update_sheet_scores(self, scores, week_filter=None, results=None):
+        """
+        Update Google Sheet with final scores and, if given, graded pick points.
+        week_filter can be one week or a collection of weeks.
         """
         try:
             # Open the Google Sheet
             sheet = self.gc.open_by_key(self.sheet_id)
             worksheet = sheet.worksheet('Season Data')
-            print(f"✅ Connected to Google Sheet: {sheet.title}")
+            self.log(f"✅ Connected to Google Sheet: {sheet.title}")
             
-            # Get all current data
-            all_values = worksheet.get_all_values()
-            headers = all_values[0]
+            if week_filter is None:
+                weeks = None
+            elif isinstance(week_filter, (list, tuple, set)):
+                weeks = {str(w) for w in week_filter}
+            else:
+                weeks = {str(week_filter)}
+            
+            headers, sheet_rows = self.read_sheet_rows(sheet, worksheet, weeks)
             
             # Find relevant column indices
             away_team_col = headers.index('Away Team')
@@ -96,129 +199,448 @@ class NFLScoreUpdater:
             home_score_col = headers.index('Home Score')
             status_col = headers.index('Game Status')
             week_col = headers.index('Week') if 'Week' in headers else None
+            game_date_col = headers.index('Game Date') if 'Game Date' in headers else None
+            points_cols = self.points_columns(headers, results)
             
             updates_made = 0
+            points_updates = 0
+            cell_updates = []
+            scores_by_key = self.index_scores(scores)
             
-            # Go through each row and try to match with scores
-            for i, row in enumerate(all_values[1:], start=2):  # Start from row 2 (skip header)
+            # Go through each row and look up its score by (week, away, home)
+            for i, row in sheet_rows:
                 if len(row) <= max(away_team_col, home_team_col):
                     continue  # Skip empty/incomplete rows
                 
                 away_team = row[away_team_col] if away_team_col < len(row) else ''
                 home_team = row[home_team_col] if home_team_col < len(row) else ''
                 current_status = row[status_col] if status_col < len(row) else ''
+                row_week = row[week_col] if week_col is not None and week_col < len(row) else None
+                
+                # Skip if week filter specified and doesn't match
+                if weeks and week_col is not None:
+                    if str(row_week) not in weeks:
+                        continue
+                
+                # Fill in graded points, including for games scored on earlier runs
+                if points_cols and game_date_col is not None and row_week:
+                    game_id = f"{away_team}_{home_team}_{row[game_date_col]}"
+                    game_results = results.get(int(row_week), {}).get(game_id) if row_week.isdigit() else None
+                    if game_results:
+                        points_cells = changed_cells(row, i, [
+                            (col, self.format_points(game_results[player][pick_type]['points']))
+                            for (player, pick_type), col in points_cols.items()
+                            if player in game_results
+                        ])
+                        cell_updates.extend(points_cells)
+                        points_updates += len(points_cells)
                 
                 # Skip if already scored
                 if current_status == 'Final':
                     continue
-                    
-                # Skip if week filter specified and doesn't match
-                if week_filter and week_col is not None:
-                    row_week = row[week_col] if week_col < len(row) else ''
-                    if str(row_week) != str(week_filter):
-                        continue
                 
-                # Try to find matching score
-                for score in scores:
-                    if (self.team_name_match(away_team, score['away_team']) and 
-                        self.team_name_match(home_team, score['home_team'])):
-                        
-                        print(f"📊 Updating: {away_team} @ {home_team} = {score['away_score']}-{score['home_score']}")
-                        
-                        # Update the scores and status
-                        worksheet.update_cell(i, away_score_col + 1, score['away_score'])
-                        worksheet.update_cell(i, home_score_col + 1, score['home_score'])
-                        worksheet.update_cell(i, status_col + 1, 'Final')
-                        
-                        updates_made += 1
-                        break
+                key = game_key(row_week, away_team, home_team)
+                score = scores_by_key.get(key) if key else None
+                if not score:
+                    continue
+                
+                status = score.get('sheet_status') or 'Final'
+                self.log(f"📊 Updating: {away_team} @ {home_team} = {score['away_score']}-{score['home_score']} ({status})")
+                
+                # Queue the scores and status for a single batched write
+                cell_updates.extend(changed_cells(row, i, [
+                    (away_score_col, score['away_score']),
+                    (home_score_col, score['home_score']),
+                    (status_col, status),
+                ]))
+                
+                updates_made += 1
             
-            print(f"✅ Updated {updates_made} games in Google Sheet")
+            self.write_cells(worksheet, cell_updates)
             
-            if updates_made > 0:
-                print("\n📋 Next steps:")
-                print("1. Review the updated scores in your Google Sheet")
-                print("2. Calculate points for each player manually or with formulas")
-                print("3. Verify everything looks correct")
+            if self.sheets.dry_run:
+                self.log(self.sheets.plan_summary())
+            else:
+                self.log(f"✅ Updated {updates_made} games in Google Sheet ({len(cell_updates)} cells, {points_updates} points)")
+            self.log(f"📡 Google Sheets API calls this run: {self.sheets.count}")
             
+            if updates_made > 0 and not self.sheets.dry_run:
+                self.log("\n📋 Next steps:")
+                self.log("1. Review the updated scores and points in your Google Sheet")
+                self.log("2. Verify everything looks correct")
+        
         except Exception as e:
-            print(f"❌ Error updating Google Sheet: {e}")
+            self.log(f"❌ Error updating Google Sheet: {e}")
     
-    def team_name_match(self, sheet_name, api_name):
+    def points_columns(self, headers, results):
+        """Map (player, 'spread'|'total') to its points column, e.g. 'Jeff Spread Points'"""
+        if not results:
+            return {}
+        players = {player for week in results.values() for game in week.values() for player in game}
+        columns = {}
+        for player in players:
+            for pick_type, _ in PICK_TYPES:
+                header = points_header(player, pick_type)
+                if header in headers:
+                    columns[(player, pick_type)] = headers.index(header)
+        return columns
+    
+    def format_points(self, points):
+        """Sheet value for awarded points: blank for no pick, ints without .0"""
+        if points is None:
+            return ''
+        return int(points) if float(points).is_integer() else points
+    
+    def grade_picks(self):
         """
-        Try to match team names between sheet and API
-        (ESPN uses full names, your sheet might use city or abbreviations)
+        Grade every stored week's picks against final scores in one pass and
+        save the results to the season store as JSON and CSV (a dry run
+        grades with its unsaved scores and saves nothing)
         """
-        if not sheet_name or not api_name:
-            return False
-            
-        sheet_name = sheet_name.lower().strip()
-        api_name = api_name.lower().strip()
+        # numpy comes in with grading; runs without final scores never load it
+        from nflpicks.scoring import grade_season, load_points, write_results_csv
         
-        # Direct match
-        if sheet_name == api_name:
-            return True
+        history = [
+            (week, games_data, week_picks, self.pending_scores.get(week, scores))
+            for week, games_data, week_picks, scores in self.store.history()
+        ]
+        players = self.players
         
-        # Check if sheet name is contained in API name or vice versa
-        if sheet_name in api_name or api_name in sheet_name:
-            return True
-            
-        # Common team name mappings
-        team_mappings = {
-            'kansas city': ['chiefs', 'kc'],
-            'new england': ['patriots'],
-            'green bay': ['packers'],
-            'new orleans': ['saints'],
-            'san francisco': ['49ers'],
-            'los angeles': ['rams', 'chargers'],
-            'new york': ['giants', 'jets'],
-            'tampa bay': ['buccaneers', 'bucs']
-        }
+        # Grade each pick against the line showing when it was made
+        pick_lines = {}
+        for week, _, week_picks, _ in history:
+            for player, lines in self.store.pick_lines(week, week_picks).items():
+                pick_lines.setdefault(player, {}).update(lines)
         
-        for full_name, short_names in team_mappings.items():
-            if full_name in api_name.lower():
-                if any(short in sheet_name.lower() for short in short_names):
-                    return True
-            if full_name in sheet_name.lower():
-                if any(short in api_name.lower() for short in short_names):
-                    return True
+        results = grade_season(history, players, load_points(self.league.config_file), pick_lines)
+        if self.sheets.dry_run:
+            self.pending_results = results
+            self.log(f"🧮 Graded {sum(len(r) for r in results.values())} games for {len(players)} players (not saved)")
+            return results
+        for week, week_results in results.items():
+            self.store.save_results(week, week_results)
+        results_csv = os.path.join(self.store.season_dir, 'results.csv')
+        write_results_csv(results, results_csv)
+        self.log(f"🧮 Graded {sum(len(r) for r in results.values())} games for {len(players)} players ({results_csv})")
+        return results
+    
+    def update_standings(self, results):
+        """
+        Fold newly graded weeks into the saved standings.
+        Returns the Standings if any week changed, else None. They are only
+        saved by push_standings, once the tab has them.
+        """
+        standings = Standings.load(self.store)
+        changed = standings.update(results, self.players)
+        if not changed:
+            self.log("🏆 Standings unchanged")
+            return None
+        self.log(f"🏆 Standings updated for week(s) {', '.join(map(str, changed))}")
+        return standings
+    
+    def push_standings(self, standings):
+        """
+        Write the 'Standings' tab, then save the standings. If the write fails
+        nothing is saved, so the next run sees the same weeks as changed and retries.
+        """
+        rows = standings.sheet_rows(self.players)
+        if self.write_tab('Standings', rows, f"{len(rows) - 1} players") and not self.sheets.dry_run:
+            standings.save(self.store)
+    
+    def update_projection(self, standings=None):
+        """
+        Simulate the rest of the week and season from the current lines, save
+        the projection for the dashboard and write the 'Projection' tab
+        """
+        # numpy-backed, like grading; imported only when a projection runs
+        from nflpicks.projection import DEFAULT_SIMULATIONS, project_standings, sheet_rows
+        from nflpicks.scoring import load_points
+        
+        players = self.players
+        standings = standings or Standings.load(self.store)
+        projection = project_standings(self.store, standings, players, load_points(self.league.config_file),
+                                       regular_season_weeks=len(REGULAR_SEASON_WEEKS),
+                                       simulations=self.simulations or DEFAULT_SIMULATIONS,
+                                       workers=self.workers, scores=self.pending_scores,
+                                       results=self.pending_results)
+        if not projection:
+            return None
         
-        return False
+        leader = projection['season_projection']['table'][0]
+        self.log(f"🎲 {projection['season_projection']['simulations']:,} simulations: "
+              f"{leader['player'].title()} has a {leader['win_probability']:.1%} chance of finishing first")
+        if not self.sheets.dry_run:
+            self.store.save_projection(projection)
+        self.write_tab('Projection', sheet_rows(projection), f"{len(players)} players")
+        return projection
     
-    def run(self, week=None):
-        """Main function to update scores"""
-        print(f"🏈 NFL Score Updater Starting...")
+    def write_tab(self, title, rows, summary):
+        """Write a whole tab in one batch (the tab is created on first use). Returns True if it was written."""
+        import gspread
         
-        if week:
-            print(f"📅 Fetching scores for Week {week}")
-        else:
-            print(f"📅 Fetching scores for current week")
+        try:
+            sheet = self.gc.open_by_key(self.sheet_id)
+            try:
+                worksheet = sheet.worksheet(title)
+            except gspread.exceptions.WorksheetNotFound:
+                worksheet = sheet.add_worksheet(title=title, rows=len(rows) + 10,
+                                                cols=max(len(row) for row in rows) + 5)
+            # RAW so records like '10-5-1' aren't read as dates
+            worksheet.batch_update([{'range': 'A1', 'values': rows}], value_input_option='RAW')
+            if not self.sheets.dry_run:
+                self.log(f"✅ Updated {title} tab ({summary})")
+            return True
+        except Exception as e:
+            self.log(f"❌ Error updating {title} tab: {e}")
+            return False
+    
+    def write_cells(self, worksheet, cell_updates):
+        """Send all queued cell updates in one batch_update request"""
+        if not cell_updates:
+            return
+        worksheet.batch_update(cell_updates, value_input_option='USER_ENTERED')
+    
+    def index_scores(self, scores):
+        """
+        Index scores by (week, away code, home code).
+        Each score is also stored under week None so sheets without a
+        Week column can still be matched.
+        """
+        scores_by_key = {}
+        for score in scores:
+            away_code = score.get('away_code') or team_code(score['away_team'])
+            home_code = score.get('home_code') or team_code(score['home_team'])
+            if not away_code or not home_code:
+                self.log(f"⚠️  Unknown team in ESPN data: {score['away_team']} @ {score['home_team']}")
+                continue
+            week = score.get('week')
+            scores_by_key[(str(week) if week is not None else None, away_code, home_code)] = score
+            scores_by_key[(None, away_code, home_code)] = score
+        return scores_by_key
+    
+    def save_scores(self, scores):
+        """Write final scores through to the season store, grouped by week"""
+        scores_by_week = {}
+        for score in scores:
+            if score.get('week') is not None:
+                scores_by_week.setdefault(score['week'], []).append(score)
+        for week, week_scores in scores_by_week.items():
+            if self.sheets.dry_run:
+                self.pending_scores[week] = self.store.merge_scores(week, week_scores, self.pending_scores.get(week))
+                self.log(f"🗄️  Would save {len(week_scores)} Week {week} scores to {self.store.week_dir(week)}")
+                continue
+            self.store.save_scores(week, week_scores)
+            self.log(f"🗄️  Saved {len(week_scores)} Week {week} scores to {self.store.week_dir(week)}")
+    
+    def resolve_week(self, week=None, seasontype=REGULAR_SEASON):
+        """
+        (week, seasontype) to ask ESPN for. Without a week this is the season
+        calendar's current week, so score agrees with scrape on week
+        boundaries; sheet weeks 19-23 map to the playoff weeks.
+        """
+        try:
+            season_start = datetime.strptime(self.league.config['season_start_date'], '%Y-%m-%d')
+        except (KeyError, ValueError):
+            season_start = None
+        calendar = load_calendar(self.store, season_start, self.scoreboard, cache=not self.sheets.dry_run)
+        if calendar is None:
+            return week, seasontype  # ESPN picks its current week
         
-        # Get scores from ESPN
-        scores = self.get_nfl_scores(week)
+        if week is None:
+            seasontype, week = calendar.espn_week(calendar.week_at(datetime.now(timezone.utc)))
+            self.log(f"📅 Current week from the season calendar: {calendar.label(sheet_week(week, seasontype))}")
+        elif seasontype == REGULAR_SEASON:
+            seasontype, week = calendar.espn_week(week) or (seasontype, week)
+        return week, seasontype
+    
+    def run(self, week=None, seasontype=REGULAR_SEASON):
+        """
+        Main function to update scores.
+        week can be one week or a list of weeks to backfill; either way the
+        sheet is read once and written in a single batch.
+        """
+        self.log(f"🏈 NFL Score Updater Starting...")
+        
+        if isinstance(week, (list, tuple)):
+            weeks = list(week)
+            self.log(f"📅 Backfilling scores for {len(weeks)} weeks")
+            scores = self.get_nfl_scores_for_weeks(weeks, seasontype)
+            week_filter = [sheet_week(w, seasontype) for w in weeks]
+        else:
+            if week:
+                self.log(f"📅 Fetching scores for Week {sheet_week(week, seasontype)}")
+            else:
+                self.log(f"📅 Fetching scores for current week")
+            
+            # Get scores from ESPN
+            scores = self.get_nfl_scores(week, seasontype)
+            week_filter = sheet_week(week, seasontype)
         
         if not scores:
-            print("⚠️ No completed games found")
+            self.log("⚠️ No completed games found")
             return
         
-        print(f"\n📋 Completed games found:")
+        self.log(f"\n📋 Completed games found:")
         for score in scores:
-            print(f"   {score['away_team']} {score['away_score']} - {score['home_score']} {score['home_team']}")
+            self.log(f"   {score['away_team']} {score['away_score']} - {score['home_score']} {score['home_team']}")
+        
+        # Keep final scores in the season store and grade picks against them
+        self.save_scores(scores)
+        results = self.grade_picks()
+        standings = self.update_standings(results)
         
         # Update Google Sheet
-        print(f"\n📊 Updating Google Sheet...")
-        self.update_sheet_scores(scores, week)
+        self.log(f"\n📊 Updating Google Sheet...")
+        self.update_sheet_scores(scores, week_filter, results)
+        if standings:
+            self.push_standings(standings)
+        if standings or not self.store.load_projection():
+            self.update_projection(standings)
         
-        print(f"\n🎉 Score update completed!")
+        self.log(f"\n🎉 Score update completed!")
+    
+    def watch(self, week=None, seasontype=REGULAR_SEASON, live_interval=60, idle_interval=6 * 3600):
+        """
+        Poll the scoreboard until every game is final, writing only games
+        whose status or score changed since the last poll.
+        Polls quickly while games are live and backs off between kickoffs.
+        """
+        self.log(f"👀 Watching scores{f' for Week {week}' if week else ''} (Ctrl+C to stop)...")
+        try:
+            with open('games.json', 'r') as f:
+                kickoffs = load_kickoffs(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            kickoffs = []
+        
+        last_seen = {}
+        while True:
+            try:
+                data, changed = self.scoreboard.fetch(week, seasontype)
+                games = parse_scoreboard(data, week, seasontype)
+            except requests.exceptions.RequestException as e:
+                self.log(f"❌ Error fetching NFL scores: {e}")
+                changed, games = False, []
+            
+            if changed:
+                updates = []
+                for game in games:
+                    if not game['sheet_status']:
+                        continue
+                    state = (game['status'], game['away_score'], game['home_score'])
+                    key = (game['week'], game['away_code'], game['home_code'])
+                    if last_seen.get(key) != state:
+                        last_seen[key] = state
+                        updates.append(game)
+                
+                if updates:
+                    self.log(f"\n🔔 {len(updates)} game(s) changed")
+                    finals = [g for g in updates if g['status'] == 'STATUS_FINAL']
+                    results = standings = None
+                    if finals:
+                        self.save_scores(finals)
+                        results = self.grade_picks()
+                        standings = self.update_standings(results)
+                    self.update_sheet_scores(updates, sheet_week(week, seasontype), results)
+                    if standings:
+                        self.push_standings(standings)
+                        self.update_projection(standings)
+            
+            if games and all(g['status'] == 'STATUS_FINAL' for g in games):
+                self.log("🏁 All games final, done watching")
+                return
+            
+            live = any(g['status'] in LIVE_STATUSES for g in games)
+            interval = next_poll_interval(datetime.now(timezone.utc), kickoffs, live,
+                                          live_interval=live_interval, idle_interval=idle_interval)
+            self.log(f"⏱️  Next check in {timedelta(seconds=interval)}")
+            time.sleep(interval)
+
+def parse_weeks(value):
+    """Parse a week list like '1-18' or '1,3,5-7'"""
+    weeks = []
+    for part in value.split(','):
+        start, _, end = part.strip().partition('-')
+        weeks.extend(range(int(start), int(end or start) + 1))
+    return sorted(set(weeks))
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Update NFL game scores in Google Sheet')
-    parser.add_argument('--week', type=int, help='Specific week to update (optional)')
+    parser.add_argument('--week', type=int, help='Specific week to update, playoffs are 19-23 (default: the current week)')
+    parser.add_argument('--weeks', type=parse_weeks, help="Backfill several weeks at once, e.g. '1-18' or '1,3,5-7'")
+    parser.add_argument('--season', action='store_true', help='Backfill every week of the season')
+    parser.add_argument('--postseason', action='store_true',
+                        help='Score playoff games (ESPN seasontype 3; stored as weeks 19-23)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep polling and write live score changes until every game is final')
+    parser.add_argument('--interval', type=int, default=60,
+                        help='Seconds between polls while games are live (default: 60)')
+    parser.add_argument('--fixtures', help='Replay recorded ESPN scoreboard responses from this directory')
+    parser.add_argument('--record', help='Save every ESPN scoreboard response to this directory')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Read the sheet and print the cells that would change, without writing them')
+    parser.add_argument('--simulations', type=int,
+                        help='Monte Carlo simulations for the Projection tab (default: 100,000)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processes to spread the projection over (default: 1)')
+    parser.add_argument('--league', action='append',
+                        help='Score only this league from leagues.json (repeatable; default: every league)')
+    parser.add_argument('--parallel', type=int,
+                        help="Leagues to score at once (default: leagues.json's max_parallel)")
     args = parser.parse_args()
     
-    updater = NFLScoreUpdater()
-    updater.run(args.week)
+    try:
+        leagues, max_parallel = load_leagues()
+        leagues = select_leagues(leagues, args.league)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    if args.watch and len(leagues) > 1:
+        print("❌ --watch follows one league; choose it with --league")
+        return
+    
+    shared = None
+    if len(leagues) > 1:
+        # Every league scores the same slate: fetch each week's scoreboard once
+        if args.fixtures:
+            scoreboard = FixtureScoreboard(args.fixtures)
+        else:
+            scoreboard = ScoreboardClient(record_dir=args.record)
+        shared = SharedServices(SharedScoreboard(scoreboard))
+    
+    def updater_for(league, out=None):
+        return NFLScoreUpdater(fixture_dir=args.fixtures, record_dir=args.record, dry_run=args.dry_run,
+                               simulations=args.simulations, workers=args.workers, league=league, shared=shared,
+                               out=out)
+    
+    seasontype = POSTSEASON if args.postseason else REGULAR_SEASON
+    updater = updater_for(leagues[0])
+    week = args.week
+    if not (args.weeks or args.season or args.fixtures):
+        # Recorded scoreboards carry their own week; otherwise one lookup serves every league
+        week, seasontype = updater.resolve_week(week, seasontype)
+    if args.watch:
+        try:
+            updater.watch(week, seasontype, live_interval=args.interval)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+        default_report.flush('score')
+        return
+    if args.season:
+        week = POSTSEASON_WEEKS if args.postseason else REGULAR_SEASON_WEEKS
+    elif args.weeks:
+        week = args.weeks
+    
+    def score_league(league, out):
+        try:
+            (updater_for(league, out) if shared else updater).run(week, seasontype)
+        except Exception as e:
+            if not shared:
+                raise
+            print(f"❌ Score update failed: {e}", file=out)
+    
+    run_leagues(leagues, score_league, args.parallel or max_parallel)
+    default_report.flush('score')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
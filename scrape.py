@@ -1,25 +1,27 @@
 import requests
+import hashlib
 import json
 import os
 import argparse
-from datetime import datetime, timedelta
+import subprocess
+import time
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 import urllib3
+from nflpicks.api import ApiClient, default_report
+from nflpicks.bundle import build_bundle
+from nflpicks.config import load_config
+from nflpicks.espn import ScoreboardClient
+from nflpicks.leagues import League, load_leagues
+from nflpicks.schedule import load_calendar
+from nflpicks.store import SeasonStore
+from nflpicks.ticker import Quarantine, iter_matchups, iter_ticker_items
 
 # Load environment variables
 load_dotenv()
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def load_config():
-    """Load configuration from config.json"""
-    try:
-        with open('config.json', 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print("config.json not found. Please create it with player names and settings.")
-        exit(1)
-
 def get_season_start_date(config):
     """Get season start date from config"""
     try:
@@ -28,154 +30,259 @@ def get_season_start_date(config):
         print("Invalid or missing season_start_date in config.json")
         exit(1)
 
-def calculate_nfl_week(config, override_week=None):
+def calculate_nfl_week(config, override_week=None, calendar=None):
     """
-    Calculate which NFL week to fetch based on current date and season start.
-    Returns week number and the date range for that week.
+    Work out which NFL week to fetch from the season calendar.
+    Returns the sheet week number (playoffs are 19-23) and its (start, end)
+    as Eastern times, like OddsShark's event dates.
     """
+    if calendar is None:
+        calendar = load_season_calendar(config)
+    
     if override_week:
         print(f"🔧 Using manual week override: Week {override_week}")
-        return override_week, get_week_date_range(config, override_week)
-    
-    season_start = get_season_start_date(config)
-    today = datetime.now()
-    
-    # If before season starts, default to Week 1
-    if today < season_start:
-        print(f"📅 Before season start ({season_start.strftime('%m/%d/%Y')}), defaulting to Week 1")
-        return 1, get_week_date_range(config, 1)
-    
-    # Calculate which week we're in based on season start
-    days_since_start = (today - season_start).days
-    current_week = (days_since_start // 7) + 1
-    
-    # Cap at reasonable week numbers (regular season is ~18 weeks)
-    current_week = min(current_week, 18)
+        week_number = override_week
+    else:
+        now = datetime.now(timezone.utc)
+        week_number = calendar.week_at(now)
+        week_start, _ = calendar.window(week_number)
+        label = calendar.label(week_number)
+        if now < week_start:
+            print(f"📅 Before season start ({week_start.strftime('%m/%d/%Y')}), defaulting to Week {week_number}")
+        elif label != f"Week {week_number}":
+            print(f"📅 Currently {label} (Week {week_number})")
+        else:
+            print(f"📅 Currently Week {week_number}")
     
-    print(f"📅 Season started {season_start.strftime('%m/%d/%Y')}, currently Week {current_week}")
-    return current_week, get_week_date_range(config, current_week)
+    week_range = calendar.local_window(week_number)
+    if not week_range:
+        print(f"Week {week_number} isn't in the {config['current_season']} season calendar")
+        exit(1)
+    return week_number, week_range
+
+def load_season_calendar(config):
+    """The cached season calendar, fetched from ESPN the first time"""
+    store = SeasonStore(config['current_season'])
+    return load_calendar(store, get_season_start_date(config), ScoreboardClient())
 
-def get_week_date_range(config, week_number):
+def fetch_games(client=None, exit_on_error=True):
     """
-    Get the date range for a specific NFL week.
-    NFL weeks typically run Thursday to Wednesday.
+    Fetch NFL games from OddsShark API.
+    Returns the streamed response; read it with iter_ticker_items.
     """
-    season_start = get_season_start_date(config)
-    
-    # Calculate the start of the requested week
-    # Week 1 starts on season_start_date, subsequent weeks are 7 days apart
-    week_start = season_start + timedelta(weeks=week_number - 1)
-    
-    # Ensure we start on a Thursday (NFL week start)
-    # Adjust if season_start isn't a Thursday
-    days_to_thursday = (3 - week_start.weekday()) % 7  # Thursday is 3
-    if week_start.weekday() != 3:  # If not Thursday
-        week_start = week_start - timedelta(days=week_start.weekday()) + timedelta(days=3)
-        if week_number > 1:
-            week_start += timedelta(weeks=week_number - 1)
-    
-    week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    # Week ends next Wednesday
-    week_end = week_start + timedelta(days=6, hours=23, minutes=59)
-    
-    return week_start, week_end
-
-def fetch_games():
-    """Fetch NFL games from OddsShark API"""
+    client = client or ApiClient('oddsshark')
     try:
-        r = requests.get(
+        r = client.get(
             'https://io.oddsshark.com/ticker/nfl',
+            'ticker',
             headers={
                 'referer': 'https://www.oddsshark.com/nfl/scores'
             },
-            verify=False
+            verify=False,
+            stream=True
         )
         r.raise_for_status()
-        return r.json()['matchups']
+        return r
     except requests.exceptions.RequestException as e:
         print(f"An error occurred fetching games: {e}")
-        exit(1)
+        if exit_on_error:
+            exit(1)
+        return None
 
 def filter_games_by_week(matchups, min_date, max_date, week_number):
-    """Filter games to specified week and format data"""
-    min_date_str = min_date.strftime("%Y-%m-%d %H:%M")
-    max_date_str = max_date.strftime("%Y-%m-%d %H:%M")
-    
+    """
+    Filter ticker items to specified week and format data.
+    Rows that fail validation are skipped and counted, not fatal.
+    """
     print(f"🔍 Filtering games between {min_date.strftime('%m/%d/%Y')} and {max_date.strftime('%m/%d/%Y')}")
     
-    games = []
-    for matchup in matchups:
-        if (matchup["type"] == "matchup" and 
-            matchup["event_date"] >= min_date_str and 
-            matchup["event_date"] <= max_date_str):
-            
-            game = {
-                "id": f"{matchup['away_name']}_{matchup['home_name']}_{matchup['event_date']}",
-                "week": week_number,
-                "game_date": matchup["event_date"],
-                "away_team": matchup["away_name"],
-                "home_team": matchup["home_name"],
-                "away_odds": matchup["away_odds"],
-                "home_odds": matchup["home_odds"],
-                "over_under": matchup["total"],
-                "matchup_link": f"https://www.oddsshark.com{matchup['matchup_link']}"
-            }
-            games.append(game)
+    quarantine = Quarantine()
+    games = [matchup.to_game(week_number) for matchup in iter_matchups(matchups, min_date, max_date, quarantine)]
+    
+    if quarantine.count:
+        print(f"⚠️  Skipped {quarantine.count} malformed matchups:")
+        for example in quarantine.examples:
+            print(f"   {example}")
     
     return games
 
-def save_games_json(games, config, week_number, week_start):
-    """Save games data to JSON file"""
+def save_games_json(games, config, week_number, week_start, week_label=None, leagues=None):
+    """Save games data to JSON file and through to every league's season store"""
     output_data = {
         "week": week_number,
+        "week_label": week_label or f"Week {week_number}",
         "week_start": week_start.strftime("%Y-%m-%d"),
         "generated_at": datetime.now().isoformat(),
         "players": config["players"],
         "games": games
     }
     
+    # One slate for every league: each league's store gets the games and line history
+    stores = [(league.store(), league.picks_dir) for league in leagues or [League.default()]]
+    
+    # Keep last week's games and picks in the season store before replacing them
+    for store, picks_dir in stores:
+        archived_week = store.archive_current(picks_dir=picks_dir)
+        if archived_week and archived_week != week_number:
+            print(f"🗄️  Archived Week {archived_week} games and picks to {store.week_dir(archived_week)}")
+    
     with open('games.json', 'w') as f:
         json.dump(output_data, f, indent=2)
     
+    for store, _ in stores:
+        store.save_games(output_data)
+        # Log line movement: only games whose lines changed since the last run get a row
+        changed_lines = store.record_lines(week_number, games)
+        print(f"📈 Recorded {changed_lines} line changes to {store.week_dir(week_number)}/lines.csv")
+    
     print(f"✅ Saved {len(games)} games to games.json")
     print(f"📅 Week {week_number} starting: {week_start.strftime('%B %d, %Y')}")
+    print(f"📦 Built site bundle {build_bundle()}")
 
-def main():
-    parser = argparse.ArgumentParser(description='NFL Picks Scraper')
-    parser.add_argument('--week', type=int, help='Override which week to fetch (1-18)')
-    args = parser.parse_args()
-    
-    print("🏈 NFL Picks Scraper Starting...")
+def week_content_hash(week_number, week_start, games):
+    """Hash of the parts of games.json that matter (everything but generated_at)"""
+    content = json.dumps({
+        "week": week_number,
+        "week_start": week_start,
+        "games": games
+    }, sort_keys=True)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def games_json_hash(path='games.json'):
+    """Content hash of the current games.json, or None if there isn't one"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return week_content_hash(data.get('week'), data.get('week_start'), data.get('games', []))
+
+def pull_latest():
+    """
+    Rebase onto the remote before touching games.json: players' picks are
+    committed there by the save-picks function, so the local picks/ would
+    be stale and the push would be rejected. Returns False if the pull failed.
+    """
+    result = subprocess.run(['git', 'pull', '--rebase', '--autostash', '-q'], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"⚠️  git pull --rebase failed: {result.stderr.strip()}")
+        return False
+    return True
+
+def commit_and_push(week_number, leagues=None):
+    """Commit games.json and every league's season store, then push (triggers the Netlify rebuild)"""
+    leagues = leagues or [League.default()]
+    store_roots = [league.store_root for league in leagues if os.path.isdir(league.store_root)]
+    try:
+        subprocess.run(['git', 'add', 'games.json'] + store_roots, check=True)
+        if subprocess.run(['git', 'diff', '--cached', '--quiet']).returncode == 0:
+            print("ℹ️  Nothing to commit")
+            return
+        subprocess.run(['git', 'commit', '-q', '-m', f"Update Week {week_number} games and lines"], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ git commit failed: {e}")
+        return
     
-    # Load configuration
-    config = load_config()
+    result = subprocess.run(['git', 'push', '-q'], capture_output=True)
+    if result.returncode != 0 and pull_latest():
+        # A pick was saved between our pull and push; replay the commit on top and retry once
+        result = subprocess.run(['git', 'push', '-q'])
+    if result.returncode == 0:
+        print("🚀 Pushed to GitHub")
+    else:
+        print("❌ git push failed; the commit is saved locally")
+
+def scrape(config, override_week=None, client=None, push=False, exit_on_error=True, leagues=None):
+    """
+    Fetch and filter one week of games. games.json is only rewritten (and
+    committed/pushed when push=True) if the week's content changed. leagues
+    (from load_leagues) are the stores the week is written through to.
+    Returns True if anything changed.
+    """
+    # Start from the remote's games and picks so archiving and the push see them
+    if push:
+        pull_latest()
     
     # Calculate which week to fetch
-    week_number, (min_date, max_date) = calculate_nfl_week(config, args.week)
+    calendar = load_season_calendar(config)
+    week_number, (min_date, max_date) = calculate_nfl_week(config, override_week, calendar)
     
-    # Fetch all matchups
-    all_matchups = fetch_games()
-    print(f"🔍 Found {len(all_matchups)} total matchups from API")
+    # Stream all matchups from the ticker
+    response = fetch_games(client, exit_on_error)
+    if response is None:
+        return False
     
     # Filter to specified week games
-    current_week_games = filter_games_by_week(all_matchups, min_date, max_date, week_number)
+    try:
+        current_week_games = filter_games_by_week(iter_ticker_items(response), min_date, max_date, week_number)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"An error occurred reading games: {e}")
+        if exit_on_error:
+            exit(1)
+        return False
+    finally:
+        response.close()
     
     if not current_week_games:
         print(f"⚠️  No games found for Week {week_number}.")
         print(f"   Date range: {min_date.strftime('%m/%d/%Y')} to {max_date.strftime('%m/%d/%Y')}")
         print("   This might be normal during off-season or if the week hasn't been published yet.")
-        
-        # Still save an empty structure for consistency
-        save_games_json([], config, week_number, min_date)
+    
+    # Skip the write (and the commit/push and Netlify rebuild) when nothing changed
+    new_hash = week_content_hash(week_number, min_date.strftime("%Y-%m-%d"), current_week_games)
+    if new_hash == games_json_hash():
+        print(f"✅ Week {week_number} unchanged, games.json left as is")
+        return False
+    
+    # Save to JSON (an empty structure is still saved for consistency)
+    save_games_json(current_week_games, config, week_number, min_date, calendar.label(week_number), leagues)
+    
+    if current_week_games:
+        print(f"\n📋 Games found for Week {week_number}:")
+        for game in current_week_games:
+            print(f"   {game['away_team']} @ {game['home_team']} - {game['game_date']}")
+    
+    if push:
+        commit_and_push(week_number, leagues)
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description='NFL Picks Scraper')
+    parser.add_argument('--week', type=int, help='Override which week to fetch (1-18, playoffs 19-23)')
+    parser.add_argument('--once', action='store_true',
+                        help='Cron-friendly run: scrape, and commit/push only if the week changed')
+    parser.add_argument('--serve', action='store_true',
+                        help='Keep running, re-scraping every --interval seconds and pushing changes')
+    parser.add_argument('--interval', type=int, default=3600,
+                        help='Seconds between scrapes in --serve mode (default: 3600)')
+    args = parser.parse_args()
+    
+    print("🏈 NFL Picks Scraper Starting...")
+    
+    # Load configuration, and the leagues the slate is shared with
+    config = load_config()
+    try:
+        leagues, _ = load_leagues()
+    except ValueError as e:
+        print(f"❌ {e}")
         return
     
-    # Save to JSON
-    save_games_json(current_week_games, config, week_number, min_date)
+    if not args.serve:
+        scrape(config, args.week, push=args.once, leagues=leagues)
+        default_report.flush('scrape')
+        return
     
-    print(f"\n📋 Games found for Week {week_number}:")
-    for game in current_week_games:
-        print(f"   {game['away_team']} @ {game['home_team']} - {game['game_date']}")
+    # Long-running mode: one process, one keep-alive session
+    client = ApiClient('oddsshark')
+    print(f"🔁 Serving: scraping every {args.interval}s (Ctrl+C to stop)")
+    try:
+        while True:
+            print(f"\n🕒 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            scrape(config, args.week, client=client, push=True, exit_on_error=False, leagues=leagues)
+            default_report.flush('scrape')
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped serving")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,29 +1,38 @@
-
 #!/bin/bash
 
 # Define the name of the virtual environment
 ENV_NAME="myenv"
 
-# Remove existing environment if it exists (to fix any issues)
-if [ -d "$ENV_NAME" ]; then
+# Stamp file recording which requirements.txt the environment was built from
+REQUIREMENTS_STAMP="$ENV_NAME/.requirements.sha"
+
+# Rebuild from scratch only when asked (REBUILD=1 ./setup.sh)
+if [ -d "$ENV_NAME" ] && [ "$REBUILD" = "1" ]; then
     echo "Removing existing virtual environment..."
     rm -rf $ENV_NAME
 fi
 
-# Create a new virtual environment
-echo "Creating virtual environment $ENV_NAME..."
-python3 -m venv $ENV_NAME
+# Create the virtual environment if it doesn't exist yet
+if [ ! -d "$ENV_NAME" ]; then
+    echo "Creating virtual environment $ENV_NAME..."
+    python3 -m venv $ENV_NAME
+fi
 
 # Activate the virtual environment
 source $ENV_NAME/bin/activate
 
 echo "Virtual environment $ENV_NAME activated."
 
-# Install/update packages from requirements.txt
-pip install -r requirements.txt
+# Install/update packages only when requirements.txt changed
+REQUIREMENTS_SHA=$(python3 -c "import hashlib; print(hashlib.sha256(open('requirements.txt', 'rb').read()).hexdigest())")
+if [ ! -f "$REQUIREMENTS_STAMP" ] || [ "$(cat $REQUIREMENTS_STAMP)" != "$REQUIREMENTS_SHA" ]; then
+    pip install -r requirements.txt && echo "$REQUIREMENTS_SHA" > "$REQUIREMENTS_STAMP"
+else
+    echo "Requirements unchanged, skipping pip install."
+fi
 
 # Run the scraper with any passed arguments
 python3 scrape.py "$@"
 
 # Deactivate the environment
-deactivate
\ No newline at end of file
+deactivate
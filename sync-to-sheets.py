@@ -1,76 +1,137 @@
-import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from dotenv import load_dotenv
-import gspread
-from google.oauth2.service_account import Credentials
-import requests
+from nflpicks.api import SheetsMeter, default_report
+from nflpicks.github import GitHubFetcher
+from nflpicks.leagues import League, main_repo, SharedServices, load_leagues, run_leagues, select_leagues
+from nflpicks.local import LocalFetcher
+from nflpicks.locks import enforce_locks, history_window, lock_index
+from nflpicks.sheets import PICK_TYPES, WeekIndex, appended_rows, changed_cells, column_letter, sync_column_count
 
 # Load environment variables
 load_dotenv()
 
+# Rosters larger than this fetch picks with one Git trees call instead of
+# one contents call per player
+TREE_FETCH_PLAYERS = 10
+
+def authorize_sheets():
+    """An authorized gspread client for the service account in google-credentials.json"""
+    # Imported here so runs that never touch the sheet don't pay for them
+    import gspread
+    from google.oauth2.service_account import Credentials
+    
+    # Define the scope
+    scope = [
+        'https://spreadsheets.google.com/feeds',
+        'https://www.googleapis.com/auth/drive'
+    ]
+    
+    # Load credentials from JSON file
+    creds_file = 'google-credentials.json'
+    if not os.path.exists(creds_file):
+        print(f"❌ Google credentials file '{creds_file}' not found!")
+        print("Please download your service account JSON file and name it 'google-credentials.json'")
+        exit(1)
+    
+    creds = Credentials.from_service_account_file(creds_file, scopes=scope)
+    return gspread.authorize(creds)
+
 class NFLSheetsSync:
-    def __init__(self):
-        self.setup_google_sheets()
+    def __init__(self, source='github', use_tree=False, pull=False, dry_run=False, league=None, shared=None,
+                 out=None):
+        # shared (a SharedServices) is set when several leagues sync in one run,
+        # and out is then the league's own output stream (None: stdout)
+        self.shared = shared
+        self.out = out
+        self.sheets = SheetsMeter(dry_run=dry_run, bucket=shared.sheets_bucket if shared else None, out=out)
+        self._gc = None  # Authorized on first use, see gc
+        self.league = league or League.default()
         self.github_token = os.getenv('GITHUB_TOKEN')
-        self.repo_owner = os.getenv('GITHUB_REPO_OWNER', 'jmhale15')
-        self.repo_name = os.getenv('GITHUB_REPO_NAME', 'nfl-picks')
-        self.sheet_id = os.getenv('GOOGLE_SHEET_ID')
-        
+        self.repo_owner = self.league.repo_owner
+        self.repo_name = self.league.repo_name
+        self.sheet_id = self.league.sheet_id
+        self.players = self.league.players
+        self.use_tree = use_tree or len(self.players) > TREE_FETCH_PLAYERS
+        self.store = self.league.store()
+        # Columns sync owns (Week through the last O/U pick). Scores, points and
+        # Game Status are written by score-games.py and never overwritten here.
+        self.sync_columns = sync_column_count(self.players)
+        if source == 'local':
+            self.source = LocalFetcher(pull=pull, out=out)
+        else:
+            self.source = GitHubFetcher(self.repo_owner, self.repo_name, self.github_token, out=out)
+        # games.json lives in the main repo, where scrape.py pushes it
+        if source == 'local' or self.league.uses_main_repo():
+            self.slate_source = self.source
+        else:
+            self.slate_source = GitHubFetcher(*main_repo(), self.github_token, out=out)
+    
+    def log(self, *args):
+        """print() to this run's output stream"""
+        print(*args, file=self.out)
+    
+    @property
+    def gc(self):
+        """The gspread client, authorized the first time the sheet is needed"""
+        if self._gc is None:
+            self.setup_google_sheets()
+        return self._gc
+    
+    @gc.setter
+    def gc(self, client):
+        self._gc = client
+    
     def setup_google_sheets(self):
-        """Setup Google Sheets API connection"""
-        # Define the scope
-        scope = [
-            'https://spreadsheets.google.com/feeds',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        
-        # Load credentials from JSON file
-        creds_file = 'google-credentials.json'
-        if not os.path.exists(creds_file):
-            print(f"❌ Google credentials file '{creds_file}' not found!")
-            print("Please download your service account JSON file and name it 'google-credentials.json'")
-            exit(1)
-            
-        creds = Credentials.from_service_account_file(creds_file, scopes=scope)
-        self.gc = gspread.authorize(creds)
-        
+        """Setup Google Sheets API connection (authorized once for every league in a run)"""
+        client = self.shared.once('sheets', authorize_sheets) if self.shared else authorize_sheets()
+        self.gc = self.sheets.wrap(client)
+    
     def get_github_file(self, path):
-        """Get a file from GitHub repo"""
-        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/contents/{path}"
-        headers = {
-            'Authorization': f'token {self.github_token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
+        """Get a file from the configured source (GitHub repo or local checkout)"""
+        return self.source.get_file(path)
+    
+    def load_source_files(self):
+        """
+        Fetch games.json and every player's picks in one pass. In a multi-league
+        run games.json is read once and shared; each league fetches its own picks.
+        """
+        paths = [self.league.picks_path(player) for player in self.players]
+        if self.shared:
+            games_data = self.shared.once('games.json', lambda: self.slate_source.get_file('games.json'))
+        elif self.slate_source is self.source:
+            paths.insert(0, 'games.json')
+        else:
+            games_data = self.slate_source.get_file('games.json')
         
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            # Decode base64 content
-            import base64
-            content = base64.b64decode(data['content']).decode('utf-8')
-            return json.loads(content)
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching {path}: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"❌ Error parsing {path}: {e}")
-            return None
-    
-    def load_games_data(self):
+        if isinstance(self.source, LocalFetcher):
+            self.log("📂 Reading games and picks from local checkout")
+            files = self.source.get_files(paths)
+        else:
+            if self.use_tree:
+                files = self.source.get_files_via_tree(paths)
+            else:
+                files = self.source.get_files(paths)
+            stats = self.source.stats
+            self.log(f"📡 GitHub requests: {stats['requests']} ({stats['not_modified']} unchanged, served from cache)")
+        if 'games.json' not in files:
+            files['games.json'] = games_data
+        return files
+    
+    def load_games_data(self, files=None):
         """Load games data from GitHub, with mock data fallback"""
-        games_data = self.get_github_file('games.json')
+        if files is None:
+            files = {'games.json': self.get_github_file('games.json')}
+        games_data = files.get('games.json')
         if not games_data or not games_data.get('games'):
-            print("⚠️  No real games found in games.json, using mock data for testing...")
+            self.log("⚠️  No real games found in games.json, using mock data for testing...")
             
             # Use the same mock data as the website
             games_data = {
                 "week": 1,
                 "week_start": "2025-09-05",
                 "generated_at": "2025-08-22T00:00:00.000Z",
-                "players": ["jeff", "teddy", "will"],
+                "players": self.players,
                 "games": [
                     {
                         "id": "KC_BAL_2025-09-05 20:20",
@@ -94,35 +155,66 @@ class NFLSheetsSync:
                     }
                 ]
             }
-            
+        
         return games_data
     
-    def load_all_picks(self):
+    def load_all_picks(self, files=None):
         """Load picks for all players from GitHub"""
-        players = ['jeff', 'teddy', 'will']
+        if files is None:
+            files = self.source.get_files([self.league.picks_path(player) for player in self.players])
         all_picks = {}
         
-        for player in players:
-            picks_data = self.get_github_file(f'picks/{player}.json')
+        for player in self.players:
+            picks_data = files.get(self.league.picks_path(player))
             if picks_data:
                 all_picks[player] = picks_data.get('picks', {})
-                print(f"✅ Loaded picks for {player}")
+                self.log(f"✅ Loaded picks for {player}")
             else:
                 all_picks[player] = {}
-                print(f"⚠️  No picks found for {player}")
-                
+                self.log(f"⚠️  No picks found for {player}")
+        
         return all_picks
     
+    def enforce_pick_locks(self, games_data, files):
+        """
+        Undo picks changed or removed after their game kicked off. Commit
+        timestamps are the source of truth: a started game keeps the pick from
+        the last commit before its kickoff, or none. Updates files in place.
+        """
+        locks = lock_index(games_data)
+        if not locks:
+            return
+        
+        # One history call covers the common case: nothing committed since the first kickoff
+        first_kickoff = datetime.fromtimestamp(min(locks.values()), timezone.utc)
+        if not self.source.file_history(self.league.picks_dir, since=first_kickoff):
+            return
+        
+        since = history_window(games_data)
+        for player in self.players:
+            path = self.league.picks_path(player)
+            picks_data = files.get(path)
+            if not picks_data or picks_data.get('week') != games_data.get('week'):
+                continue
+            picks, late = enforce_locks(path, picks_data, locks, self.source, since)
+            if late:
+                files[path] = {**picks_data, 'picks': picks}
+                self.log(f"🔒 {player}: ignored {len(late)} pick(s) changed or removed after kickoff")
+    
+    def archive_week(self, games_data, files):
+        """Write this week's games and picks through to the season store"""
+        self.store.save_games(games_data)
+        for player in self.players:
+            picks_data = files.get(self.league.picks_path(player))
+            if picks_data and picks_data.get('week') == games_data.get('week'):
+                self.store.save_picks(player, picks_data)
+        self.log(f"🗄️  Saved Week {games_data.get('week')} to {self.store.week_dir(games_data.get('week'))}")
+    
     def format_row_data(self, game, all_picks, week_start_date):
         """Format a single game row for the Google Sheet"""
         game_id = game.get('id', '')
         
-        # Extract picks for each player
-        jeff_picks = all_picks.get('jeff', {}).get(game_id, {})
-        teddy_picks = all_picks.get('teddy', {}).get(game_id, {})
-        will_picks = all_picks.get('will', {}).get(game_id, {})
-        
-        # Format the row according to your sheet structure
+        # Game columns, then spread and O/U picks for each player in roster order
         row = [
             game.get('week', ''),                    # Week
             week_start_date,                         # Week Start Date
@@ -132,43 +224,101 @@ class NFLSheetsSync:
             game.get('away_odds', ''),               # Away Spread
             game.get('home_odds', ''),               # Home Spread
             game.get('over_under', ''),              # Over/Under
-            jeff_picks.get('spread', ''),            # Jeff Spread Pick
-            jeff_picks.get('total', ''),             # Jeff O/U Pick
-            teddy_picks.get('spread', ''),           # Teddy Spread Pick
-            teddy_picks.get('total', ''),            # Teddy O/U Pick
-            will_picks.get('spread', ''),            # Will Spread Pick
-            will_picks.get('total', ''),             # Will O/U Pick
-            '',                                      # Away Score (empty for now)
-            '',                                      # Home Score (empty for now)
-            '',                                      # Jeff Spread Points (calculated later)
-            '',                                      # Jeff O/U Points (calculated later)
-            '',                                      # Teddy Spread Points (calculated later)
-            '',                                      # Teddy O/U Points (calculated later)
-            '',                                      # Will Spread Points (calculated later)
-            '',                                      # Will O/U Points (calculated later)
-            'Scheduled'                              # Game Status
         ]
+        for player in self.players:
+            player_picks = all_picks.get(player, {}).get(game_id, {})
+            row.extend(player_picks.get(pick_type, '') for pick_type, _ in PICK_TYPES)
+        
+        # Away/Home Score and every player's points are filled in by score-games.py
+        row.extend([''] * (2 + len(PICK_TYPES) * len(self.players)))
+        row.append('Scheduled')                      # Game Status
         
         return row
     
+    def build_row_index(self, rows):
+        """
+        Map game id -> sheet row number from (row number, row) pairs holding
+        at least the Week..Home Team columns.
+        Game ids are built the same way scrape.py builds them: away_home_date.
+        """
+        row_index = {}
+        for row_number, row in rows:
+            if len(row) < 5 or not row[0]:
+                continue
+            game_date, away_team, home_team = row[2], row[3], row[4]
+            row_index[f"{away_team}_{home_team}_{game_date}"] = row_number
+        return row_index
+    
+    def read_week_rows(self, worksheet, week_index, week):
+        """{row number: row} for a week's rows, read in one call from its indexed span"""
+        span = week_index.span(week)
+        if not span:
+            return {}
+        first_row, last_row = span
+        stored = worksheet.get(f'A{first_row}:{column_letter(self.sync_columns - 1)}{last_row}')
+        return {
+            first_row + offset: row
+            for offset, row in enumerate(stored)
+            if row and str(row[0]) == str(week)
+        }
+    
+    def diff_existing_rows(self, worksheet, existing_games, stored_rows=None):
+        """
+        Compare formatted rows against what's stored in the sheet and return
+        batch_update entries for the sync-owned cells that changed.
+        stored_rows ({row number: row}) skips the read when the rows are already in hand.
+        """
+        if not existing_games:
+            return []
+        
+        if stored_rows is not None:
+            return [
+                cell
+                for row_number, row in existing_games
+                for cell in changed_cells(stored_rows.get(row_number, []), row_number,
+                                          list(enumerate(row[:self.sync_columns])))
+            ]
+        
+        # Read only the span of rows this week occupies, in one call
+        first_row = min(row_number for row_number, _ in existing_games)
+        last_row = max(row_number for row_number, _ in existing_games)
+        last_col = column_letter(self.sync_columns - 1)
+        stored = worksheet.get(f'A{first_row}:{last_col}{last_row}')
+        
+        cell_updates = []
+        for row_number, row in existing_games:
+            offset = row_number - first_row
+            stored_row = stored[offset] if offset < len(stored) else []
+            cell_updates.extend(changed_cells(
+                stored_row, row_number, list(enumerate(row[:self.sync_columns]))
+            ))
+        return cell_updates
+    
     def sync_to_sheet(self):
         """Main sync function"""
-        print("🏈 NFL Picks Sync to Google Sheets Starting...")
+        self.log("🏈 NFL Picks Sync to Google Sheets Starting...")
         
-        # Load games and picks data
-        games_data = self.load_games_data()
+        # Load games and picks data in one concurrent fetch
+        files = self.load_source_files()
+        games_data = self.load_games_data(files)
         if not games_data:
             return
-            
-        all_picks = self.load_all_picks()
+        
+        # Mock games (no games.json yet) are never locked or archived
+        real_week = bool((files.get('games.json') or {}).get('games'))
+        if real_week:
+            self.enforce_pick_locks(games_data, files)
+        all_picks = self.load_all_picks(files)
+        if real_week and not self.sheets.dry_run:
+            self.archive_week(games_data, files)
         
         # Open the Google Sheet
         try:
             sheet = self.gc.open_by_key(self.sheet_id)
             worksheet = sheet.worksheet('Season Data')
-            print(f"✅ Connected to Google Sheet: {sheet.title}")
+            self.log(f"✅ Connected to Google Sheet: {sheet.title}")
         except Exception as e:
-            print(f"❌ Error opening Google Sheet: {e}")
+            self.log(f"❌ Error opening Google Sheet: {e}")
             return
         
         # Prepare data for the sheet
@@ -177,58 +327,127 @@ class NFLSheetsSync:
         current_week = games_data.get('week', 1)
         
         if not games:
-            print("⚠️  No games found in games.json")
+            self.log("⚠️  No games found in games.json")
             return
         
-        print(f"📅 Processing Week {current_week} with {len(games)} games")
+        self.log(f"📅 Processing Week {current_week} with {len(games)} games")
         
-        # Check if this week's data already exists
+        # With a week index, read only this week's rows; otherwise (or if the
+        # index misses any of the week's games) map game ids from one read of
+        # the Week..Home Team columns for the whole season
         try:
-            all_values = worksheet.get_all_values()
-            existing_weeks = set()
-            
-            for row in all_values[1:]:  # Skip header row
-                if row and row[0]:  # If week column has value
-                    existing_weeks.add(int(row[0]) if row[0].isdigit() else 0)
-            
-            if current_week in existing_weeks:
-                print(f"⚠️  Week {current_week} data already exists. Updating...")
-                # For now, we'll append. In a full implementation, you might want to update existing rows
+            week_index = WeekIndex.load(sheet)
+            stored_rows = row_index = None
+            if week_index:
+                stored_rows = self.read_week_rows(worksheet, week_index, current_week)
+                row_index = self.build_row_index(stored_rows.items())
+                if not all(game.get('id', '') in row_index for game in games):
+                    self.log(f"⚠️  Week index doesn't cover every Week {current_week} game, reading every row to re-index")
+                    stored_rows = row_index = None
+            else:
+                self.log("ℹ️  No week index yet, reading every row (run once with --build-index to fix)")
+            if row_index is None:
+                all_rows = list(enumerate(worksheet.get('A2:E'), start=2))
+                row_index = self.build_row_index(all_rows)
+                if week_index:
+                    week_index.reindex(all_rows)
         except Exception as e:
-            print(f"⚠️  Could not check existing data: {e}")
+            self.log(f"❌ Could not read existing rows: {e}")
+            return
         
-        # Format all game rows
-        rows_to_add = []
+        # Split this week's games into rows already in the sheet and new ones
+        existing_games = []
+        new_rows = []
         for game in games:
             row = self.format_row_data(game, all_picks, week_start_date)
-            rows_to_add.append(row)
+            row_number = row_index.get(game.get('id', ''))
+            if row_number:
+                existing_games.append((row_number, row))
+            else:
+                new_rows.append(row)
         
-        # Add rows to sheet
         try:
-            if rows_to_add:
-                worksheet.append_rows(rows_to_add)
-                print(f"✅ Added {len(rows_to_add)} games to Google Sheet")
-                
-                # Log pick summary
-                for player in ['jeff', 'teddy', 'will']:
-                    picks_count = sum(1 for game in games if all_picks.get(player, {}).get(game.get('id', ''), {}))
-                    print(f"   📊 {player.title()}: {picks_count}/{len(games)} games picked")
-                
-            else:
-                print("⚠️  No data to add to sheet")
-                
+            cell_updates = self.diff_existing_rows(worksheet, existing_games, stored_rows)
+            if cell_updates:
+                worksheet.batch_update(cell_updates)
+            
+            if new_rows:
+                appended = appended_rows(worksheet.append_rows(new_rows))
+                if week_index and appended:
+                    week_index.extend(current_week, *appended)
+                elif week_index and not self.sheets.dry_run:
+                    self.log("⚠️  Couldn't tell where new rows landed; the next run will re-index the week")
+            if week_index:
+                week_index.save()
         except Exception as e:
-            print(f"❌ Error adding data to sheet: {e}")
+            self.log(f"❌ Error writing data to sheet: {e}")
             return
         
-        print("🎉 Sync completed successfully!")
+        if self.sheets.dry_run:
+            self.log(self.sheets.plan_summary())
+        else:
+            self.log(f"✅ Updated {len(cell_updates)} cells across {len(existing_games)} existing games")
+            self.log(f"✅ Added {len(new_rows)} new games to Google Sheet")
+        self.log(f"📡 Google Sheets API calls this run: {self.sheets.count}")
+        
+        # Log pick summary
+        for player in self.players:
+            picks_count = sum(1 for game in games if all_picks.get(player, {}).get(game.get('id', ''), {}))
+            self.log(f"   📊 {player.title()}: {picks_count}/{len(games)} games picked")
+        
+        self.log("🎉 Sync completed successfully!")
+    
+    def build_week_index(self):
+        """One-time migration: index the existing 'Season Data' rows by week"""
+        sheet = self.gc.open_by_key(self.sheet_id)
+        week_index = WeekIndex.build(sheet, sheet.worksheet('Season Data'))
+        for week, (first_row, last_row) in week_index.spans.items():
+            self.log(f"   Week {week}: rows {first_row}-{last_row}")
+        self.log(f"✅ Indexed {len(week_index.spans)} weeks on the hidden '{week_index.worksheet.title}' tab")
 
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Sync games and picks to Google Sheet')
+    parser.add_argument('--source', choices=['github', 'local'], default=os.getenv('NFL_PICKS_SOURCE', 'github'),
+                        help='Read games and picks from the GitHub API or from this checkout (default: github)')
+    parser.add_argument('--pull', action='store_true',
+                        help='With --source local, run git pull before reading files')
+    parser.add_argument('--tree', action='store_true',
+                        help='Fetch files with one Git trees call instead of one contents call per file')
+    parser.add_argument('--build-index', action='store_true',
+                        help="One-time migration: build the hidden week index so runs read only the target week's rows")
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Read the sheet and print the cells that would change, without writing them')
+    parser.add_argument('--league', action='append',
+                        help='Sync only this league from leagues.json (repeatable; default: every league)')
+    parser.add_argument('--parallel', type=int,
+                        help="Leagues to sync at once (default: leagues.json's max_parallel)")
+    args = parser.parse_args()
+    
     try:
-        syncer = NFLSheetsSync()
-        syncer.sync_to_sheet()
-    except Exception as e:
-        print(f"❌ Sync failed: {e}")
+        leagues, max_parallel = load_leagues()
+        leagues = select_leagues(leagues, args.league)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    shared = SharedServices() if len(leagues) > 1 else None
+    pull = args.pull and args.source == 'local'
+    if pull and shared:
+        LocalFetcher(pull=True)  # Once for every league
+    
+    def sync_league(league, out):
+        try:
+            syncer = NFLSheetsSync(source=args.source, use_tree=args.tree, pull=pull and not shared,
+                                   dry_run=args.dry_run, league=league, shared=shared, out=out)
+            if args.build_index:
+                syncer.build_week_index()
+            else:
+                syncer.sync_to_sheet()
+        except Exception as e:
+            print(f"❌ Sync failed: {e}", file=out)
+    
+    run_leagues(leagues, sync_league, args.parallel or max_parallel)
+    default_report.flush('sync')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
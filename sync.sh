@@ -15,9 +15,9 @@ source $ENV_NAME/bin/activate
 
 echo "Virtual environment $ENV_NAME activated."
 
-# Run the sync to Google Sheets script
+# Run the sync to Google Sheets script with any passed arguments
 echo "🏈 Syncing picks to Google Sheets..."
-python3 sync-to-sheets.py
+python3 sync-to-sheets.py "$@"
 
 # Deactivate the environment
 deactivate
\ No newline at end of file
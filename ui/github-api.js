@@ -5,6 +5,24 @@ class GitHubAPI {
         this.token = null;
         
         this.baseURL = 'https://api.github.com';
+        this.branch = null;
+        
+        // Last-known blob SHA per path, so saves don't need a GET first
+        this.shaCache = {};
+        this.maxRetries = 4;
+        this.retryDelayMs = 250;
+
+        // Session-scoped file cache revalidated with ETags, plus in-flight
+        // request sharing so simultaneous loads of the same file cost one request
+        this.cachePrefix = 'gh_cache:';
+        this.inFlight = {};
+
+        // Prebuilt static bundle (ui/data) is the first choice for reads;
+        // paths written this session are read from the API instead
+        this.bundleURL = 'data/bundle.json';
+        this.bundle = null;
+        this.writtenPaths = new Set();
+        this.locks = null;
         
         // Initialize configuration
         this.initConfig();
@@ -71,32 +89,129 @@ class GitHubAPI {
         });
 
         if (!response.ok) {
-            const error = await response.json().catch(() => ({ message: 'Unknown error' }));
-            throw new Error(`GitHub API Error: ${error.message}`);
+            const body = await response.json().catch(() => ({ message: 'Unknown error' }));
+            const error = new Error(`GitHub API Error: ${body.message}`);
+            error.status = response.status;
+            throw error;
         }
 
         return response.json();
     }
 
+    // SHA conflicts from concurrent saves come back as 409 or 422
+    isConflict(error) {
+        return error.status === 409 || error.status === 422;
+    }
+
+    async withConflictRetry(operation) {
+        for (let attempt = 0; ; attempt++) {
+            try {
+                return await operation(attempt);
+            } catch (error) {
+                if (!this.isConflict(error) || attempt >= this.maxRetries) {
+                    throw error;
+                }
+                const delay = this.retryDelayMs * 2 ** attempt * (1 + Math.random() / 2);
+                console.log(`⚠️ Save conflict, retrying in ${Math.round(delay)}ms...`);
+                await new Promise(resolve => setTimeout(resolve, delay));
+            }
+        }
+    }
+
+    readCache(path) {
+        try {
+            const cached = sessionStorage.getItem(this.cachePrefix + path);
+            return cached ? JSON.parse(cached) : null;
+        } catch (error) {
+            return null;
+        }
+    }
+
+    writeCache(path, etag, data) {
+        try {
+            sessionStorage.setItem(this.cachePrefix + path, JSON.stringify({ etag: etag, data: data }));
+        } catch (error) {
+            // Storage full or unavailable; the request still worked
+        }
+    }
+
+    // Invalidation hook: call after anything that changes a file in the repo
+    invalidate(path) {
+        this.writtenPaths.add(path);
+        delete this.inFlight[path];
+        try {
+            sessionStorage.removeItem(this.cachePrefix + path);
+        } catch (error) {
+            // Nothing cached
+        }
+    }
+
+    // GET a contents endpoint with If-None-Match; a 304 reuses the cached body
+    async getContents(path) {
+        if (!this.inFlight[path]) {
+            const request = (async () => {
+                const cached = this.readCache(path);
+                const headers = cached && cached.etag ? { 'If-None-Match': cached.etag } : {};
+                const response = await fetch(`${this.baseURL}/repos/${this.owner}/${this.repo}/contents/${path}`, {
+                    headers: {
+                        'Authorization': `token ${this.token}`,
+                        'Accept': 'application/vnd.github.v3+json',
+                        ...headers
+                    }
+                });
+
+                if (response.status === 304 && cached) {
+                    return cached.data;
+                }
+                if (!response.ok) {
+                    const body = await response.json().catch(() => ({ message: 'Unknown error' }));
+                    const error = new Error(`GitHub API Error: ${body.message}`);
+                    error.status = response.status;
+                    throw error;
+                }
+
+                const data = await response.json();
+                this.writeCache(path, response.headers.get('ETag'), data);
+                return data;
+            })().finally(() => {
+                if (this.inFlight[path] === request) {
+                    delete this.inFlight[path];
+                }
+            });
+            this.inFlight[path] = request;
+        }
+        return this.inFlight[path];
+    }
+
     async getFile(path) {
         try {
-            const endpoint = `/repos/${this.owner}/${this.repo}/contents/${path}`;
-            const data = await this.makeRequest(endpoint);
+            const data = await this.getContents(path);
             
             // Decode base64 content
             const content = atob(data.content);
+            this.shaCache[path] = data.sha;
             return {
                 content: JSON.parse(content),
                 sha: data.sha // Needed for updates
             };
         } catch (error) {
-            if (error.message.includes('404')) {
+            if (error.status === 404 || error.message.includes('404')) {
+                delete this.shaCache[path];
                 return null; // File doesn't exist
             }
             throw error;
         }
     }
 
+    async refreshSha(path) {
+        try {
+            const existing = await this.getFile(path);
+            return existing ? existing.sha : null;
+        } catch (error) {
+            return null;
+        }
+    }
+
     async saveFile(path, content, message = 'Update file', sha = null) {
         const endpoint = `/repos/${this.owner}/${this.repo}/contents/${path}`;
         
@@ -115,42 +230,202 @@ class GitHubAPI {
         });
     }
 
+    // Pages served from this machine, where Netlify functions usually aren't running
+    isLocalDev() {
+        return window.location.protocol === 'file:' || ['localhost', '127.0.0.1'].includes(window.location.hostname);
+    }
+
+    // Save through the save-picks function, which rejects picks for games that
+    // have kicked off. Only local development falls back to a direct GitHub
+    // save when the function isn't there: the direct save skips the lock
+    // check, so anywhere else a failed call is reported instead.
     async savePicks(player, week, picks) {
         const filePath = `picks/${player}.json`;
+        const localDev = this.isLocalDev();
+        let response = null;
+        try {
+            response = await fetch('/.netlify/functions/save-picks', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ player, week, picks })
+            });
+        } catch (error) {
+            if (!localDev) {
+                throw new Error(`Failed to save picks: ${error.message}`);
+            }
+            console.log('save-picks function not available, saving directly to GitHub');
+        }
+
+        if (response && (response.status !== 404 || !localDev)) {
+            const result = await response.json().catch(() => ({}));
+            if (!response.ok) {
+                throw new Error(`Failed to save picks: ${result.error || response.statusText}`);
+            }
+            this.shaCache[filePath] = result.sha;
+            this.invalidate(filePath);
+            return { success: true, result: result, picks: result.picks, rejected: result.rejected || [] };
+        }
+
+        return await this.savePicksDirect(player, week, picks);
+    }
+
+    // Stamp picks made in this save with picked_at; picks loaded from the
+    // file keep theirs (the picker drops picked_at when a pick changes)
+    stampPicks(picks, savedAt) {
+        const stamped = {};
+        Object.entries(picks).forEach(([gameId, pick]) => {
+            stamped[gameId] = { ...pick, picked_at: pick.picked_at || savedAt };
+        });
+        return stamped;
+    }
+
+    async savePicksDirect(player, week, picks) {
+        const filePath = `picks/${player}.json`;
+        const savedAt = new Date().toISOString();
+        picks = this.stampPicks(picks, savedAt);
         const picksData = {
             player: player,
             week: week,
             picks: picks,
-            saved_at: new Date().toISOString()
+            saved_at: savedAt
         };
 
         try {
-            // Always try to get existing file first to get SHA
-            let sha = null;
-            try {
-                const existing = await this.getFile(filePath);
-                sha = existing ? existing.sha : null;
-            } catch (error) {
-                // File doesn't exist yet, that's fine
-                console.log('File does not exist yet, creating new file');
-            }
+            // Use the SHA from the last load/save; only fetch it when unknown
+            // or after a conflict says it's stale
+            const result = await this.withConflictRetry(async (attempt) => {
+                let sha = this.shaCache[filePath];
+                if (sha === undefined || attempt > 0) {
+                    sha = await this.refreshSha(filePath);
+                }
+                return await this.saveFile(
+                    filePath, 
+                    picksData, 
+                    `Update ${player}'s picks for Week ${week}`,
+                    sha
+                );
+            });
+            this.shaCache[filePath] = result.content.sha;
+            this.invalidate(filePath);
             
-            const result = await this.saveFile(
-                filePath, 
-                picksData, 
-                `Update ${player}'s picks for Week ${week}`,
-                sha
+            return { success: true, result: result, picks: picks, rejected: [] };
+        } catch (error) {
+            throw new Error(`Failed to save picks: ${error.message}`);
+        }
+    }
+
+    async getDefaultBranch() {
+        if (!this.branch) {
+            const repo = await this.makeRequest(`/repos/${this.owner}/${this.repo}`);
+            this.branch = repo.default_branch;
+        }
+        return this.branch;
+    }
+
+    // Commit several files in one tree/commit through the Git Data API.
+    // files: { path: jsonContent }. Retries if the branch moved underneath us.
+    async commitFiles(files, message) {
+        const repoPath = `/repos/${this.owner}/${this.repo}`;
+        const branch = await this.getDefaultBranch();
+
+        const result = await this.withConflictRetry(async () => {
+            const ref = await this.makeRequest(`${repoPath}/git/ref/heads/${branch}`);
+            const parent = await this.makeRequest(`${repoPath}/git/commits/${ref.object.sha}`);
+
+            const tree = await this.makeRequest(`${repoPath}/git/trees`, {
+                method: 'POST',
+                body: JSON.stringify({
+                    base_tree: parent.tree.sha,
+                    tree: Object.entries(files).map(([path, content]) => ({
+                        path: path,
+                        mode: '100644',
+                        type: 'blob',
+                        content: JSON.stringify(content, null, 2)
+                    }))
+                })
+            });
+
+            const commit = await this.makeRequest(`${repoPath}/git/commits`, {
+                method: 'POST',
+                body: JSON.stringify({ message: message, tree: tree.sha, parents: [ref.object.sha] })
+            });
+
+            // Non-forced update: a concurrent commit makes this fail with 422 and we retry
+            return await this.makeRequest(`${repoPath}/git/refs/heads/${branch}`, {
+                method: 'PATCH',
+                body: JSON.stringify({ sha: commit.sha })
+            });
+        });
+
+        // Blob SHAs changed; the next single-file save will look them up again
+        Object.keys(files).forEach(path => {
+            delete this.shaCache[path];
+            this.invalidate(path);
+        });
+        return result;
+    }
+
+    // Admin bulk save: picksByPlayer is { player: picks }
+    async savePicksBulk(week, picksByPlayer) {
+        const savedAt = new Date().toISOString();
+        const files = {};
+        Object.entries(picksByPlayer).forEach(([player, picks]) => {
+            files[`picks/${player}.json`] = {
+                player: player, week: week, picks: this.stampPicks(picks, savedAt), saved_at: savedAt
+            };
+        });
+
+        try {
+            const result = await this.commitFiles(
+                files,
+                `Update picks for ${Object.keys(picksByPlayer).join(', ')} for Week ${week}`
             );
-            
             return { success: true, result: result };
         } catch (error) {
             throw new Error(`Failed to save picks: ${error.message}`);
         }
     }
 
+    // Kickoff lock index ({ gameId: epoch seconds }) from the site build; {} if not deployed
+    async loadLocks() {
+        if (!this.locks) {
+            this.locks = fetch('data/locks.json', { cache: 'no-cache' })
+                .then(response => response.ok ? response.json() : {})
+                .then(data => data.locks || {})
+                .catch(() => ({}));
+        }
+        return this.locks;
+    }
+
+    // Load the content-hashed site bundle via its manifest; null if not deployed
+    async loadBundle() {
+        if (!this.bundle) {
+            this.bundle = (async () => {
+                try {
+                    const manifest = await fetch(this.bundleURL, { cache: 'no-cache' });
+                    if (!manifest.ok) {
+                        return null;
+                    }
+                    const { bundle } = await manifest.json();
+                    const response = await fetch(`data/${bundle}`);
+                    return response.ok ? await response.json() : null;
+                } catch (error) {
+                    console.log('Site bundle not available, using GitHub API');
+                    return null;
+                }
+            })();
+        }
+        return this.bundle;
+    }
+
     async loadPicks(player, week) {
         try {
             const filePath = `picks/${player}.json`;
+            const bundle = this.writtenPaths.has(filePath) ? null : await this.loadBundle();
+            if (bundle && bundle.week === week) {
+                return bundle.picks[player] || null;
+            }
+
             const data = await this.getFile(filePath);
             
             if (!data) {
@@ -168,26 +443,34 @@ class GitHubAPI {
         }
     }
 
-    async getAllPicks(week) {
-        const players = ['jeff', 'teddy', 'will']; // Could also read from config
+    async getAllPicks(week, players) {
+        // Roster comes from games.json "players", which scrape.py copies from config.json
         const allPicks = {};
 
-        for (const player of players) {
-            try {
-                const picks = await this.loadPicks(player, week);
-                if (picks) {
-                    allPicks[player] = picks;
-                }
-            } catch (error) {
+        // Load every player in parallel so the roster costs one round trip
+        const results = await Promise.all(players.map(player =>
+            this.loadPicks(player, week).catch(error => {
                 console.warn(`Could not load picks for ${player}:`, error.message);
+                return null;
+            })
+        ));
+
+        players.forEach((player, i) => {
+            if (results[i]) {
+                allPicks[player] = results[i];
             }
-        }
+        });
 
         return allPicks;
     }
 
     async loadGames() {
         try {
+            const bundle = await this.loadBundle();
+            if (bundle) {
+                return bundle;
+            }
+
             const data = await this.getFile('games.json');
             return data ? data.content : null;
         } catch (error) {
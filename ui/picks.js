@@ -4,6 +4,7 @@ class NFLPicks {
         this.players = [];
         this.currentPlayer = '';
         this.picks = {};
+        this.locks = {};
         this.github = new GitHubAPI();
         
         this.init();
@@ -15,6 +16,7 @@ class NFLPicks {
             await this.github.initConfig();
             
             await this.loadGames();
+            this.locks = await this.github.loadLocks();
             this.setupEventListeners();
             this.renderPlayerSelect();
             this.renderGames();
@@ -25,18 +27,19 @@ class NFLPicks {
 
     async loadGames() {
         try {
-            // Try to load from GitHub first (if available)
-            if (this.github.isReady()) {
+            // Try the prebuilt site bundle, then GitHub (if available)
+            if (await this.github.loadBundle() || this.github.isReady()) {
                 const data = await this.github.loadGames();
                 if (data) {
                     this.games = data.games || [];
                     this.players = data.players || [];
                     this.currentWeek = data.week || 1;
                     this.weekStart = data.week_start || '';
+                    this.weekLabel = data.week_label || `Week ${this.currentWeek}`;
                     
                     // Update week display
                     document.getElementById('week-display').textContent = 
-                        `Week ${this.currentWeek} - ${new Date(this.weekStart).toLocaleDateString()}`;
+                        `${this.weekLabel} - ${new Date(this.weekStart).toLocaleDateString()}`;
                     return;
                 }
             }
@@ -52,10 +55,11 @@ class NFLPicks {
             this.players = data.players || [];
             this.currentWeek = data.week || 1;
             this.weekStart = data.week_start || '';
+            this.weekLabel = data.week_label || `Week ${this.currentWeek}`;
             
             // Update week display
             document.getElementById('week-display').textContent = 
-                `Week ${this.currentWeek} - ${new Date(this.weekStart).toLocaleDateString()}`;
+                `${this.weekLabel} - ${new Date(this.weekStart).toLocaleDateString()}`;
                 
         } catch (error) {
             // For local testing, show mock data
@@ -156,7 +160,14 @@ class NFLPicks {
         this.attachPickListeners();
     }
 
+    // Games lock at kickoff (lock index from the site build; the server enforces it too)
+    isLocked(gameId) {
+        const kickoff = this.locks[gameId];
+        return kickoff !== undefined && Date.now() / 1000 >= kickoff;
+    }
+
     renderGameCard(game) {
+        const locked = this.isLocked(game.id);
         const gameDate = new Date(game.game_date);
         const formattedDate = gameDate.toLocaleDateString('en-US', {
             weekday: 'short',
@@ -167,10 +178,10 @@ class NFLPicks {
         });
 
         return `
-            <div class="game-card" data-game-id="${game.id}">
+            <div class="game-card${locked ? ' locked' : ''}" data-game-id="${game.id}">
                 <div class="game-header">
                     <div class="teams">${game.away_team} @ ${game.home_team}</div>
-                    <div class="game-date">${formattedDate}</div>
+                    <div class="game-date">${formattedDate}${locked ? ' · 🔒 Locked' : ''}</div>
                 </div>
                 
                 <div class="picks-section">
@@ -216,6 +227,10 @@ class NFLPicks {
 
                 const gameCard = e.target.closest('.game-card');
                 const gameId = gameCard.dataset.gameId;
+                if (this.isLocked(gameId)) {
+                    this.showMessage('This game has already started - picks are locked', 'error');
+                    return;
+                }
                 const pickType = e.target.dataset.pickType;
                 const pickValue = e.target.dataset.pickValue;
 
@@ -233,6 +248,8 @@ class NFLPicks {
                     this.picks[gameId] = {};
                 }
                 this.picks[gameId][pickType] = pickValue;
+                // A changed pick is stamped with the time of the next save
+                delete this.picks[gameId].picked_at;
 
                 this.showMessage('Pick updated! Don\'t forget to save.', 'info');
             });
@@ -256,8 +273,16 @@ class NFLPicks {
             
             if (this.github.token) {
                 // Save to GitHub
-                await this.github.savePicks(this.currentPlayer, this.currentWeek, this.picks);
-                this.showMessage('Picks saved to GitHub! ✅', 'success');
+                const result = await this.github.savePicks(this.currentPlayer, this.currentWeek, this.picks);
+                // Keep what was saved, picked_at stamps included
+                this.picks = result.picks;
+                if (result.rejected.length) {
+                    // Show what was actually saved: started games keep their earlier picks
+                    this.applyPicksToUI();
+                    this.showMessage(`Picks saved ✅ (${result.rejected.length} ignored - those games already started)`, 'info');
+                } else {
+                    this.showMessage('Picks saved to GitHub! ✅', 'success');
+                }
             } else {
                 // Fallback to localStorage for local testing
                 const picksData = {